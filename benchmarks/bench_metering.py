@@ -0,0 +1,112 @@
+"""Time the metering hot path: one VU tick, and painting one meter frame.
+
+Run with ``python benchmarks/bench_metering.py``. The tick runs the worker's
+level poll against a ``SimulatedVM`` producing noise, then the panel's
+``_update_vu_meters`` (meter ballistics and invalidation), for a Potato
+panel showing its default page and all eight buses, over ``FRAMES``
+frames. ``paintEvent`` is timed on its own for a two-channel meter at
+each of ``SIZES``, repainting only the region the new levels
+invalidated, as the event loop would.
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+from widgets import simulator
+from widgets.combined_panel import CombinedControlPanel
+from widgets.simulator import SimulatedVM
+from widgets.topology import Topology
+from widgets.vm_worker import VMWorker
+from widgets.vu_meter import VUMeter
+
+FRAMES = 300
+SIZES = [(20, 150), (20, 300), (40, 300), (80, 600)]
+
+
+class TimedVUMeter(VUMeter):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.paint_times = []
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.paint_times.append((time.perf_counter() - start) * 1000)
+
+
+def run_tick():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    vm = SimulatedVM(generator=simulator.noise(-40.0, 6.0))
+    topology = Topology("potato", buses=range(8))
+    worker = VMWorker(vm, strips=topology.strips, buses=topology.buses)
+    panel = CombinedControlPanel(worker, topology=topology)
+    volume = panel.volume_panel
+    volume.scheduler.set_visible(True)
+
+    ticks, gui = [], []
+    # Frames a little over one interval apart, so every tick polls levels
+    step = worker._interval + 0.001
+    now = time.monotonic()
+    for frame in range(FRAMES):
+        busy = volume.scheduler.busy_time
+        start = time.perf_counter()
+        worker.tick(now + frame * step)
+        ticks.append((time.perf_counter() - start) * 1000)
+        gui.append((volume.scheduler.busy_time - busy) * 1000)
+    app.processEvents()
+    panel.deleteLater()
+    ticks.sort()
+    return {
+        "meters": len(volume._page_meters) + len(volume._shared_meters),
+        "tick_mean_ms": statistics.mean(ticks),
+        "tick_p99_ms": ticks[int(len(ticks) * 0.99)],
+        "gui_mean_ms": statistics.mean(gui),
+        "level_calls_per_tick": vm.calls["get_level"] / FRAMES,
+    }
+
+
+def run_paint(width, height, channels=2):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    meter = TimedVUMeter(channels=channels)
+    meter.setFixedSize(width, height)
+    meter.show()
+    app.processEvents()
+    meter.paint_times.clear()
+    levels = simulator.noise(-60.0, 12.0)
+    for frame in range(FRAMES):
+        meter.update_levels([levels(0, c, frame) for c in range(channels)])
+        app.processEvents()
+    times = sorted(meter.paint_times)
+    meter.deleteLater()
+    app.processEvents()
+    return {
+        "paint_mean_ms": statistics.mean(times) if times else 0.0,
+        "paint_p99_ms": times[int(len(times) * 0.99)] if times else 0.0,
+        "paints": len(times),
+    }
+
+
+def run():
+    results = {"tick": run_tick()}
+    for width, height in SIZES:
+        results[f"paint_{width}x{height}"] = run_paint(width, height)
+    return results
+
+
+if __name__ == "__main__":
+    result = run()
+    tick = result.pop("tick")
+    print(f"VU tick over {FRAMES} frames, {tick['meters']} meters")
+    print(f"  tick mean:            {tick['tick_mean_ms']:.3f} ms")
+    print(f"  tick p99:             {tick['tick_p99_ms']:.3f} ms")
+    print(f"  _update_vu_meters:    {tick['gui_mean_ms']:.3f} ms")
+    print(f"  get_level per tick:   {tick['level_calls_per_tick']:.0f}")
+    print("VUMeter.paintEvent, 2 channels")
+    for name, paint in result.items():
+        print(f"  {name[6:]:<10} mean {paint['paint_mean_ms']:.3f} ms  "
+              f"p99 {paint['paint_p99_ms']:.3f} ms  ({paint['paints']} paints)")
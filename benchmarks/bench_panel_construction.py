@@ -0,0 +1,58 @@
+"""Time building (and first rendering) the control panel.
+
+Run with ``python benchmarks/bench_panel_construction.py``. Each round builds
+a fresh ``CombinedControlPanel`` and then renders it offscreen with
+``grab()``. Rendering forces style sheets to be polished and the layout to
+run, which is the work a user waits for on the first click. Reports the
+median of ``ROUNDS``, for the original three strips and for the whole
+Potato topology (8 strips, 8 outputs), which should cost about the same.
+"""
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+from widgets.combined_panel import CombinedControlPanel
+from widgets.topology import Topology, default_topology
+from widgets.vm_worker import VMWorker
+
+ROUNDS = 30
+
+
+class IdleVM:
+    def get_level(self, type_, index):
+        return 0.0
+
+
+def run(topology=None):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    topology = topology if topology is not None else default_topology()
+    worker = VMWorker(IdleVM(), strips=topology.strips)
+    build, first_paint = [], []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        panel = CombinedControlPanel(worker, topology=topology)
+        built = time.perf_counter()
+        panel.grab()
+        painted = time.perf_counter()
+        build.append((built - start) * 1000)
+        first_paint.append((painted - start) * 1000)
+        panel.deleteLater()
+        app.processEvents()
+    return {
+        "build_ms": statistics.median(build),
+        "build_and_paint_ms": statistics.median(first_paint),
+    }
+
+
+if __name__ == "__main__":
+    print(f"Control panel, median of {ROUNDS} rounds")
+    for name, topology in [("3 strips", default_topology()), ("potato", Topology("potato"))]:
+        result = run(topology)
+        print(f"  {name}:")
+        print(f"    construct:          {result['build_ms']:.2f} ms")
+        print(f"    construct + paint:  {result['build_and_paint_ms']:.2f} ms")
@@ -0,0 +1,82 @@
+"""Parse and validate thousands of presets in each on-disk format.
+
+Run with ``python benchmarks/bench_preset_format.py``. ``PRESETS`` random
+presets are serialised in memory three ways:
+
+- ``v1_json``: the old format. It only covers the three ``STRIP_INDICES``
+  strips, and the old read path does not validate it.
+- ``json``: the current JSON format, covering every potato strip and bus.
+- ``binary``: the current binary format, with the same coverage.
+
+Each set is then parsed back into ``{key: value}`` dicts. Current-format
+input is fully validated against the schema.
+"""
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets import preset_format
+from widgets.constants import STRIP_INDICES, ROUTING_OUTPUTS
+
+PRESETS = 5000
+KIND = "potato"
+
+
+def random_params(rng, keys):
+    return {key: (float(rng.randint(-60, 12)) if key.endswith("gain") else rng.random() < 0.5)
+            for key in keys}
+
+
+def v1_document(params):
+    """What ``PresetManager.save_preset`` used to write."""
+    data = {}
+    for idx in STRIP_INDICES:
+        data[str(idx)] = {
+            "gain": params[f"strip[{idx}].gain"],
+            "mute": params[f"strip[{idx}].mute"],
+            "routing": {out: params[f"strip[{idx}].{out}"] for out in ROUTING_OUTPUTS},
+        }
+    return json.dumps(data).encode()
+
+
+def v1_read(data):
+    """What ``PresetManager.read_preset`` used to do."""
+    return preset_format.decode_v1(json.loads(data))
+
+
+def measure(blobs, parse):
+    start = time.perf_counter()
+    for blob in blobs:
+        parse(blob)
+    return time.perf_counter() - start
+
+
+def run():
+    rng = random.Random(0)
+    keys = preset_format.preset_keys(KIND)
+    presets = [random_params(rng, keys) for _ in range(PRESETS)]
+    formats = {
+        "v1_json": ([v1_document(p) for p in presets], v1_read),
+        "json": ([preset_format.dumps(p, KIND) for p in presets], preset_format.loads),
+        "binary": ([preset_format.dumps(p, KIND, binary=True) for p in presets], preset_format.loads),
+    }
+    results = {}
+    for name, (blobs, parse) in formats.items():
+        seconds = measure(blobs, parse)
+        results[name] = {
+            "total_ms": seconds * 1000,
+            "per_preset_us": seconds / PRESETS * 1e6,
+            "bytes": sum(len(b) for b in blobs) / PRESETS,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    print(f"Parsing {PRESETS} presets")
+    for name, result in run().items():
+        print(f"  {name:<10} {result['total_ms']:8.1f} ms  "
+              f"{result['per_preset_us']:7.1f} us/preset  {result['bytes']:6.0f} bytes")
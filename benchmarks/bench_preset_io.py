@@ -0,0 +1,69 @@
+"""Time ``PresetManager`` saving and loading presets against the engine.
+
+Run with ``python benchmarks/bench_preset_io.py``. A ``SimulatedVM`` with
+random settings is saved ``ROUNDS`` times in each on-disk format, then
+presets are loaded back alternately onto the engine, so every load writes a
+real diff and verifies it. Both paths include the file I/O.
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets import preset_format
+from widgets.params import parse_key
+from widgets.preset_manager import PresetManager
+from widgets.simulator import SimulatedVM
+
+ROUNDS = 200
+SUFFIXES = [".json", preset_format.BINARY_SUFFIX]
+
+
+def randomize(vm, rng):
+    for key in preset_format.preset_keys(vm.kind.name):
+        name = parse_key(key)[2]
+        vm.set_external(key, float(rng.randint(-60, 12)) if name == "gain" else rng.random() < 0.5)
+
+
+def measure(fn, rounds):
+    times = []
+    for i in range(rounds):
+        start = time.perf_counter()
+        fn(i)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(times)
+
+
+def run():
+    rng = random.Random(0)
+    vm = SimulatedVM()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for suffix in SUFFIXES:
+            paths = [os.path.join(directory, f"scene{i}{suffix}") for i in range(2)]
+            for path in paths:
+                randomize(vm, rng)
+                PresetManager.save_preset(vm, path)
+            scratch = os.path.join(directory, f"scratch{suffix}")
+            save_ms = measure(lambda i: PresetManager.save_preset(vm, scratch), ROUNDS)
+            vm.reset_counters()
+            failed = []
+            load_ms = measure(lambda i: failed.append(PresetManager.load_preset(vm, paths[i % 2])), ROUNDS)
+            results[suffix.lstrip(".")] = {
+                "save_mean_ms": save_ms,
+                "load_mean_ms": load_ms,
+                "scripts_per_load": vm.calls["sendtext"] / ROUNDS,
+                "failed_loads": sum(1 for f in failed if f),
+            }
+    return results
+
+
+if __name__ == "__main__":
+    print(f"PresetManager save/load, mean of {ROUNDS} rounds")
+    for name, result in run().items():
+        print(f"  {name:<5} save {result['save_mean_ms']:.3f} ms  load {result['load_mean_ms']:.3f} ms  "
+              f"scripts/load {result['scripts_per_load']:.2f}  failed {result['failed_loads']}")
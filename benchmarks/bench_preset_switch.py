@@ -0,0 +1,87 @@
+"""Time preset switches from an in-memory library of hundreds of presets.
+
+Run with ``python benchmarks/bench_preset_switch.py``. ``PRESETS`` random
+presets are written to a temporary directory and indexed once. Each switch
+is then timed from the tray action to the Voicemeeter call: a library
+lookup, a diff against the state store, and the worker sending one script.
+No disk I/O happens on this path.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+from widgets.constants import STRIP_INDICES
+from widgets.params import strip_keys
+from widgets.preset_library import PresetLibrary
+from widgets.preset_manager import PresetManager
+from widgets.simulator import SimulatedVM
+from widgets.state_store import StateStore
+from widgets.vm_worker import VMWorker
+
+PRESETS = 500
+SWITCHES = 1000
+BUDGET_MS = 3.0
+
+
+def make_presets(directory):
+    rng = random.Random(0)
+    keys = [key for idx in STRIP_INDICES for key in strip_keys(idx)]
+    for i in range(PRESETS):
+        params = {key: (float(rng.randint(-60, 12)) if key.endswith("gain") else rng.random() < 0.5)
+                  for key in keys}
+        PresetManager.write_preset(params, os.path.join(directory, f"scene{i:03d}.json"))
+
+
+def run():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    vm = SimulatedVM()
+    worker = VMWorker(vm)
+    store = StateStore(worker, worker.param_keys)
+    store.refresh()
+    worker.tick()
+    vm.reset_counters()
+
+    with tempfile.TemporaryDirectory() as directory:
+        make_presets(directory)
+        start = time.perf_counter()
+        library = PresetLibrary(directory)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        names = library.names()
+        rng = random.Random(1)
+        times = []
+        for _ in range(SWITCHES):
+            name = rng.choice(names)
+            start = time.perf_counter()
+            changes = store.diff(library.get(name))
+            if changes:
+                store.apply(changes)
+            worker.tick()
+            times.append((time.perf_counter() - start) * 1000)
+        app.processEvents()
+
+    times.sort()
+    return {
+        "presets": len(names),
+        "index_ms": index_ms,
+        "switch_mean_ms": sum(times) / len(times),
+        "switch_p99_ms": times[int(len(times) * 0.99)],
+        "scripts_per_switch": vm.calls["sendtext"] / SWITCHES,
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(f"Library of {result['presets']} presets indexed in {result['index_ms']:.1f} ms")
+    print(f"  switch mean:        {result['switch_mean_ms']:.3f} ms")
+    print(f"  switch p99:         {result['switch_p99_ms']:.3f} ms")
+    print(f"  scripts per switch: {result['scripts_per_switch']:.2f}")
+    ok = result["switch_p99_ms"] < BUDGET_MS
+    print(f"  budget {BUDGET_MS} ms:      {'ok' if ok else 'EXCEEDED'}")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,67 @@
+"""Time a full ``update_controls`` refresh of the control panel.
+
+Run with ``python benchmarks/bench_refresh.py``. Each round changes every
+strip and bus parameter of a ``SimulatedVM``, as loading a scene in
+Voicemeeter would, then times ``update_controls`` through to the widgets:
+the worker's batched read, the store update and the bindings pushing the
+changes into every slider, checkbox and routing button of a Potato panel
+with all pages built.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets
+from widgets.combined_panel import CombinedControlPanel
+from widgets.params import parse_key
+from widgets.simulator import SimulatedVM
+from widgets.state_store import StateStore
+from widgets.topology import Topology
+from widgets.vm_worker import VMWorker
+
+ROUNDS = 100
+
+
+def run():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    vm = SimulatedVM()
+    topology = Topology("potato", buses=range(8))
+    worker = VMWorker(vm, strips=topology.strips, buses=topology.buses)
+    store = StateStore(worker, worker.param_keys)
+    panel = CombinedControlPanel(worker, store, topology=topology)
+    for page in range(len(topology.pages())):
+        panel.show_page(page)
+
+    rng = random.Random(0)
+    times = []
+    vm.reset_counters()
+    for _ in range(ROUNDS):
+        for key in worker.param_keys:
+            name = parse_key(key)[2]
+            vm.set_external(key, float(rng.randint(-60, 12)) if name == "gain" else rng.random() < 0.5)
+        start = time.perf_counter()
+        panel.update_controls()
+        worker.tick()
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1000)
+    panel.deleteLater()
+    times.sort()
+    return {
+        "params": len(worker.param_keys),
+        "refresh_mean_ms": statistics.mean(times),
+        "refresh_p99_ms": times[int(len(times) * 0.99)],
+        "reads_per_refresh": vm.calls["get"] / ROUNDS,
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(f"update_controls over {ROUNDS} rounds, {result['params']} parameters")
+    print(f"  refresh mean:       {result['refresh_mean_ms']:.3f} ms")
+    print(f"  refresh p99:        {result['refresh_p99_ms']:.3f} ms")
+    print(f"  reads per refresh:  {result['reads_per_refresh']:.0f}")
@@ -0,0 +1,85 @@
+"""Count Voicemeeter gain writes caused by one simulated slider drag.
+
+Run with ``python benchmarks/bench_slider_drag.py``. The drag moves a
+volume slider through ``STEPS`` values over ``DURATION_S`` seconds, as a fast
+mouse drag or a burst of wheel notches would. "before" runs the same drag
+through the old path, a ``store.set`` per ``valueChanged`` written straight
+to the engine; "after" is what reaches the engine through the write
+coalescer and worker. Both are counted by the ``SimulatedVM``.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets
+from widgets.combined_panel import CombinedControlPanel
+from widgets.constants import STRIP_INDICES
+from widgets.params import param_key
+from widgets.simulator import SimulatedVM
+from widgets.state_store import StateStore, DirectBackend
+from widgets.vm_worker import VMWorker
+
+STEPS = 60
+DURATION_S = 0.3
+
+
+GAIN = param_key("strip", STRIP_INDICES[0], "gain")
+
+
+def drag(app, slider, tick=lambda: None):
+    """Drag ``slider`` to -40; returns how many ``valueChanged`` it emitted."""
+    value_changes = 0
+
+    def count(_):
+        nonlocal value_changes
+        value_changes += 1
+
+    slider.valueChanged.connect(count)
+    slider.sliderPressed.emit()
+    for step in range(1, STEPS + 1):
+        slider.setValue(-int(step * 40 / STEPS))
+        app.processEvents()
+        tick()
+        time.sleep(DURATION_S / STEPS)
+    slider.sliderReleased.emit()
+    tick()
+    return value_changes
+
+
+def run_uncoalesced(app):
+    """Gain writes of the old path: every ``valueChanged`` is written."""
+    vm = SimulatedVM()
+    store = StateStore(DirectBackend(vm, [GAIN]), [GAIN])
+    slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
+    slider.setRange(-60, 12)
+    slider.valueChanged.connect(lambda value: store.set(GAIN, float(value)))
+    drag(app, slider)
+    return vm.param_writes[GAIN]
+
+
+def run():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    before = run_uncoalesced(app)
+    vm = SimulatedVM()
+    worker = VMWorker(vm)
+    panel = CombinedControlPanel(worker)
+    value_changes = drag(app, panel.volume_panel.sliders[STRIP_INDICES[0]], worker.tick)
+    panel.deleteLater()
+
+    return {
+        "value_changes": value_changes,
+        "api_calls_before": before,
+        "api_calls_after": vm.param_writes[GAIN],
+        "final_gain": vm.params[GAIN],
+    }
+
+
+if __name__ == "__main__":
+    result = run()
+    print(f"Drag of {STEPS} steps over {DURATION_S * 1000:.0f} ms")
+    print(f"  gain writes before: {result['api_calls_before']}")
+    print(f"  gain writes after:  {result['api_calls_after']}")
+    print(f"  final gain:         {result['final_gain']}")
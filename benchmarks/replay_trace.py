@@ -0,0 +1,68 @@
+"""Replay a recorded Voicemeeter trace against the simulator.
+
+Record a session on a real machine with ``VMCONTROL_TRACE=session.vmt
+python main.py``, then run ``python benchmarks/replay_trace.py session.vmt``
+anywhere. The calls are replayed against a ``SimulatedVM`` of the recorded
+kind at ``--speed`` times real time (0 replays as fast as possible), with
+an optional per-call ``--latency``. The report lists the busiest and
+slowest calls of the recording and its redundant reads, i.e. reads that
+returned the same value as the previous read of that parameter.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.constants import DEFAULT_KIND, KIND_LAYOUTS
+from widgets.simulator import SimulatedVM
+from widgets.tracing import read_trace, replay, summarize
+
+TOP = 10
+
+
+def recorded_kind(events):
+    for event in events:
+        if event.op == "get" and event.name == "kind.name" and str(event.value).lower() in KIND_LAYOUTS:
+            return str(event.value).lower()
+    return DEFAULT_KIND
+
+
+def run(path, speed=1.0, latency=0.0, kind=None):
+    events = read_trace(path)
+    vm = SimulatedVM(kind or recorded_kind(events), latency=latency)
+    return {
+        "summary": summarize(events),
+        "replay": replay(events, vm, speed=speed),
+        "simulator_calls": dict(vm.calls),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", help="trace file recorded with VMCONTROL_TRACE")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed (0 = as fast as possible)")
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per API call")
+    parser.add_argument("--kind", choices=list(KIND_LAYOUTS), help="engine kind (default: as recorded)")
+    args = parser.parse_args(argv)
+
+    result = run(args.trace, args.speed, args.latency, args.kind)
+    summary, stats = result["summary"], result["replay"]
+    print(f"{summary['events']} events over {summary['duration_s']:.1f} s")
+    print(f"  replayed in {stats['wall_s']:.2f} s: {stats['mismatches']} reads differ, "
+          f"{stats['errors']} errors")
+    print("Most frequent calls:")
+    for key, count in list(summary["calls"].items())[:TOP]:
+        print(f"  {count:8d}  {key}")
+    print("Most time spent:")
+    for key, ms in list(summary["time_ms"].items())[:TOP]:
+        print(f"  {ms:10.1f} ms  {key}")
+    redundant = summary["redundant_reads"]
+    print(f"Redundant reads: {sum(redundant.values())}")
+    for key, count in list(redundant.items())[:TOP]:
+        print(f"  {count:8d}  {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Run every benchmark headless and check the results against thresholds.
+
+Run with ``python benchmarks/run_benchmarks.py``. All benchmarks run
+against a simulated Voicemeeter on the offscreen Qt platform. Results are
+flattened to ``{"bench.case.metric": value}`` and written to
+``bench_results.json`` (``--output``) together with the machine they ran
+on, so runs can be compared.
+
+The run fails (exit status 1) when a metric breaks its limit in
+``thresholds.json``, or, with ``--baseline``, when a timing (``*_ms``) is
+more than ``--tolerance`` slower than in an earlier results file.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore
+import bench_metering
+import bench_panel_construction
+import bench_preset_format
+import bench_preset_io
+import bench_preset_switch
+import bench_refresh
+import bench_slider_drag
+from widgets.topology import Topology, default_topology
+
+THRESHOLDS_FILE = os.path.join(os.path.dirname(__file__), "thresholds.json")
+DEFAULT_OUTPUT = "bench_results.json"
+# Timings below this are noise and never count as a regression
+NOISE_FLOOR_MS = 0.05
+
+BENCHMARKS = {
+    "metering": bench_metering.run,
+    "refresh": bench_refresh.run,
+    "slider_drag": bench_slider_drag.run,
+    "preset_io": bench_preset_io.run,
+    "preset_format": bench_preset_format.run,
+    "preset_switch": bench_preset_switch.run,
+    "panel_construction": lambda: {
+        "3_strips": bench_panel_construction.run(default_topology()),
+        "potato": bench_panel_construction.run(Topology("potato")),
+    },
+}
+
+
+def flatten(results, prefix=""):
+    """``{"a": {"b": 1}}`` -> ``{"a.b": 1}``, keeping only numbers."""
+    flat = {}
+    for name, value in results.items():
+        key = f"{prefix}{name}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, key + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[key] = value
+    return flat
+
+
+def check_thresholds(metrics, thresholds):
+    """Messages for metrics outside their ``{"max": x}`` / ``{"min": x}`` limits."""
+    failures = []
+    for key, limits in thresholds.items():
+        if key not in metrics:
+            failures.append(f"{key}: missing from results")
+            continue
+        value = metrics[key]
+        if "max" in limits and value > limits["max"]:
+            failures.append(f"{key}: {value:.3f} > max {limits['max']}")
+        if "min" in limits and value < limits["min"]:
+            failures.append(f"{key}: {value:.3f} < min {limits['min']}")
+    return failures
+
+
+def check_baseline(metrics, baseline, tolerance):
+    """Messages for timings more than ``tolerance`` slower than ``baseline``."""
+    failures = []
+    for key, old in baseline.items():
+        new = metrics.get(key)
+        if not key.endswith("_ms") or new is None or new < NOISE_FLOOR_MS:
+            continue
+        if new > old * (1 + tolerance):
+            failures.append(f"{key}: {new:.3f} ms vs {old:.3f} ms baseline (+{(new / old - 1) * 100:.0f}%)")
+    return failures
+
+
+def run(names=None):
+    metrics = {}
+    for name, bench in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        print(f"Running {name}...", flush=True)
+        metrics.update(flatten(bench(), name + "."))
+    return metrics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="results JSON file")
+    parser.add_argument("--thresholds", default=THRESHOLDS_FILE, help="limits JSON file")
+    parser.add_argument("--baseline", help="earlier results JSON file to compare timings with")
+    parser.add_argument("--tolerance", type=float, default=1.0,
+                        help="allowed slowdown against the baseline (1.0 = twice as slow)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="benchmarks to run")
+    args = parser.parse_args(argv)
+
+    metrics = run(args.only)
+    with open(args.output, "w") as f:
+        json.dump({
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "qt": QtCore.QT_VERSION_STR,
+            },
+            "metrics": metrics,
+        }, f, indent=2, sort_keys=True)
+    print(f"Wrote {len(metrics)} metrics to {args.output}")
+
+    with open(args.thresholds) as f:
+        thresholds = json.load(f)
+    if args.only:
+        thresholds = {key: limits for key, limits in thresholds.items() if key.split(".")[0] in args.only}
+    failures = check_thresholds(metrics, thresholds)
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures += check_baseline(metrics, json.load(f)["metrics"], args.tolerance)
+    for failure in failures:
+        print(f"  REGRESSION {failure}")
+    print("ok" if not failures else f"{len(failures)} regression(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,39 @@
+import time
+# Startup is timed from here if the process start time is not available
+MAIN_STARTED = time.time()
 import sys
 import os
 import signal
 import atexit
 from PyQt5 import QtWidgets, QtGui, QtCore
 from voicemeeterlib import api
-from widgets.combined_panel import CombinedControlPanel
-from widgets.constants import STRIP_INDICES
+from widgets.connector import Connector
+from widgets.constants import STRIP_INDICES, PRESET_MORPH_MS, PANEL_PREBUILD_DELAY_MS
+from widgets.instrumentation import INSTRUMENTS
+from widgets.levels import kind_name
+from widgets.params import param_key
 from widgets.preset_manager import PresetManager
+from widgets.preset_library import PresetLibrary
+from widgets.startup_timing import StartupTimer, process_start_time
+from widgets.state_store import StateStore
+from widgets.theme import DARK, LIGHT, DEFAULT_THEME
+from widgets.topology import default_topology, load_topology
+from widgets.tracing import TraceWriter, TracingVM
+from widgets.watchdog import StallWatchdog
+from widgets.vm_worker import VMWorker
 
 ICON_PATH = "tray_icon.ico"
+VM_KIND = "potato"
 LOCK_FILE = "vmcontrol.lock"
+PRESET_FILTER = "Presets (*.json *.vmp)"
+PRESET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "presets")
+STARTUP_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_timing.jsonl")
+INSTRUMENTATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "instrumentation.json")
+STALL_LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stalls.log")
+# Optional: which strips, outputs and buses to show (see widgets/topology.py)
+TOPOLOGY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "topology.json")
+# Optional: record every Voicemeeter call to this trace file (see widgets/tracing.py)
+TRACE_ENV = "VMCONTROL_TRACE"
 
 class SingleInstanceApp(QtWidgets.QApplication):
     """Application that ensures only one instance can run at a time"""
@@ -34,21 +58,77 @@ class SingleInstanceApp(QtWidgets.QApplication):
         if self.shared_memory.isAttached():
             self.shared_memory.detach()
 
+def connect_voicemeeter(kind=VM_KIND, trace=None):
+    """Log in to Voicemeeter (runs on the worker thread), recording every
+    call to ``trace`` if given."""
+    vm = api(kind)
+    if trace is not None:
+        vm = TracingVM(vm, trace)
+    vm.login()
+    return vm
+
+
+def toggle_all_mutes(store, strips=STRIP_INDICES):
+    """Mute states that mute every configured strip, or unmute them if all are
+    already muted, computed from the state store."""
+    keys = [param_key("strip", idx, "mute") for idx in strips]
+    states = store.snapshot(keys)
+    new_state = not all(states.values())
+    return {key: new_state for key in states}
+
+
 class TrayApp(QtWidgets.QSystemTrayIcon):
-    def __init__(self, icon_path, vm, parent=None):
+    def __init__(self, icon_path, vm=None, parent=None, preset_dir=PRESET_DIR, timer=None,
+                 connector=None, topology=None, instrumentation_file=INSTRUMENTATION_FILE, watchdog=None):
         super().__init__(QtGui.QIcon(icon_path), parent)
         self.vm = vm
-        self.control_panel = CombinedControlPanel(vm)
+        self.timer = timer
+        # Names what the GUI thread is doing if it stalls (unstarted: no-op)
+        self.watchdog = watchdog if watchdog is not None else StallWatchdog()
+        self.topology = topology if topology is not None else default_topology()
+        self.kind = kind_name(vm) if vm is not None else self.topology.kind
+        self.icon = QtGui.QIcon(icon_path)
+        # All Voicemeeter access happens on the worker thread; without a vm
+        # it connects in the background and the tray shows "connecting"
+        self.worker = VMWorker(vm, strips=self.topology.strips, buses=self.topology.buses,
+                               connector=connector, kind=self.topology.kind)
+        self.control_panel = None
+        self.connected = False
+        self.worker.connection_changed.connect(self._connection_changed)
+        self._connection_changed(vm is not None)
+        # Every reader and writer goes through one cached copy of the state
+        self.store = StateStore(self.worker, self.worker.param_keys)
+        self.worker.start()
+        self.store.refresh()
+        # The panel is built on the first click or in an idle slot after
+        # startup, so the tray icon appears as early as possible
+        self.prebuild_timer = QtCore.QTimer(self)
+        self.prebuild_timer.setSingleShot(True)
+        self.prebuild_timer.timeout.connect(self.ensure_control_panel)
+        self.prebuild_timer.start(PANEL_PREBUILD_DELAY_MS)
+        # Presets are parsed once and switched from memory
+        self.presets = PresetLibrary(preset_dir)
+        self.morph_ms = PRESET_MORPH_MS
+        self.theme = DEFAULT_THEME
+        self.instrumentation_file = instrumentation_file
         self.shutting_down = False
-        
-        # Install application-wide event filter for auto-hide
-        QtWidgets.qApp.installEventFilter(self)
 
         menu = QtWidgets.QMenu(parent)
         menu.addAction("Show Controls", self.toggle_controls)
         menu.addAction("Mute All", self.toggle_all_mutes)
         menu.addAction("Save Preset", self.save_preset)
         menu.addAction("Load Preset", self.load_preset)
+        self.presets_menu = menu.addMenu("Presets")
+        self.presets.changed.connect(self._build_presets_menu)
+        self._build_presets_menu()
+        self.light_theme_action = menu.addAction("Light Theme", self.toggle_theme)
+        self.light_theme_action.setCheckable(True)
+        debug_menu = menu.addMenu("Debug")
+        debug_menu.addAction("Debug Overlay", self.toggle_debug_overlay)
+        self.instrument_action = debug_menu.addAction("Record Instrumentation", self.toggle_instrumentation)
+        self.instrument_action.setCheckable(True)
+        self.instrument_action.setChecked(INSTRUMENTS.enabled)
+        debug_menu.addAction("Dump Instrumentation", self.dump_instrumentation)
         menu.addSeparator()
         menu.addAction("Exit", self.graceful_shutdown)
 
@@ -80,18 +160,11 @@ class TrayApp(QtWidgets.QSystemTrayIcon):
             if self.control_panel and self.control_panel.isVisible():
                 self.control_panel.hide()
             
-            # Stop any timers in the control panel
-            if hasattr(self.control_panel, 'volume_panel'):
-                volume_panel = self.control_panel.volume_panel
-                if hasattr(volume_panel, 'vu_timer') and volume_panel.vu_timer.isActive():
-                    volume_panel.vu_timer.stop()
-                
-                # Clear any ongoing reset operations
-                if hasattr(volume_panel, 'resetting_strips'):
-                    volume_panel.resetting_strips.clear()
+            # Stop the Voicemeeter worker thread
+            self.worker.stop()
             
             # Stop hide timer if active
-            if hasattr(self.control_panel, 'hide_timer') and self.control_panel.hide_timer.isActive():
+            if self.control_panel and self.control_panel.hide_timer.isActive():
                 self.control_panel.hide_timer.stop()
             
             # Hide the tray icon
@@ -110,44 +183,138 @@ class TrayApp(QtWidgets.QSystemTrayIcon):
 
     def toggle_all_mutes(self):
         """Toggle mute state for all configured strips."""
-        states = []
-        for idx in STRIP_INDICES:
-            try:
-                states.append(getattr(self.vm.strip[idx], "mute"))
-            except (IndexError, AttributeError):
-                pass
-        new_state = not all(states)
-        for idx in STRIP_INDICES:
-            try:
-                setattr(self.vm.strip[idx], "mute", new_state)
-            except (IndexError, AttributeError):
-                pass
-        self.control_panel.volume_panel.update_sliders()
+        params = toggle_all_mutes(self.store, self.topology.strips)
+        if params:
+            self.store.apply(params)
 
     def save_preset(self):
         """Save current Voicemeeter configuration to a file."""
+        os.makedirs(self.presets.directory, exist_ok=True)
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            None, "Save Preset", "vm_preset.json", "JSON Files (*.json)"
+            None, "Save Preset", os.path.join(str(self.presets.directory), "vm_preset.json"),
+            PRESET_FILTER
         )
         if path:
-            PresetManager.save_preset(self.vm, path)
+            with self.watchdog.operation("save preset"):
+                PresetManager.write_preset(self.store.snapshot(), path, self.kind)
+                self.presets.rescan()
 
     def load_preset(self):
         """Load Voicemeeter configuration from a preset file."""
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            None, "Load Preset", "", "JSON Files (*.json)"
+            None, "Load Preset", "", PRESET_FILTER
         )
         if path:
-            PresetManager.load_preset(self.vm, path)
-            self.control_panel.update_controls()
+            with self.watchdog.operation("load preset"):
+                # Only write what differs from the current state
+                changes = self.store.diff(PresetManager.read_preset(path))
+                if changes:
+                    self.store.apply(changes)
+
+    def apply_preset(self, name):
+        """Fade to preset ``name`` from the in-memory library."""
+        params = self.presets.get(name)
+        if params is None:
+            return
+        with self.watchdog.operation(f"apply preset {name}"):
+            changes = self.store.diff(params)
+            if changes:
+                self.store.morph(changes, self.morph_ms)
+
+    def _build_presets_menu(self):
+        """Rebuild the Presets submenu from the library index."""
+        self.presets_menu.clear()
+        names = self.presets.names()
+        for name in names:
+            self.presets_menu.addAction(name, lambda name=name: self.apply_preset(name))
+        self.presets_menu.setEnabled(bool(names))
+
+    def ensure_control_panel(self):
+        """Build the control panel if it doesn't exist yet."""
+        if self.control_panel is not None or self.shutting_down:
+            return self.control_panel
+        with self.watchdog.operation("build control panel"):
+            # Imported here so the widget modules stay off the startup path
+            from widgets.combined_panel import CombinedControlPanel
+            panel = CombinedControlPanel(self.worker, self.store, self.theme, self.topology)
+        panel.setEnabled(self.connected)
+        panel.visibility_changed.connect(self._panel_visibility_changed)
+        panel.destroyed.connect(self._panel_destroyed)
+        self.control_panel = panel
+        if self.timer:
+            self.timer.mark("panel_built")
+        return panel
+
+    def toggle_theme(self):
+        """Switch the control panel between the dark and light theme."""
+        self.theme = LIGHT if self.theme == DARK else DARK
+        self.light_theme_action.setChecked(self.theme == LIGHT)
+        if self.control_panel is not None:
+            with self.watchdog.operation("switch theme"):
+                self.control_panel.set_theme(self.theme)
+
+    def toggle_debug_overlay(self):
+        """Show the control panel's instrumentation overlay (Ctrl+Shift+D)."""
+        panel = self.ensure_control_panel()
+        if panel is None:
+            return
+        panel.toggle_debug_overlay()
+        if not panel.debug_overlay.isHidden() and not panel.isVisible():
+            self.toggle_controls()
+
+    def toggle_instrumentation(self):
+        """Start or stop recording hot-path counters and timings."""
+        INSTRUMENTS.enable(not INSTRUMENTS.enabled)
+        self.instrument_action.setChecked(INSTRUMENTS.enabled)
+
+    def dump_instrumentation(self):
+        """Write the recorded counters and timings to ``instrumentation_file``."""
+        try:
+            INSTRUMENTS.dump(self.instrumentation_file)
+        except OSError as e:
+            print(f"Error writing instrumentation: {e}")
+            return
+        print(f"Instrumentation written to {self.instrumentation_file}")
+
+    def _connection_changed(self, connected):
+        """Show whether Voicemeeter is connected; the panel is only usable
+        while it is."""
+        self.connected = connected
+        if connected:
+            self.setIcon(self.icon)
+            self.setToolTip("VMControl")
+        else:
+            self.setIcon(QtGui.QIcon(self.icon.pixmap(64, QtGui.QIcon.Disabled)))
+            self.setToolTip("VMControl - connecting to Voicemeeter...")
+        if self.control_panel is not None:
+            self.control_panel.setEnabled(connected)
+
+    def _panel_visibility_changed(self, visible):
+        """Only filter application events while the panel is open."""
+        if visible:
+            QtWidgets.qApp.installEventFilter(self)
+        else:
+            QtWidgets.qApp.removeEventFilter(self)
+
+    def _panel_destroyed(self):
+        QtWidgets.qApp.removeEventFilter(self)
+        self.control_panel = None
 
     def toggle_controls(self):
-        if self.control_panel.isVisible():
-            self.control_panel.hide()
+        if self.timer:
+            self.timer.mark("first_click")
+        panel = self.ensure_control_panel()
+        if panel is None:
+            return
+        if panel.isVisible():
+            panel.hide()
         else:
-            self.control_panel.update_controls()
-            self._position_panel(self.control_panel)
-            self.control_panel.show()
+            if self.timer:
+                self.timer.watch_paint(panel)
+            with self.watchdog.operation("show control panel"):
+                panel.update_controls()
+                self._position_panel(panel)
+                panel.show()
 
     def _position_panel(self, panel):
         screen = QtWidgets.QDesktopWidget().availableGeometry()
@@ -161,8 +328,9 @@ class TrayApp(QtWidgets.QSystemTrayIcon):
         """Global event filter to hide panel when clicking outside"""
         # Hide the panel if any mouse press occurs outside of it
         if (
-            self.control_panel.isVisible()
-            and event.type() == QtCore.QEvent.MouseButtonPress
+            event.type() == QtCore.QEvent.MouseButtonPress
+            and self.control_panel is not None
+            and self.control_panel.isVisible()
         ):
             
             # Check if the click is outside the control panel
@@ -251,6 +419,7 @@ def main():
         sys.exit(1)
     
     app = SingleInstanceApp(sys.argv)
+    timer = StartupTimer(STARTUP_LOG, origin=process_start_time(MAIN_STARTED))
     
     # Double-check with Qt-based method
     if app.is_running:
@@ -267,18 +436,34 @@ def main():
         sys.exit(1)
     
     try:
-        with api("potato") as vm:
-            tray = TrayApp(ICON_PATH, vm)
-            tray.show()
-            
-            sys.exit(app.exec_())
+        # The tray comes up right away; the worker logs in to Voicemeeter in
+        # the background and keeps retrying until the engine is available
+        trace = TraceWriter(os.environ[TRACE_ENV]) if os.environ.get(TRACE_ENV) else None
+        # The engine kind comes from topology.json (default Potato)
+        topology = load_topology(TOPOLOGY_FILE, VM_KIND)
+        connector = Connector(lambda: connect_voicemeeter(topology.kind, trace))
+        watchdog = StallWatchdog(STALL_LOG)
+        watchdog.start()
+        tray = TrayApp(ICON_PATH, timer=timer, connector=connector, topology=topology, watchdog=watchdog)
+        tray.show()
+        QtCore.QTimer.singleShot(0, lambda: timer.mark("tray_visible"))
+        
+        exit_code = app.exec_()
+        watchdog.stop()
+        # Make sure nothing touches vm once we log out
+        tray.worker.stop()
+        connector.close()
+        if trace is not None:
+            trace.close()
+            print(f"Recorded {trace.events} Voicemeeter calls to {trace.path}")
+        sys.exit(exit_code)
     except Exception as e:
         print(f"Error starting VMControl: {e}")
         try:
             QtWidgets.QMessageBox.critical(
                 None,
                 "VMControl Error", 
-                f"Failed to start VMControl:\n\n{e}\n\nMake sure Voicemeeter Potato is running.",
+                f"Failed to start VMControl:\n\n{e}",
                 QtWidgets.QMessageBox.Ok
             )
         except:
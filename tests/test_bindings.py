@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import MagicMock
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtCore, QtWidgets
+from widgets.bindings import Bindings
+
+
+class TestBindings(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.bindings = Bindings()
+
+    def test_pushes_to_every_bound_widget(self):
+        slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
+        slider.setRange(-60, 12)
+        label = QtWidgets.QLabel()
+        self.bindings.bind_slider("strip[5].gain", slider)
+        self.bindings.bind_label("strip[5].gain", label)
+        self.bindings.apply({"strip[5].gain": -6.4, "strip[6].gain": -12.0})
+        self.assertEqual(slider.value(), -6)
+        self.assertEqual(label.text(), "-6dB")
+        self.assertEqual(self.bindings.widgets("strip[5].gain"), [slider, label])
+        self.assertEqual(self.bindings.widgets("strip[6].gain"), [])
+
+    def test_signals_are_blocked_while_pushing(self):
+        box = QtWidgets.QCheckBox()
+        handler = MagicMock()
+        box.stateChanged.connect(handler)
+        self.bindings.bind_checkable("strip[5].mute", box)
+        self.bindings.apply({"strip[5].mute": True})
+        self.assertTrue(box.isChecked())
+        handler.assert_not_called()
+        self.assertFalse(box.signalsBlocked())
+        box.setChecked(False)
+        handler.assert_called_once()
+
+    def test_held_slider_is_left_alone(self):
+        slider = QtWidgets.QSlider(QtCore.Qt.Vertical)
+        slider.setRange(-60, 12)
+        slider.setSliderDown(True)
+        self.bindings.bind_slider("strip[5].gain", slider)
+        self.bindings.apply({"strip[5].gain": -20.0})
+        self.assertEqual(slider.value(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtCore, QtWidgets
+from widgets.combined_panel import CombinedControlPanel
+from widgets.vm_worker import VMWorker
+from widgets.params import param_key
+from widgets.constants import STRIP_INDICES
+from widgets.state_store import StateStore
+from widgets.topology import Topology
+from test_vm_worker import DummyVM
+
+
+class TestCombinedPanel(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.vm = DummyVM()
+        self.worker = VMWorker(self.vm)
+        self.panel = CombinedControlPanel(self.worker)
+
+    def test_refresh_updates_widgets(self):
+        strip_idx = STRIP_INDICES[1]
+        self.vm.strip[strip_idx].gain = -12.0
+        self.vm.strip[strip_idx].mute = True
+        self.vm.strip[strip_idx].B2 = True
+        self.panel.update_controls()
+        self.worker.tick()
+        volume = self.panel.volume_panel
+        self.assertEqual(volume.sliders[strip_idx].value(), -12)
+        self.assertTrue(volume.mute_checkboxes[strip_idx].isChecked())
+        self.assertTrue(self.panel.routing_panel.buttons[strip_idx]["B2"].isChecked())
+
+    def test_widget_changes_go_through_worker(self):
+        strip_idx = STRIP_INDICES[0]
+        slider = self.panel.volume_panel.sliders[strip_idx]
+        for value in range(-1, -8, -1):
+            slider.setValue(value)
+        slider.sliderReleased.emit()
+        self.panel.routing_panel._toggle_output(strip_idx, "A3", True)
+        # Nothing reaches Voicemeeter until the worker runs
+        self.assertEqual(self.vm.strip[strip_idx].gain, 0.0)
+        self.worker.tick()
+        self.assertEqual(self.vm.strip[strip_idx].gain, -7.0)
+        self.assertTrue(self.vm.strip[strip_idx].A3)
+
+    def test_store_outlives_deleted_panel(self):
+        store = self.panel.store
+        self.panel.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+        key = param_key("strip", STRIP_INDICES[0], "gain")
+        self.assertEqual(store.update({key: -9.0}), {key: -9.0})
+
+    def test_double_click_resets_gain(self):
+        strip_idx = STRIP_INDICES[2]
+        volume = self.panel.volume_panel
+        slider = volume.sliders[strip_idx]
+        slider.setValue(-20)
+        slider.setSliderDown(True)
+        slider.doubleClicked.emit()
+        self.assertEqual(slider.value(), 0)
+        label, = [w for w in volume.bindings.widgets(param_key("strip", strip_idx, "gain"))
+                  if isinstance(w, QtWidgets.QLabel)]
+        self.assertEqual(label.text(), "0dB")
+        self.worker.tick()
+        self.assertEqual(self.vm.strip[strip_idx].gain, 0.0)
+
+    def test_pages_are_built_when_shown(self):
+        topology = Topology("potato")
+        worker = VMWorker(self.vm, strips=topology.strips)
+        self.vm.strip[1].gain = -9.0
+        store = StateStore(worker, worker.param_keys)
+        store.refresh()
+        worker.tick()
+        panel = CombinedControlPanel(worker, store, topology=topology)
+        volume = panel.volume_panel
+        # Only the virtual inputs exist until another page is selected
+        self.assertEqual(sorted(volume.sliders), [5, 6, 7])
+        self.assertEqual(sorted(panel.routing_panel.buttons), [5, 6, 7])
+        panel.page_bar.setCurrentIndex(0)
+        self.assertEqual(sorted(volume.sliders), [0, 1, 2, 5, 6, 7])
+        # New pages start from the store's snapshot
+        self.assertEqual(volume.sliders[1].value(), -9)
+
+    def test_bus_panel_shares_worker_cycle(self):
+        topology = Topology("potato", strips=STRIP_INDICES)
+        worker = VMWorker(self.vm, strips=topology.strips, buses=topology.buses)
+        panel = CombinedControlPanel(worker, topology=topology)
+        buses = panel.bus_panel
+        self.assertEqual(sorted(buses.sliders), [0, 1, 2, 3, 4])
+        self.vm.bus[2].gain = -4.0
+        panel.update_controls()
+        panel.volume_panel.scheduler.set_visible(True)
+        worker.tick()
+        self.assertEqual(buses.sliders[2].value(), -4)
+        # One pass over the level API covers strips and buses, and one
+        # frame draws both sets of meters
+        self.assertEqual(self.vm.level_calls, 2 * (len(STRIP_INDICES) + 5))
+        self.assertTrue(all(m.level > -60 for m in buses.vu_meters.values()))
+        self.assertTrue(all(m.level > -60 for m in panel.volume_panel.vu_meters.values()))
+        buses.sliders[0].setValue(-10)
+        buses.sliders[0].sliderReleased.emit()
+        worker.tick()
+        self.assertEqual(self.vm.bus[0].gain, -10.0)
+
+    def test_meters_follow_worker_frames(self):
+        # Becoming visible starts the worker's level polling
+        self.panel.volume_panel.scheduler.set_visible(True)
+        self.assertEqual(self.worker._interval, 0.05)
+        self.worker.tick()
+        self.assertTrue(any(m.level > -60 for m in self.panel.volume_panel.vu_meters.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
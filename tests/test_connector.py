@@ -0,0 +1,124 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.connector import Connector
+from widgets.levels import STRIP_POSTMUTE, BUS_OUTPUT
+from widgets.params import param_key
+from widgets.simulator import SimulatedVM
+from widgets.vm_worker import VMWorker
+from test_vm_worker import DummyVM
+
+
+class Engine:
+    """Voicemeeter that can be stopped and restarted."""
+
+    def __init__(self):
+        self.running = False
+        self.logins = 0
+        self.vm = RestartableVM(self)
+
+    def connect(self):
+        if not self.running:
+            raise RuntimeError("engine not running")
+        self.logins += 1
+        return self.vm
+
+
+class RestartableVM(DummyVM):
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+
+    @property
+    def pdirty(self):
+        if not self.engine.running:
+            raise RuntimeError("no server")
+        return False
+
+    def logout(self):
+        pass
+
+
+def test_backoff_doubles_up_to_maximum():
+    engine = Engine()
+    connector = Connector(engine.connect, retry_min_ms=100, retry_max_ms=400)
+    delays = []
+    now = 0.0
+    for _ in range(5):
+        assert connector.connect(now) is None
+        delays.append(round(connector.next_attempt - now, 3))
+        now = connector.next_attempt
+    assert delays == [0.1, 0.2, 0.4, 0.4, 0.4]
+    # Attempts only happen when due
+    assert connector.connect(now - 0.01) is None
+    assert connector.attempts == 5
+
+    engine.running = True
+    assert connector.connect(now) is engine.vm
+
+
+def test_worker_starts_without_engine_and_keeps_commands():
+    engine = Engine()
+    worker = VMWorker(connector=Connector(engine.connect))
+    states = []
+    worker.connection_changed.connect(states.append)
+    key = param_key("strip", 5, "A2")
+    worker.submit(key, True)
+    assert worker.tick(now=0.0) is not None
+    assert worker.vm is None
+
+    engine.running = True
+    worker.tick(now=1.0)
+    assert states == [True]
+    assert engine.vm.strip[5].A2 is True
+
+
+def test_engine_restart_reconnects_and_replays_cache():
+    engine = Engine()
+    engine.running = True
+    worker = VMWorker(connector=Connector(engine.connect))
+    states = []
+    worker.connection_changed.connect(states.append)
+    worker.tick(now=0.0)
+    key = param_key("strip", 6, "gain")
+    worker.submit(key, -9.0)
+    worker.tick(now=0.0)
+
+    # Voicemeeter restarts and comes back with its own settings
+    engine.running = False
+    worker.tick(now=1.0)
+    assert states == [True, False]
+    engine.vm.strip[6].gain = 0.0
+    engine.running = True
+    worker.tick(now=1.1)
+    assert states == [True, False, True]
+    assert engine.vm.strip[6].gain == -9.0
+    assert engine.logins == 2
+
+
+def test_level_channels_follow_the_connected_kind():
+    vm = SimulatedVM("banana")
+    reads = []
+    get_level = vm.get_level
+    vm.get_level = lambda mode, index: reads.append((mode, index)) or get_level(mode, index)
+    worker = VMWorker(strips=[4], buses=[1], connector=Connector(lambda: vm), kind="banana")
+    worker.set_interval(50)
+    worker.tick(now=0.0)
+    # Banana: three hardware strips of 2 channels, then 8 per virtual strip
+    assert reads == [(STRIP_POSTMUTE, 14), (STRIP_POSTMUTE, 15), (BUS_OUTPUT, 8), (BUS_OUTPUT, 9)]
+
+
+def test_engine_of_another_kind_is_refused():
+    vm = SimulatedVM("banana")
+    connector = Connector(lambda: vm, retry_min_ms=100)
+    worker = VMWorker(connector=connector, kind="potato")
+    states = []
+    worker.connection_changed.connect(states.append)
+    worker.submit(param_key("strip", 4, "gain"), -6.0)
+    assert worker.tick(now=0.0) is not None
+    assert worker.vm is None and states == []
+    assert not vm.logged_in
+    assert connector.next_attempt == 0.1
+    assert vm.strip[4].gain == 0.0
@@ -0,0 +1,119 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtCore, QtWidgets
+from widgets.combined_panel import CombinedControlPanel
+from widgets.instrumentation import INSTRUMENTS, Histogram, Instrumentation
+from widgets.params import read_params, write_params, strip_keys
+from widgets.simulator import SimulatedVM
+from widgets.vm_worker import VMWorker
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_histogram_percentiles(self):
+        histogram = Histogram()
+        for _ in range(98):
+            histogram.record(0.001)
+        histogram.record(0.050)
+        histogram.record(0.200)
+        summary = histogram.to_dict()
+        self.assertEqual(summary["count"], 100)
+        # Buckets are a quarter of a doubling wide
+        self.assertAlmostEqual(summary["p50_ms"], 1.0, delta=0.2)
+        self.assertAlmostEqual(summary["p99_ms"], 50.0, delta=10.0)
+        self.assertAlmostEqual(summary["max_ms"], 200.0)
+
+    def test_disabled_records_nothing(self):
+        instruments = Instrumentation()
+        instruments.count("vm.read")
+        with instruments.timed("vu.tick"):
+            pass
+        self.assertEqual(instruments.snapshot()["counters"], {})
+        instruments.enable()
+        with instruments.timed("vu.tick"):
+            time.sleep(0.002)
+        snapshot = instruments.snapshot()
+        self.assertEqual(snapshot["counters"]["vu.tick"], 1)
+        self.assertGreaterEqual(snapshot["timings"]["vu.tick"]["max_ms"], 2.0)
+
+    def test_dump_writes_json(self):
+        instruments = Instrumentation(enabled=True)
+        instruments.count("vu.dropped_frames", 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "dump.json")
+            instruments.dump(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["counters"], {"vu.dropped_frames": 2})
+
+
+class TestHotPathProbes(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        INSTRUMENTS.reset()
+        INSTRUMENTS.enable()
+
+    def tearDown(self):
+        INSTRUMENTS.enable(False)
+        INSTRUMENTS.reset()
+
+    def test_vm_calls_are_counted(self):
+        vm = SimulatedVM()
+        read_params(vm, strip_keys(5))
+        write_params(vm, {"strip[5].gain": -3.0})
+        counters = INSTRUMENTS.snapshot()["counters"]
+        self.assertEqual(counters["vm.read"], len(strip_keys(5)))
+        self.assertEqual(counters["vm.script"], 1)
+
+    def test_worker_counts_levels_and_dropped_frames(self):
+        vm = SimulatedVM()
+        worker = VMWorker(vm)
+        worker.set_interval(50)
+        now = time.monotonic()
+        worker.tick(now)
+        worker.tick(now + 0.1)  # Nobody took the first frame
+        counters = INSTRUMENTS.snapshot()["counters"]
+        self.assertEqual(counters["vm.get_level"], vm.calls["get_level"])
+        self.assertEqual(counters["vu.dropped_frames"], 1)
+        self.assertIn("vm.pdirty", counters)
+
+    def test_timer_fires_are_counted_until_the_timer_goes(self):
+        timer = QtCore.QTimer()
+        INSTRUMENTS.count_fires(timer, "timer.test")
+        timer.timeout.emit()
+        self.assertEqual(INSTRUMENTS.snapshot()["counters"]["timer.test"], 1)
+        counter = timer.findChild(QtCore.QObject)
+        destroyed = []
+        counter.destroyed.connect(lambda: destroyed.append(True))
+        timer.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+        self.assertEqual(destroyed, [True])
+
+    def test_overlay_shows_live_figures(self):
+        INSTRUMENTS.enable(False)
+        worker = VMWorker(SimulatedVM())
+        panel = CombinedControlPanel(worker)
+        overlay = panel.debug_overlay
+        self.assertTrue(overlay.isHidden())
+        panel.show()
+        panel.toggle_debug_overlay()
+        self.assertTrue(INSTRUMENTS.enabled)
+        panel.volume_panel.scheduler.set_visible(True)
+        worker.tick()
+        self.app.processEvents()
+        overlay.refresh()
+        self.assertIn("API calls/s", overlay.text())
+        self.assertGreater(INSTRUMENTS.snapshot()["counters"]["vu.tick"], 0)
+        self.assertGreater(INSTRUMENTS.snapshot()["counters"]["vu.paint"], 0)
+        panel.toggle_debug_overlay()
+        self.assertFalse(INSTRUMENTS.enabled)
+        panel.hide()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.levels import LevelSnapshot, STRIP_POSTMUTE, BUS_OUTPUT
+from widgets.constants import STRIP_INDICES, LEVEL_MIN_DB
+
+
+class DummyKind:
+    name = "potato"
+
+
+class DummyVM:
+    def __init__(self):
+        self.kind = DummyKind()
+        self.calls = []
+        self.values = {}
+
+    def get_level(self, type_, index):
+        self.calls.append((type_, index))
+        return self.values.get((type_, index), 0.0)
+
+
+def test_single_pass_reads_only_watched_channels():
+    vm = DummyVM()
+    snapshot = LevelSnapshot(vm, strips=STRIP_INDICES, buses=[0])
+    snapshot.refresh()
+    # Two channels per meter, one call each, nothing else
+    assert len(vm.calls) == (len(STRIP_INDICES) + 1) * 2
+    # Strip 5 is the first virtual input on Potato: 5 * 2 physical channels
+    assert (STRIP_POSTMUTE, 10) in vm.calls
+    assert (BUS_OUTPUT, 0) in vm.calls
+
+
+def test_levels_converted_to_db_and_clamped():
+    vm = DummyVM()
+    vm.values[(STRIP_POSTMUTE, 10)] = 1.0   # 0 dB
+    vm.values[(STRIP_POSTMUTE, 11)] = 0.1   # -20 dB
+    snapshot = LevelSnapshot(vm, strips=[5])
+    levels = snapshot.refresh()
+    assert abs(snapshot.strip(5)[0]) < 0.01
+    assert abs(snapshot.strip(5)[1] + 20) < 0.01
+    # Buffer is reused between ticks
+    assert snapshot.refresh() is levels
+    vm.values.clear()
+    snapshot.refresh()
+    assert snapshot.strip(5)[0] == LEVEL_MIN_DB
+
+
+def test_engine_error_reports_silence():
+    class BrokenVM(DummyVM):
+        def get_level(self, type_, index):
+            raise RuntimeError("engine gone")
+
+    snapshot = LevelSnapshot(BrokenVM(), strips=[5])
+    snapshot.refresh()
+    assert (snapshot.strip(5) == LEVEL_MIN_DB).all()
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.metering import MeterEngine
+from widgets.constants import LEVEL_MIN_DB
+
+
+def make_engine(shape=(3, 2)):
+    return MeterEngine(shape, attack_ms=10, release_db_per_s=20, hold_ms=1000,
+                       peak_fall_db_per_s=10, clip_db=0.0)
+
+
+def test_release_is_rate_limited_per_channel():
+    engine = make_engine()
+    loud = np.full((3, 2), -6.0, dtype=np.float32)
+    engine.process(loud, now=0.0)
+    quiet = np.full((3, 2), LEVEL_MIN_DB, dtype=np.float32)
+    display = engine.process(quiet, now=0.5)
+    # 0.5s at 20 dB/s -> 10 dB below the previous frame
+    assert np.allclose(display, -16.0)
+
+
+def test_peak_hold_then_fall():
+    engine = make_engine()
+    levels = np.full((3, 2), LEVEL_MIN_DB, dtype=np.float32)
+    levels[1, 1] = -3.0
+    engine.process(levels, now=0.0)
+    levels[1, 1] = LEVEL_MIN_DB
+    engine.process(levels, now=0.5)
+    assert engine.peak[1, 1] == -3.0
+    engine.process(levels, now=1.5)
+    assert engine.peak[1, 1] < -3.0
+    assert engine.peak[0, 0] == LEVEL_MIN_DB
+
+
+def test_clip_latches_until_reset():
+    engine = make_engine()
+    levels = np.full((3, 2), -20.0, dtype=np.float32)
+    levels[2, 1] = 1.0
+    engine.process(levels, now=0.0)
+    levels[2, 1] = -20.0
+    engine.process(levels, now=1.0)
+    assert engine.clip[2, 1] and not engine.clip[2, 0]
+    engine.reset_clip(2)
+    assert not engine.clip.any()
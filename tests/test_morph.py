@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from widgets.morph import Morph, Morpher
+from widgets.params import param_key
+from widgets.vm_worker import VMWorker
+from test_params import ScriptVM
+
+GAIN = param_key("strip", 5, "gain")
+MUTE = param_key("strip", 5, "mute")
+A1 = param_key("strip", 6, "A1")
+
+
+def test_gains_follow_curve_and_toggles_flip_at_switch_points():
+    start = {GAIN: -20.0, MUTE: False, A1: False}
+    morph = Morph(start, {GAIN: 0.0, MUTE: True, A1: True}, 1.0, now=0.0, curve="linear")
+    assert morph.step(0.0) == {}
+    assert morph.step(0.25) == {GAIN: -15.0}
+    # Routing flips half way, the mute only once the fade is complete
+    assert morph.step(0.5) == {GAIN: -10.0, A1: True}
+    assert morph.step(0.9) == {GAIN: pytest.approx(-2.0)}
+    assert morph.step(1.0) == {GAIN: 0.0, MUTE: True}
+    assert morph.done(1.0)
+
+
+def test_unmute_happens_at_fade_start():
+    morph = Morph({MUTE: True}, {MUTE: False}, 1.0, now=0.0)
+    assert morph.step(0.0) == {MUTE: False}
+
+
+def test_unknown_curve_is_rejected():
+    with pytest.raises(ValueError):
+        Morph({}, {}, 1.0, now=0.0, curve="bounce")
+
+
+def test_morpher_counts_missed_ticks():
+    morpher = Morpher(interval_ms=10)
+    morpher.start(Morph({GAIN: 0.0}, {GAIN: -10.0}, 1.0, now=0.0))
+    morpher.tick(0.0)
+    morpher.tick(0.01)
+    assert morpher.missed == 0
+    # The GUI (or anything else) held the loop for 45 ms
+    morpher.tick(0.055)
+    assert morpher.missed == 3
+    assert morpher.next_tick == pytest.approx(0.06)
+    values, finished = morpher.tick(1.0)
+    assert finished == {GAIN: -10.0}
+    assert not morpher.active()
+
+
+def test_worker_morph_sends_one_batch_per_tick_then_holds():
+    vm = ScriptVM()
+    worker = VMWorker(vm, idle_dirty_interval_ms=0)
+    targets = {param_key("strip", idx, "gain"): -12.0 for idx in (5, 6, 7)}
+    worker.morph(targets, duration_ms=60, curve="linear")
+    worker.tick()
+    deadline = time.monotonic() + 2
+    while worker.morpher.active() and time.monotonic() < deadline:
+        worker.tick()
+        time.sleep(0.005)
+    assert not worker.morpher.active()
+    assert all(vm.strip[idx].gain == -12.0 for idx in (5, 6, 7))
+    # Every tick wrote all three strips in a single script
+    assert len(vm.scripts) <= worker.morpher.ticks
+    assert all(script.count(";") == 3 for script in vm.scripts)
+    assert worker.reconciler.targets() == targets
+    assert worker.take_params()[param_key("strip", 7, "gain")] == -12.0
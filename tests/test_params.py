@@ -0,0 +1,69 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.params import param_key, compile_script, write_params
+from widgets.reconciler import verify
+from test_vm_worker import DummyVM
+
+
+class ScriptVM(DummyVM):
+    """Applies Voicemeeter scripts to the dummy strips."""
+
+    def __init__(self):
+        super().__init__()
+        self.scripts = []
+
+    def sendtext(self, script):
+        self.scripts.append(script)
+        for statement in filter(None, script.split(";")):
+            target, value = statement.split("=")
+            head, name = target.split(".")
+            index = int(head[head.index("[") + 1:-1])
+            name = name.lower() if name in ("Gain", "Mute") else name
+            value = float(value) if name == "gain" else value == "1"
+            setattr(self.strip[index], name, value)
+
+
+def test_compile_script():
+    params = {
+        param_key("strip", 5, "gain"): -6.5,
+        param_key("strip", 5, "mute"): True,
+        param_key("strip", 6, "B2"): False,
+        param_key("bus", 0, "gain"): 0,
+    }
+    assert compile_script(params) == [
+        "Strip[5].Gain=-6.5;Strip[5].Mute=1;Strip[6].B2=0;Bus[0].Gain=0;"
+    ]
+
+
+def test_compile_script_splits_long_batches(monkeypatch):
+    import widgets.params as params_module
+    monkeypatch.setattr(params_module, "SCRIPT_MAX_LENGTH", 40)
+    params = {param_key("strip", 5, out): True for out in ["A1", "A2", "A3", "A4"]}
+    scripts = compile_script(params)
+    assert len(scripts) == 2
+    assert "".join(scripts) == "Strip[5].A1=1;Strip[5].A2=1;Strip[5].A3=1;Strip[5].A4=1;"
+
+
+def test_write_params_is_one_call():
+    vm = ScriptVM()
+    params = {param_key("strip", idx, out): True for idx in (5, 6, 7) for out in ["A1", "B3"]}
+    params[param_key("strip", 6, "gain")] = -12.0
+    write_params(vm, params)
+    assert len(vm.scripts) == 1
+    assert vm.strip[6].gain == -12.0 and vm.strip[7].B3 is True
+    assert verify(vm, params) == {}
+
+
+def test_write_params_falls_back_without_sendtext():
+    vm = DummyVM()
+    write_params(vm, {param_key("strip", 5, "mute"): True})
+    assert vm.strip[5].mute is True
+
+
+def test_verify_reports_values_that_did_not_take():
+    vm = DummyVM()
+    params = {param_key("strip", 5, "gain"): -3.0, param_key("strip", 5, "A1"): False}
+    assert verify(vm, params) == {param_key("strip", 5, "gain"): -3.0}
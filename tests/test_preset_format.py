@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from widgets import preset_format
+from widgets.preset_format import PresetFormatError
+from widgets.preset_manager import PresetManager
+from widgets.params import param_key
+
+
+def full_preset(kind):
+    params = {}
+    for i, key in enumerate(preset_format.preset_keys(kind)):
+        name = key.rsplit(".", 1)[1]
+        params[key] = float(-(i % 60)) + 0.5 if name == "gain" else i % 3 == 0
+    return params
+
+
+@pytest.mark.parametrize("kind", ["basic", "banana", "potato"])
+@pytest.mark.parametrize("binary", [False, True])
+def test_round_trip_covers_full_topology(kind, binary):
+    params = full_preset(kind)
+    assert preset_format.loads(preset_format.dumps(params, kind, binary=binary)) == params
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_partial_presets_leave_other_parameters_alone(binary):
+    params = {param_key("strip", 5, "A1"): True, param_key("strip", 5, "gain"): -3.3,
+              param_key("strip", 6, "mute"): False, param_key("bus", 1, "gain"): -6.0}
+    decoded = preset_format.loads(preset_format.dumps(params, "potato", binary=binary))
+    assert decoded.keys() == params.keys()
+    assert decoded[param_key("strip", 5, "A1")] is True
+    assert decoded[param_key("strip", 6, "mute")] is False
+
+
+def test_version_2_documents_are_migrated():
+    doc = {"version": 2, "kind": "banana",
+           "strips": {"mask": 1 << 3, "gain": [0.0, 0.0, 0.0, -4.0, 0.0], "mute": 1 << 3,
+                      "routing": [0, 0, 0, 0b1000001, 0]},
+           "buses": {"mask": 0, "gain": [0.0] * 5, "mute": 0}}
+    expected = {param_key("strip", 3, "gain"): -4.0, param_key("strip", 3, "mute"): True}
+    expected.update({param_key("strip", 3, out): out in ("A1", "B2")
+                     for out in preset_format.kind_outputs("banana")})
+    assert preset_format.decode(doc) == expected
+    n_strips, n_buses = preset_format.kind_size("banana")
+    strips, buses = doc["strips"], doc["buses"]
+    data = preset_format._HEADER.pack(preset_format.BINARY_MAGIC_V2, 1, n_strips, n_buses)
+    data += preset_format._body_v2(n_strips, n_buses).pack(
+        strips["mask"], buses["mask"], *strips["gain"], strips["mute"],
+        *strips["routing"], *buses["gain"], buses["mute"])
+    assert preset_format.loads(data) == expected
+
+
+def test_routing_is_packed_into_bitmasks():
+    doc = preset_format.encode({param_key("strip", 5, "A2"): True,
+                                param_key("strip", 5, "B3"): True}, "potato")
+    assert doc["strips"]["routing"][5] == 0b10000010
+    assert doc["strips"]["routing_mask"][5] == 0b10000010
+    assert doc["strips"]["gain_mask"] == doc["strips"]["mute_mask"] == 0
+
+
+def test_version_1_files_are_migrated(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({"5": {"gain": -5, "mute": True, "routing": {"A1": True}}}))
+    params = PresetManager.read_preset(path)
+    assert params[param_key("strip", 5, "gain")] == -5.0
+    assert params[param_key("strip", 5, "mute")] is True
+    assert params[param_key("strip", 5, "A1")] is True
+    assert param_key("strip", 5, "B2") not in params
+
+
+@pytest.mark.parametrize("doc", [
+    {"version": 3},
+    {"version": 2, "kind": "potato"},
+    {"version": 3, "kind": "basic", "strips": {"gain_mask": 0, "gain": [0.0] * 3, "mute_mask": 0, "mute": 0,
+                                               "routing_mask": [0] * 3, "routing": [0] * 3},
+     "buses": {"gain_mask": 0, "gain": [0.0] * 2, "mute": 0}},
+    {"version": 2, "kind": "banana", "strips": {"mask": 1, "gain": [0.0], "mute": 0, "routing": [0]},
+     "buses": {"mask": 0, "gain": [0.0] * 5, "mute": 0}},
+    {"version": 2, "kind": "basic", "strips": {"mask": 1 << 3, "gain": [0.0] * 3, "mute": 0, "routing": [0] * 3},
+     "buses": {"mask": 0, "gain": [0.0] * 2, "mute": 0}},
+])
+def test_invalid_documents_are_rejected(doc):
+    with pytest.raises(PresetFormatError):
+        preset_format.decode(doc)
+
+
+def test_truncated_binary_is_rejected():
+    data = preset_format.dumps(full_preset("potato"), "potato", binary=True)
+    with pytest.raises(PresetFormatError):
+        preset_format.loads(data[:-1])
+
+
+def test_binary_presets_save_and_load(tmp_path):
+    params = {param_key("strip", 7, "gain"): -12.5, param_key("bus", 2, "mute"): True}
+    path = tmp_path / "scene.vmp"
+    PresetManager.write_preset(params, path)
+    assert path.read_bytes().startswith(preset_format.BINARY_MAGIC)
+    loaded = PresetManager.read_preset(path)
+    assert loaded[param_key("strip", 7, "gain")] == -12.5
+    assert loaded[param_key("bus", 2, "mute")] is True
@@ -0,0 +1,67 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets.preset_library import PresetLibrary
+from widgets.preset_manager import PresetManager
+from widgets.params import param_key
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def write(path, gain):
+    PresetManager.write_preset({param_key("strip", 5, "gain"): gain}, path)
+
+
+def test_index_and_incremental_rescan(tmp_path):
+    for i in range(3):
+        write(tmp_path / f"scene{i}.json", -i)
+    library = PresetLibrary(tmp_path)
+    assert library.names() == ["scene0", "scene1", "scene2"]
+    assert library.get("scene2")[param_key("strip", 5, "gain")] == -2.0
+    assert library.parses == 3
+
+    # Nothing changed: nothing is parsed again
+    assert library.rescan() == 0
+    assert library.parses == 3
+
+    write(tmp_path / "scene3.json", -3)
+    os.remove(tmp_path / "scene0.json")
+    assert library.rescan() == 2
+    assert library.parses == 4
+    assert library.names() == ["scene1", "scene2", "scene3"]
+
+
+def test_missing_directory_is_empty_until_created(tmp_path):
+    directory = tmp_path / "presets"
+    library = PresetLibrary(directory)
+    assert len(library) == 0
+    directory.mkdir()
+    write(directory / "live.json", -6)
+    library.rescan()
+    assert library.names() == ["live"]
+    assert str(directory) in library.watcher.directories()
+
+
+def test_same_stem_in_both_formats(tmp_path):
+    write(tmp_path / "Live.json", -1)
+    write(tmp_path / "Live.vmp", -2)
+    library = PresetLibrary(tmp_path)
+    assert library.names() == ["Live.json", "Live.vmp"]
+    assert library.get("Live.vmp")[param_key("strip", 5, "gain")] == -2.0
+    os.remove(tmp_path / "Live.vmp")
+    library.rescan()
+    assert library.names() == ["Live"]
+    assert library.get("Live")[param_key("strip", 5, "gain")] == -1.0
+
+
+def test_invalid_files_are_skipped(tmp_path):
+    write(tmp_path / "good.json", -1)
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "empty.vmp").write_bytes(b"")
+    library = PresetLibrary(tmp_path)
+    assert library.names() == ["good"]
+    assert library.get("broken") is None
+    assert library.rescan() == 0
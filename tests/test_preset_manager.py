@@ -37,3 +37,23 @@ def test_save_and_load_preset(tmp_path):
     assert vm.strip[STRIP_INDICES[0]].gain == -5
     assert vm.strip[STRIP_INDICES[0]].mute is True
     assert vm.strip[STRIP_INDICES[0]].A1 is True
+
+
+def test_load_preset_only_writes_changes(tmp_path):
+    vm = DummyVM()
+    idx = STRIP_INDICES[1]
+    vm.strip[idx].gain = -5
+    vm.strip[idx].B1 = True
+    file_path = tmp_path / "preset.json"
+    PresetManager.save_preset(vm, file_path)
+
+    vm.strip[idx].B1 = False
+    vm.strip[idx].A2 = True
+    diff = PresetManager.load_preset(vm, file_path, dry_run=True)
+    assert diff == {f"strip[{idx}].B1": True, f"strip[{idx}].A2": False}
+    assert vm.strip[idx].B1 is False
+
+    scripts = []
+    vm.sendtext = scripts.append
+    PresetManager.load_preset(vm, file_path)
+    assert scripts == [f"Strip[{idx}].A2=0;Strip[{idx}].B1=1;"]
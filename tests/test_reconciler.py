@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.reconciler import Reconciler
+from widgets.vm_worker import VMWorker
+from widgets.params import param_key
+from test_vm_worker import DummyVM
+
+
+class CountingVM(DummyVM):
+    """Counts strip attribute reads made through the reconciler."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        vm = self
+
+        class Strip(type(self.strip[0])):
+            def __getattribute__(self, name):
+                if name in ("gain", "mute"):
+                    vm.reads += 1
+                return object.__getattribute__(self, name)
+
+        self.strip = [Strip() for _ in range(8)]
+
+
+def test_drift_corrected_in_one_batched_pass():
+    vm = CountingVM()
+    reconciler = Reconciler()
+    for idx in (5, 6, 7):
+        reconciler.hold(param_key("strip", idx, "gain"), 0.0, deadline=10.0)
+    vm.strip[6].gain = -12.0
+    held = reconciler.reconcile(vm, now=1.0)
+    assert len(held) == 3
+    assert vm.reads == 3
+    assert vm.strip[6].gain == 0.0
+    assert reconciler.corrections == 1
+
+
+def test_targets_expire_at_deadline():
+    vm = DummyVM()
+    reconciler = Reconciler()
+    reconciler.hold(param_key("strip", 5, "mute"), True, deadline=2.0)
+    reconciler.reconcile(vm, now=1.0)
+    assert vm.strip[5].mute is True
+    vm.strip[5].mute = False
+    assert reconciler.reconcile(vm, now=3.0) == {}
+    assert vm.strip[5].mute is False
+    assert not reconciler.pending()
+
+
+def test_worker_holds_applied_values_until_user_writes():
+    vm = DummyVM()
+    worker = VMWorker(vm, reconcile_interval_ms=0)
+    key = param_key("strip", 5, "gain")
+    worker.apply({key: 0.0}, hold_ms=10000)
+    worker.tick()
+    # Voicemeeter bounces the value back; the next pass restores it
+    vm.strip[5].gain = -20.0
+    assert worker.tick() is not None
+    assert vm.strip[5].gain == 0.0
+    # A user write ends the hold
+    worker.submit(key, -6.0)
+    worker.tick()
+    assert not worker.reconciler.pending()
+    assert vm.strip[5].gain == -6.0
+
+
+def test_worker_apply_accepts_state_dependent_function():
+    vm = DummyVM()
+    worker = VMWorker(vm, idle_dirty_interval_ms=0)
+    worker.apply(lambda vm, idx: {param_key("strip", idx, "mute"): not vm.strip[idx].mute}, 7)
+    worker.tick()
+    assert vm.strip[7].mute is True
+    assert worker.take_params() == {param_key("strip", 7, "mute"): True}
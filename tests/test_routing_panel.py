@@ -5,6 +5,7 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from widgets.constants import STRIP_INDICES
 from widgets.routing_panel import RoutingPanel
 from PyQt5 import QtWidgets
 
@@ -15,7 +16,7 @@ class DummyStrip:
 
 class DummyVM:
     def __init__(self):
-        self.strip = [DummyStrip(), DummyStrip(), DummyStrip()]
+        self.strip = [DummyStrip() for _ in range(8)]
 
 class TestRoutingPanel(unittest.TestCase):
     def setUp(self):
@@ -25,13 +26,13 @@ class TestRoutingPanel(unittest.TestCase):
 
     def test_button_count(self):
         # Should have 3 strips with 8 buttons each
-        self.assertEqual(len(self.panel.buttons), 3)
+        self.assertEqual(sorted(self.panel.buttons), STRIP_INDICES)
         for strip_idx in self.panel.buttons:
             self.assertEqual(len(self.panel.buttons[strip_idx]), 8)
 
     def test_toggle_output(self):
         # Test toggling for first strip
-        strip_idx = 0
+        strip_idx = STRIP_INDICES[0]
         output = "A1"
         self.panel._toggle_output(strip_idx, output, True)
         self.assertTrue(getattr(self.vm.strip[strip_idx], output))
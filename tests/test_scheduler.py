@@ -0,0 +1,55 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.scheduler import RefreshScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_scheduler():
+    applied = []
+    clock = FakeClock()
+    scheduler = RefreshScheduler(applied.append, active_ms=50, idle_ms=250,
+                                 hidden_ms=0, silence_ms=2000, clock=clock)
+    return scheduler, applied, clock
+
+
+def test_visibility_starts_and_stops_refresh():
+    scheduler, applied, _ = make_scheduler()
+    scheduler.set_visible(True)
+    scheduler.set_visible(False)
+    assert applied == [50, 0]
+
+
+def test_backs_off_after_sustained_silence():
+    scheduler, applied, clock = make_scheduler()
+    scheduler.set_visible(True)
+    scheduler.record_tick(-60)
+    clock.now = 1.0
+    scheduler.record_tick(-60)
+    assert scheduler.interval == 50
+    clock.now = 2.5
+    scheduler.record_tick(-60)
+    assert scheduler.interval == 250
+    # Any signal brings the meters back to full rate
+    scheduler.record_tick(-20)
+    assert applied == [50, 250, 50]
+
+
+def test_stats_count_wakeups():
+    scheduler, _, clock = make_scheduler()
+    scheduler.set_visible(True)
+    for _ in range(10):
+        scheduler.record_tick(-10, 0.001)
+    clock.now = 1.0
+    stats = scheduler.stats()
+    assert stats["wakeups"] == 10
+    assert abs(stats["busy_ms"] - 10) < 1e-6
@@ -0,0 +1,148 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets import simulator
+from widgets.simulator import SimulatedVM, EngineStopped
+from widgets.combined_panel import CombinedControlPanel
+from widgets.constants import STRIP_INDICES
+from widgets.levels import LevelSnapshot, STRIP_PREFADER, STRIP_POSTFADER, STRIP_POSTMUTE
+from widgets.params import param_key, read_params, write_params, strip_keys
+from widgets.preset_manager import PresetManager
+from widgets.vm_worker import VMWorker
+
+
+class TestSimulatedVM(unittest.TestCase):
+    def test_parameters_match_kind(self):
+        vm = SimulatedVM("banana")
+        self.assertEqual(vm.kind.name, "banana")
+        self.assertEqual((len(vm.strip), len(vm.bus)), (5, 5))
+        vm.strip[3].gain = -6
+        vm.strip[3].B2 = 1
+        self.assertEqual(vm.strip[3].gain, -6.0)
+        self.assertIs(vm.strip[3].B2, True)
+        # Outputs the kind does not have behave like voicemeeterlib's
+        with self.assertRaises(AttributeError):
+            vm.strip[3].B3
+        self.assertNotIn(param_key("strip", 3, "B3"), read_params(vm, strip_keys(3)))
+        with self.assertRaises(ValueError):
+            SimulatedVM("tomato")
+
+    def test_sendtext_applies_scripts(self):
+        vm = SimulatedVM()
+        write_params(vm, {"strip[5].gain": -12.5, "strip[5].A1": True, "bus[0].mute": True})
+        self.assertEqual(vm.calls["sendtext"], 1)
+        self.assertEqual(vm.strip[5].gain, -12.5)
+        self.assertTrue(vm.strip[5].A1)
+        self.assertTrue(vm.bus[0].mute)
+        with self.assertRaises(ValueError):
+            vm.sendtext("Strip[5].Pan=1;")
+
+    def test_dirty_flag_reports_changes_once(self):
+        vm = SimulatedVM()
+        self.assertFalse(vm.pdirty)
+        vm.set_external("strip[6].mute", True)
+        self.assertTrue(vm.pdirty)
+        self.assertFalse(vm.pdirty)
+        self.assertEqual(vm.calls["pdirty"], 3)
+        self.assertEqual(vm.calls["set"], 0)
+
+    def test_levels_follow_gain_mute_and_routing(self):
+        vm = SimulatedVM(generator=simulator.constant(-20.0))
+        vm.strip[5].gain = -10
+        first = 5 * 2
+        self.assertAlmostEqual(vm.strip[5].levels.prefader[0], -20.0)
+        self.assertAlmostEqual(vm.strip[5].levels.postfader[0], -30.0)
+        self.assertEqual(len(vm.strip[5].levels.postmute), 8)
+        self.assertEqual(len(vm.strip[0].levels.postmute), 2)
+        vm.strip[5].mute = True
+        self.assertEqual(vm.get_level(STRIP_POSTMUTE, first), 0.0)
+        self.assertGreater(vm.get_level(STRIP_POSTFADER, first), 0.0)
+        # Buses carry the loudest routed strip
+        self.assertEqual(vm.bus[0].levels.all[0], -200.0)
+        vm.strip[6].A1 = True
+        vm.bus[0].gain = -3
+        self.assertAlmostEqual(vm.bus[0].levels.all[0], -23.0)
+        vm.bus[0].mute = True
+        self.assertEqual(vm.bus[0].levels.all[0], -200.0)
+
+    def test_generators_vary_over_time(self):
+        now = [0.0]
+        vm = SimulatedVM(generator=simulator.sine(period_s=1.0), clock=lambda: now[0])
+        first = vm.get_level(STRIP_PREFADER, 0)
+        now[0] = 0.25
+        self.assertNotEqual(vm.get_level(STRIP_PREFADER, 0), first)
+        vm.set_generator(simulator.noise(seed=1))
+        again = SimulatedVM(generator=simulator.noise(seed=1))
+        self.assertEqual(vm.get_level(STRIP_PREFADER, 0), again.get_level(STRIP_PREFADER, 0))
+
+    def test_latency_and_counters(self):
+        vm = SimulatedVM(latency={"sendtext": 0.02})
+        start = time.perf_counter()
+        vm.strip[5].gain = -1
+        vm.sendtext("Strip[5].Gain=-2;")
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02)
+        self.assertEqual(vm.calls["set"], 1)
+        self.assertEqual(vm.param_writes["strip[5].gain"], 2)
+        vm.reset_counters()
+        self.assertFalse(vm.calls)
+
+    def test_stopped_engine_raises(self):
+        with SimulatedVM() as vm:
+            self.assertTrue(vm.logged_in)
+            vm.stop()
+            with self.assertRaises(EngineStopped):
+                vm.strip[5].gain
+            vm.start()
+            vm.strip[5].gain = -1
+        self.assertFalse(vm.logged_in)
+
+
+class TestSimulatedSession(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def test_panel_and_worker_on_simulator(self):
+        vm = SimulatedVM(generator=simulator.constant(-6.0))
+        worker = VMWorker(vm)
+        panel = CombinedControlPanel(worker)
+        panel.volume_panel.scheduler.set_visible(True)
+        strip_idx = STRIP_INDICES[0]
+        # A change made in Voicemeeter itself reaches the panel
+        vm.set_external(param_key("strip", strip_idx, "gain"), -15.0)
+        worker.tick(time.monotonic() + 1)
+        self.assertEqual(panel.volume_panel.sliders[strip_idx].value(), -15)
+        self.assertTrue(all(m.level > -60 for m in panel.volume_panel.vu_meters.values()))
+        # A slider drag reaches Voicemeeter through the worker
+        vm.reset_counters()
+        slider = panel.volume_panel.sliders[strip_idx]
+        slider.setValue(-3)
+        slider.sliderReleased.emit()
+        worker.tick()
+        self.assertEqual(vm.params[param_key("strip", strip_idx, "gain")], -3.0)
+        self.assertEqual(vm.param_writes[param_key("strip", strip_idx, "gain")], 1)
+
+    def test_preset_load_uses_one_script(self):
+        vm = SimulatedVM()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scene.json")
+            PresetManager.write_preset({"strip[5].gain": -8.0, "strip[6].B1": True}, path)
+            self.assertEqual(PresetManager.load_preset(vm, path), {})
+        self.assertEqual(vm.calls["sendtext"], 1)
+        self.assertEqual(vm.strip[6].B1, True)
+
+    def test_level_snapshot_reads_each_channel_once(self):
+        vm = SimulatedVM(generator=simulator.constant(-12.0))
+        snapshot = LevelSnapshot(vm, strips=STRIP_INDICES, buses=[0])
+        vm.reset_counters()
+        snapshot.refresh()
+        self.assertEqual(vm.calls["get_level"], 2 * (len(STRIP_INDICES) + 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
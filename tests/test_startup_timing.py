@@ -0,0 +1,36 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets.startup_timing import StartupTimer, process_start_time
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_phases_are_logged(tmp_path):
+    log = tmp_path / "startup.jsonl"
+    timer = StartupTimer(log_path=str(log), origin=0.0)
+    timer.mark("tray_visible")
+    timer.mark("tray_visible")
+
+    widget = QtWidgets.QWidget()
+    timer.mark("first_click")
+    timer.watch_paint(widget)
+    widget.show()
+    widget.grab()
+    widget.hide()
+    assert "panel_painted" in timer.marks
+
+    records = [json.loads(line) for line in log.read_text().splitlines()]
+    assert [r["phase"] for r in records] == ["tray", "first_click"]
+    assert records[0]["tray_visible_ms"] > 0
+    assert records[1]["click_to_paint_ms"] >= 0
+    assert records[1]["panel_prebuilt"] is False
+
+
+def test_fallback_origin_without_psutil(monkeypatch):
+    monkeypatch.setitem(sys.modules, "psutil", None)
+    assert process_start_time(12.5) == 12.5
@@ -0,0 +1,89 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets.state_store import StateStore, DirectBackend
+from widgets.vm_worker import VMWorker
+from widgets.params import param_key
+from test_vm_worker import DummyVM
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+GAIN = param_key("strip", 5, "gain")
+MUTE = param_key("strip", 5, "mute")
+
+
+class CountingVM(DummyVM):
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def __getattribute__(self, name):
+        if name == "strip":
+            object.__setattr__(self, "reads", object.__getattribute__(self, "reads") + 1)
+        return object.__getattribute__(self, name)
+
+
+def make_store():
+    vm = DummyVM()
+    worker = VMWorker(vm)
+    store = StateStore(worker, worker.param_keys)
+    changes = []
+    store.changed.connect(changes.append)
+    return vm, worker, store, changes
+
+
+def test_refresh_mirrors_every_parameter_in_one_batch():
+    vm, worker, store, changes = make_store()
+    vm.strip[5].gain = -3.0
+    store.refresh()
+    worker.tick()
+    assert store.snapshot() == {key: store.get(key) for key in worker.param_keys}
+    assert store.get(GAIN) == -3.0
+    assert store.version == 1
+    assert len(changes) == 1
+
+
+def test_only_changed_keys_are_emitted():
+    vm, worker, store, changes = make_store()
+    store.refresh()
+    worker.tick()
+    version = store.version
+    store.update({GAIN: 0.0, MUTE: True})
+    assert changes[-1] == {MUTE: True}
+    assert store.changed_since(version) == {MUTE: True}
+    store.update({MUTE: True})
+    assert store.version == version + 1
+
+
+def test_writes_update_mirror_and_reach_voicemeeter():
+    vm, worker, store, _ = make_store()
+    store.set(GAIN, -9.0)
+    store.apply({MUTE: True})
+    assert store.get(GAIN) == -9.0
+    assert store.get(MUTE) is True
+    worker.tick()
+    assert vm.strip[5].gain == -9.0
+    assert vm.strip[5].mute is True
+
+
+def test_reads_come_from_the_mirror():
+    vm = CountingVM()
+    keys = [GAIN, MUTE]
+    store = StateStore(DirectBackend(vm, keys), keys)
+    store.refresh()
+    reads = vm.reads
+    for _ in range(100):
+        store.get(GAIN)
+        store.snapshot()
+    assert vm.reads == reads
+
+
+def test_diff_against_mirror():
+    vm, worker, store, _ = make_store()
+    store.refresh()
+    worker.tick()
+    preset = {GAIN: 0.05, MUTE: True, param_key("strip", 9, "mute"): True}
+    assert store.diff(preset) == {MUTE: True, param_key("strip", 9, "mute"): True}
@@ -0,0 +1,51 @@
+import unittest
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets import theme
+from widgets.constants import STRIP_INDICES
+from widgets.combined_panel import CombinedControlPanel
+from widgets.vm_worker import VMWorker
+from test_vm_worker import DummyVM
+
+
+class TestTheme(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def test_stylesheets_are_compiled_once(self):
+        for name, colors in theme.THEMES.items():
+            sheet = theme.stylesheet(name)
+            self.assertIs(sheet, theme.stylesheet(name))
+            self.assertIn(colors["window"], sheet)
+            self.assertNotIn("$", sheet)
+
+    def test_unknown_theme_is_rejected(self):
+        with self.assertRaises(ValueError):
+            theme.apply_theme(QtWidgets.QWidget(), "neon")
+
+    def test_panel_has_single_stylesheet(self):
+        panel = CombinedControlPanel(VMWorker(DummyVM()))
+        self.assertEqual(panel.styleSheet(), theme.stylesheet(theme.DARK))
+        children = panel.findChildren(QtWidgets.QWidget)
+        self.assertTrue(children)
+        self.assertFalse([w for w in children if w.styleSheet()])
+        buttons = [b for row in panel.routing_panel.buttons.values() for b in row.values()]
+        self.assertTrue(all(b.property("variant") == "route" for b in buttons))
+
+    def test_switching_theme_keeps_widgets(self):
+        panel = CombinedControlPanel(VMWorker(DummyVM()))
+        before = panel.findChildren(QtWidgets.QWidget)
+        panel.set_theme(theme.LIGHT)
+        self.assertEqual(panel.theme, theme.LIGHT)
+        self.assertEqual(panel.styleSheet(), theme.stylesheet(theme.LIGHT))
+        self.assertEqual(panel.findChildren(QtWidgets.QWidget), before)
+        background, _ = theme.meter_colors(theme.LIGHT)
+        self.assertEqual(panel.volume_panel.vu_meters[STRIP_INDICES[0]].background, background)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.constants import STRIP_INDICES, STRIP_NAMES
+from widgets.topology import Topology, default_topology, load_topology
+
+
+class TestTopology(unittest.TestCase):
+    def test_kind_defaults(self):
+        potato = Topology("potato")
+        self.assertEqual(potato.strips, list(range(8)))
+        self.assertEqual(len(potato.outputs), 8)
+        self.assertEqual(potato.buses, [0, 1, 2, 3, 4])
+        self.assertEqual(potato.bus_name(4), "A5")
+        self.assertEqual(potato.pages(), [[0, 1, 2], [3, 4], [5, 6, 7]])
+        self.assertEqual(potato.default_page(), 2)
+        self.assertEqual(potato.page_title([5, 6, 7]), "Virtual 6-8")
+        banana = Topology("banana")
+        self.assertEqual(banana.outputs, ["A1", "A2", "A3", "B1", "B2"])
+        self.assertEqual(banana.strip_name(3), "Voicemeeter Input")
+        self.assertEqual(banana.strip_name(0), "Hardware Input 1")
+
+    def test_default_matches_original_strips(self):
+        topology = default_topology()
+        self.assertEqual(topology.strips, STRIP_INDICES)
+        self.assertEqual([topology.strip_name(idx) for idx in STRIP_INDICES], STRIP_NAMES)
+        self.assertEqual(topology.pages(), [STRIP_INDICES])
+        self.assertEqual(topology.buses, [])
+
+    def test_param_keys_follow_outputs(self):
+        topology = Topology("banana", strips=[3], outputs=["A1"], buses=[0])
+        self.assertEqual(topology.param_keys(), [
+            "strip[3].gain", "strip[3].mute", "strip[3].A1", "bus[0].gain", "bus[0].mute"])
+
+    def test_invalid_topology_is_rejected(self):
+        with self.assertRaises(ValueError):
+            Topology("basic", strips=[5])
+        with self.assertRaises(ValueError):
+            Topology("basic", outputs=["A3"])
+        with self.assertRaises(ValueError):
+            Topology("stereo")
+
+    def test_load_config(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "topology.json")
+            self.assertEqual(load_topology(path, "banana").strips, list(range(5)))
+            with open(path, "w") as fh:
+                json.dump({"strips": [6, 7], "names": {"7": "Music"}}, fh)
+            topology = load_topology(path)
+            self.assertEqual(topology.strips, [6, 7])
+            self.assertEqual(topology.strip_name(7), "Music")
+            with open(path, "w") as fh:
+                json.dump({"kind": "basic", "strips": [9]}, fh)
+            self.assertEqual(load_topology(path, "basic").strips, [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.params import read_params, write_params, strip_keys
+from widgets.simulator import SimulatedVM
+from widgets.tracing import TraceWriter, TracingVM, TracedError, read_trace, replay, summarize
+from widgets.vm_worker import VMWorker
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "session.vmt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def record(self, session):
+        writer = TraceWriter(self.path)
+        vm = TracingVM(SimulatedVM(), writer)
+        session(vm)
+        writer.close()
+        return read_trace(self.path)
+
+    def test_round_trip(self):
+        def session(vm):
+            vm.strip[5].gain = -6.5
+            vm.strip[5].gain
+            vm.strip[6].A1 = True
+            vm.pdirty
+            vm.get_level(2, 10)
+            vm.sendtext("Strip[7].Mute=1;")
+            self.assertEqual(vm.kind.name, "potato")
+            self.assertEqual(len(vm.strip), 8)
+        events = self.record(session)
+        self.assertEqual([(e.op, e.name) for e in events], [
+            ("set", "strip[5].gain"), ("get", "strip[5].gain"), ("set", "strip[6].A1"),
+            ("get", "pdirty"), ("call", "get_level"), ("call", "sendtext"), ("get", "kind.name"),
+        ])
+        self.assertEqual(events[1].value, -6.5)
+        self.assertIs(events[3].value, True)
+        self.assertEqual(events[4].args, (2, 10))
+        self.assertEqual(events[5].args, ("Strip[7].Mute=1;",))
+        self.assertTrue(all(b.t >= a.t for a, b in zip(events, events[1:])))
+
+    def test_app_calls_pass_through(self):
+        writer = TraceWriter(self.path)
+        sim = SimulatedVM()
+        vm = TracingVM(sim, writer)
+        worker = VMWorker(vm)
+        worker.set_interval(50)
+        worker.request_refresh()
+        worker.tick()
+        write_params(vm, {"strip[5].gain": -3.0})
+        self.assertEqual(sim.params["strip[5].gain"], -3.0)
+        self.assertEqual(read_params(vm, strip_keys(5))["strip[5].gain"], -3.0)
+        writer.close()
+        events = read_trace(self.path)
+        # Each level channel and parameter read is one event
+        self.assertEqual(sum(1 for e in events if e.name == "get_level"), sim.calls["get_level"])
+        self.assertEqual(sum(1 for e in events if e.op == "get" and e.name.startswith("strip")),
+                         sim.calls["get"])
+
+    def test_errors_are_recorded(self):
+        def session(vm):
+            vm._vm.stop()
+            with self.assertRaises(RuntimeError):
+                vm.strip[5].gain
+        events = self.record(session)
+        self.assertIsInstance(events[0].value, TracedError)
+
+    def test_replay_and_summary(self):
+        def session(vm):
+            vm.strip[5].gain = -10.0
+            vm.strip[5].gain
+            vm.strip[5].gain
+            vm.strip[5].gain = -12.0
+            vm.strip[5].gain
+        events = self.record(session)
+        target = SimulatedVM()
+        stats = replay(events, target, speed=0)
+        self.assertEqual(stats["events"], 5)
+        self.assertEqual((stats["mismatches"], stats["errors"]), (0, 0))
+        self.assertEqual(target.params["strip[5].gain"], -12.0)
+        summary = summarize(events)
+        self.assertEqual(summary["calls"]["get strip[5].gain"], 3)
+        self.assertEqual(summary["redundant_reads"], {"strip[5].gain": 1})
+
+    def test_replay_keeps_timing(self):
+        slept = []
+        events = self.record(lambda vm: vm.pdirty)
+        events = [events[0]._replace(t=2.0)]
+        replay(events, SimulatedVM(), speed=4.0, sleep=slept.append, clock=lambda: 0.0)
+        self.assertEqual(slept, [0.5])
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"nonsense")
+        with self.assertRaises(ValueError):
+            read_trace(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
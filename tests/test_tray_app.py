@@ -4,10 +4,12 @@ import os
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from PyQt5 import QtWidgets
+from PyQt5 import QtCore, QtWidgets
 
 sys.modules['voicemeeterlib'] = MagicMock()
 from main import TrayApp
+from widgets.constants import STRIP_INDICES
+from widgets.params import param_key
 
 class TestTrayApp(unittest.TestCase):
     def setUp(self):
@@ -15,7 +17,28 @@ class TestTrayApp(unittest.TestCase):
         self.vm = MagicMock()
         self.tray = TrayApp('tray_icon.ico', self.vm)
 
+    def tearDown(self):
+        self.close_tray(self.tray)
+
+    def close_tray(self, tray):
+        tray.worker.stop()
+        tray.prebuild_timer.stop()
+        if tray.control_panel is not None:
+            tray.control_panel.deleteLater()
+        tray.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+
+    def test_panel_is_built_lazily(self):
+        self.assertIsNone(self.tray.control_panel)
+        self.tray._position_panel = MagicMock()
+        self.tray.toggle_controls()
+        self.assertIsNotNone(self.tray.control_panel)
+        self.assertTrue(self.tray.control_panel.isVisible())
+        self.tray.toggle_controls()
+        self.assertFalse(self.tray.control_panel.isVisible())
+
     def test_controls_panel_toggle(self):
+        self.tray.ensure_control_panel()
         self.tray.control_panel.isVisible = MagicMock(return_value=False)
         self.tray.control_panel.show = MagicMock()
         self.tray.control_panel.update_controls = MagicMock()
@@ -24,6 +47,56 @@ class TestTrayApp(unittest.TestCase):
         self.tray.control_panel.show.assert_called_once()
         self.tray.control_panel.update_controls.assert_called_once()
 
+    def test_mute_all_uses_store(self):
+        keys = [param_key("strip", idx, "mute") for idx in STRIP_INDICES]
+        self.tray.store.update({key: False for key in keys})
+        self.tray.store.update({keys[0]: True})
+        self.tray.toggle_all_mutes()
+        self.assertTrue(all(self.tray.store.get(key) for key in keys))
+        self.tray.toggle_all_mutes()
+        self.assertFalse(any(self.tray.store.get(key) for key in keys))
+
+    def test_presets_submenu_switches_from_memory(self):
+        import tempfile
+        from widgets.preset_manager import PresetManager
+        with tempfile.TemporaryDirectory() as directory:
+            key = param_key("strip", STRIP_INDICES[0], "A1")
+            PresetManager.write_preset({key: True}, os.path.join(directory, "live.json"))
+            tray = TrayApp('tray_icon.ico', self.vm, preset_dir=directory)
+            tray.morph_ms = 0
+            actions = tray.presets_menu.actions()
+            self.assertEqual([a.text() for a in actions], ["live"])
+            actions[0].trigger()
+            self.assertTrue(tray.store.get(key))
+            self.close_tray(tray)
+
+    def test_theme_toggle_restyles_panel(self):
+        panel = self.tray.ensure_control_panel()
+        self.tray.toggle_theme()
+        self.assertEqual(panel.theme, "light")
+        self.assertTrue(self.tray.light_theme_action.isChecked())
+        self.tray.toggle_theme()
+        self.assertEqual(panel.theme, "dark")
+        self.assertIs(self.tray.control_panel, panel)
+
+    def test_dump_instrumentation(self):
+        import json
+        import tempfile
+        from widgets.instrumentation import INSTRUMENTS
+        # The worker's own reads would count too
+        self.tray.worker.stop()
+        with tempfile.TemporaryDirectory() as directory:
+            self.tray.instrumentation_file = os.path.join(directory, "instrumentation.json")
+            self.tray.toggle_instrumentation()
+            self.assertTrue(INSTRUMENTS.enabled)
+            INSTRUMENTS.count("vm.read", 3)
+            self.tray.dump_instrumentation()
+            self.tray.toggle_instrumentation()
+            self.assertFalse(INSTRUMENTS.enabled)
+            INSTRUMENTS.reset()
+            with open(self.tray.instrumentation_file) as f:
+                self.assertEqual(json.load(f)["counters"]["vm.read"], 3)
+
     def test_menu_actions(self):
         # Check that the menu actions are present
         actions = [a.text() for a in self.tray.contextMenu().actions() if a.text()]
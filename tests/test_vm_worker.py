@@ -0,0 +1,151 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.vm_worker import VMWorker
+from widgets.params import param_key
+from widgets.constants import STRIP_INDICES
+
+
+class DummyKind:
+    name = "potato"
+
+
+class DummyStrip:
+    def __init__(self):
+        self.gain = 0.0
+        self.mute = False
+        for label in ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]:
+            setattr(self, label, False)
+
+
+class DummyBus:
+    def __init__(self):
+        self.gain = 0.0
+        self.mute = False
+
+
+class DummyVM:
+    def __init__(self):
+        self.kind = DummyKind()
+        self.strip = [DummyStrip() for _ in range(8)]
+        self.bus = [DummyBus() for _ in range(8)]
+        self.level_calls = 0
+
+    def get_level(self, type_, index):
+        self.level_calls += 1
+        return 0.5
+
+
+def make_worker():
+    vm = DummyVM()
+    worker = VMWorker(vm)
+    signals = {"params": 0, "levels": 0}
+    worker.params_ready.connect(lambda: signals.__setitem__("params", signals["params"] + 1))
+    worker.levels_ready.connect(lambda: signals.__setitem__("levels", signals["levels"] + 1))
+    return vm, worker, signals
+
+
+def test_writes_applied_on_tick_in_order():
+    vm, worker, _ = make_worker()
+    key = param_key("strip", STRIP_INDICES[0], "gain")
+    worker.submit(key, -3.0)
+    worker.submit(key, -6.0)
+    assert vm.strip[STRIP_INDICES[0]].gain == 0.0
+    worker.tick()
+    assert vm.strip[STRIP_INDICES[0]].gain == -6.0
+
+
+def test_refresh_reports_only_changes():
+    vm, worker, signals = make_worker()
+    worker.request_refresh()
+    worker.tick()
+    first = worker.take_params()
+    assert first[param_key("strip", 5, "gain")] == 0.0
+    assert signals["params"] == 1
+
+    vm.strip[6].mute = True
+    worker.request_refresh()
+    worker.tick()
+    assert worker.take_params() == {param_key("strip", 6, "mute"): True}
+
+    worker.request_refresh()
+    worker.tick()
+    assert signals["params"] == 2
+
+
+def test_level_frames_coalesce_until_taken():
+    vm, worker, signals = make_worker()
+    worker.set_interval(50)
+    worker.tick(now=1.0)
+    worker.tick(now=2.0)
+    assert signals["levels"] == 1
+    frame = worker.take_levels()
+    assert frame.shape == (len(STRIP_INDICES), 2)
+    assert worker.take_levels() is None
+
+
+def test_params_only_read_when_engine_reports_dirty():
+    class DirtyVM(DummyVM):
+        dirty = False
+
+        @property
+        def pdirty(self):
+            dirty, self.dirty = self.dirty, False
+            return dirty
+
+    vm = DirtyVM()
+    worker = VMWorker(vm, dirty_interval_ms=0)
+    # Opening the panel does one full read, then only dirty checks
+    worker.set_interval(50)
+    worker.request_refresh()
+    worker.tick()
+    worker.take_params()
+    for _ in range(10):
+        worker.tick()
+    assert worker.param_reads == 1
+    assert worker.dirty_checks == 10
+
+    vm.strip[5].gain = -4.0
+    vm.dirty = True
+    worker.tick()
+    assert worker.param_reads == 2
+    assert worker.take_params() == {param_key("strip", 5, "gain"): -4.0}
+
+
+def test_paused_worker_does_not_poll():
+    vm, worker, signals = make_worker()
+    worker.tick()
+    assert vm.level_calls == 0
+    assert signals["levels"] == 0
+
+    worker = VMWorker(vm, idle_dirty_interval_ms=0)
+    assert worker.tick() is None
+
+
+def test_paused_worker_keeps_params_in_sync():
+    vm, worker, _ = make_worker()
+    worker.tick(now=0.0)
+    worker.take_params()
+    vm.strip[6].mute = True
+    # The dirty flag is only checked once per idle sync interval
+    worker.tick(now=worker.idle_dirty_interval / 2)
+    assert worker.take_params() == {}
+    worker.tick(now=worker.idle_dirty_interval)
+    assert worker.take_params() == {param_key("strip", 6, "mute"): True}
+
+
+def test_thread_runs_commands():
+    vm, worker, _ = make_worker()
+    worker.start()
+    try:
+        worker.submit(param_key("strip", 7, "A1"), True)
+        deadline = time.monotonic() + 2
+        while not vm.strip[7].A1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert vm.strip[7].A1 is True
+    finally:
+        worker.stop()
+    assert not worker.is_running()
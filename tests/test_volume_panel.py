@@ -5,6 +5,9 @@ import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from widgets import simulator
+from widgets.constants import STRIP_INDICES
+from widgets.simulator import SimulatedVM
 from widgets.volume_panel import VolumePanel
 from PyQt5 import QtWidgets
 
@@ -14,7 +17,7 @@ class DummyStrip:
 
 class DummyVM:
     def __init__(self):
-        self.strip = [DummyStrip(-10), DummyStrip(-20), DummyStrip(-30)]
+        self.strip = [DummyStrip(-10 * (i + 1)) for i in range(8)]
 
 class TestVolumePanel(unittest.TestCase):
     def setUp(self):
@@ -30,8 +33,9 @@ class TestVolumePanel(unittest.TestCase):
         for i, strip in enumerate(self.vm.strip):
             strip.gain = -5 * (i+1)
         self.panel.update_sliders()
-        for i, slider in enumerate(self.panel.sliders):
-            self.assertEqual(slider.value(), int(self.vm.strip[i].gain))
+        # The sliders control the configured strips, not strips 0-2
+        for strip_idx, slider in zip(STRIP_INDICES, self.panel.sliders):
+            self.assertEqual(slider.value(), int(self.vm.strip[strip_idx].gain))
 
     def test_extended_range(self):
         # Test that sliders support the extended range (-60 to +12dB)
@@ -39,5 +43,17 @@ class TestVolumePanel(unittest.TestCase):
             self.assertEqual(slider.minimum(), -60)
             self.assertEqual(slider.maximum(), 12)
 
+    def test_meters_show_batched_levels(self):
+        vm = SimulatedVM(generator=simulator.constant(-12.0))
+        panel = VolumePanel(vm)
+        panel.vu_timer.stop()
+        vm.strip[STRIP_INDICES[1]].mute = True
+        vm.reset_counters()
+        panel._update_vu_meters()
+        self.assertEqual(vm.calls["get_level"], 2 * len(STRIP_INDICES))
+        levels = [meter.level for meter in panel.vu_meters]
+        self.assertGreater(levels[0], -60)
+        self.assertEqual(levels[1], -60)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import MagicMock
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from widgets.vu_meter import VUMeter, meter_pixmaps
+from PyQt5 import QtWidgets, QtGui
+
+
+class TestVUMeter(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.meter = VUMeter()
+        self.meter.setFixedSize(20, 150)
+
+    def test_unchanged_segment_skips_repaint(self):
+        self.meter.update_level(-30)
+        self.meter.update = MagicMock()
+        # A fraction of a dB stays within the same segment
+        self.meter.update_level(-30.1)
+        self.meter.update.assert_not_called()
+        self.meter.update_level(0)
+        self.meter.update.assert_called_once()
+
+    def test_repaint_limited_to_changed_segments(self):
+        self.meter.update_level(-30)
+        self.meter.update = MagicMock()
+        self.meter.update_level(-20)
+        x, y, w, h = self.meter.update.call_args[0]
+        self.assertLessEqual(w, self.meter.width())
+        self.assertLess(h, self.meter.height() // 2)
+
+    def test_pixmaps_cached_per_size_and_colors(self):
+        bg, inactive = QtGui.QColor(20, 20, 20), QtGui.QColor(40, 40, 40)
+        first = meter_pixmaps(20, 150, bg, inactive)
+        self.assertIs(first, meter_pixmaps(20, 150, bg, inactive))
+        self.assertIsNot(first, meter_pixmaps(20, 150, bg, QtGui.QColor(60, 60, 60)))
+
+    def test_rendered_segments(self):
+        self.meter.update_level(-30)
+        image = self.meter.grab().toImage()
+        bottom = QtGui.QColor(image.pixel(10, self.meter.height() - 4))
+        top = QtGui.QColor(image.pixel(10, 10))
+        self.assertEqual(bottom, QtGui.QColor(0, 255, 0))
+        self.assertEqual(top, QtGui.QColor(40, 40, 40))
+
+    def test_stereo_peak_and_clip(self):
+        meter = VUMeter(channels=2)
+        meter.setFixedSize(20, 150)
+        meter.update_levels([-50, -50], peaks=[-50, -6], clipped=[False, True])
+        image = meter.grab().toImage()
+        left_x, right_x = 4, 14
+        self.assertEqual(QtGui.QColor(image.pixel(left_x, 2)), QtGui.QColor(20, 20, 20))
+        self.assertEqual(QtGui.QColor(image.pixel(right_x, 2)), QtGui.QColor(255, 0, 0))
+        peak_y = meter._split_y(meter.peak_segments[1]) + 1
+        self.assertEqual(QtGui.QColor(image.pixel(right_x, peak_y)), QtGui.QColor(255, 255, 0))
+        self.assertEqual(QtGui.QColor(image.pixel(left_x, peak_y)), QtGui.QColor(40, 40, 40))
+
+
+if __name__ == '__main__':
+    unittest.main()
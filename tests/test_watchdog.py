@@ -0,0 +1,63 @@
+import unittest
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets.watchdog import StallWatchdog
+
+
+class TestStallWatchdog(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.directory.name, "stalls.log")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_late_heartbeat_is_captured_and_logged(self):
+        now = [0.0]
+        watchdog = StallWatchdog(self.log_path, threshold_ms=500, clock=lambda: now[0])
+        watchdog.beat()
+        now[0] = 0.4
+        self.assertFalse(watchdog.check())
+        with watchdog.operation("load preset"):
+            now[0] = 0.6
+            self.assertTrue(watchdog.check())
+            self.assertFalse(watchdog.check())  # Reported once per stall
+        now[0] = 1.5
+        watchdog.beat()
+        stall, = watchdog.stalls
+        self.assertEqual(stall["operation"], "load preset")
+        self.assertAlmostEqual(stall["duration_ms"], 1500.0)
+        self.assertIn("test_late_heartbeat_is_captured_and_logged", stall["stack"])
+        watchdog.stop()
+        with open(self.log_path) as f:
+            log = f.read()
+        self.assertIn("GUI stall of 1500 ms in load preset", log)
+        self.assertIn("test_watchdog.py", log)
+
+    def test_blocked_event_loop_is_detected(self):
+        watchdog = StallWatchdog(threshold_ms=100, heartbeat_ms=20)
+        watchdog.start()
+        try:
+            with watchdog.operation("build control panel"):
+                time.sleep(0.3)
+            deadline = time.monotonic() + 1.0
+            while not watchdog.stalls and time.monotonic() < deadline:
+                self.app.processEvents()
+                time.sleep(0.01)
+        finally:
+            watchdog.stop()
+        stall, = watchdog.stalls
+        self.assertEqual(stall["operation"], "build control panel")
+        self.assertGreaterEqual(stall["duration_ms"], 250)
+        self.assertIn("time.sleep(0.3)", stall["stack"])
+
+
+if __name__ == '__main__':
+    unittest.main()
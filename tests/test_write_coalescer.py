@@ -0,0 +1,45 @@
+import unittest
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt5 import QtWidgets
+from widgets.write_coalescer import WriteCoalescer
+
+
+class TestWriteCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.writes = []
+        self.coalescer = WriteCoalescer(lambda key, value: self.writes.append((key, value)),
+                                        interval_ms=10)
+
+    def test_keeps_latest_value_per_key(self):
+        for value in range(20):
+            self.coalescer.set("strip[5].gain", float(-value))
+        self.coalescer.set("strip[6].gain", -3.0)
+        self.coalescer.flush()
+        self.assertEqual(self.writes, [("strip[5].gain", -19.0), ("strip[6].gain", -3.0)])
+        self.assertEqual(self.coalescer.requested, 21)
+        self.assertEqual(self.coalescer.written, 2)
+
+    def test_timer_flushes_once_per_frame(self):
+        for value in range(5):
+            self.coalescer.set("strip[5].gain", float(value))
+        deadline = time.monotonic() + 1
+        while not self.writes and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+        self.assertEqual(self.writes, [("strip[5].gain", 4.0)])
+
+    def test_discard_drops_pending_value(self):
+        self.coalescer.set("strip[5].gain", -10.0)
+        self.coalescer.discard("strip[5].gain")
+        self.coalescer.flush()
+        self.assertEqual(self.writes, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
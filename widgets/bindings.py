@@ -0,0 +1,72 @@
+"""Map parameter keys straight to the widgets that display them."""
+
+
+def _set_slider(slider, value):
+    # Don't fight the user while they are dragging
+    value = int(round(value))
+    if not slider.isSliderDown() and slider.value() != value:
+        slider.setValue(value)
+
+
+def _set_checked(button, value):
+    button.setChecked(bool(value))
+
+
+def _label_setter(template):
+    def set_text(label, value):
+        label.setText(template.format(int(round(value))))
+    return set_text
+
+
+def _tooltip_setter(template):
+    def set_tooltip(widget, value):
+        widget.setToolTip(template.format(int(round(value))))
+    return set_tooltip
+
+
+class Bindings:
+    """Push parameter values to the widgets bound to each key.
+
+    Each key holds a list of ``(widget, setter)`` pairs, so ``apply`` is one
+    dict lookup per changed key and never walks the widget tree. Widget
+    signals are blocked while a value is pushed, so store updates are never
+    written back to Voicemeeter.
+    """
+
+    def __init__(self):
+        self._targets = {}
+
+    def bind(self, key, widget, setter):
+        """Call ``setter(widget, value)`` whenever ``key`` changes."""
+        self._targets.setdefault(key, []).append((widget, setter))
+        return widget
+
+    def bind_slider(self, key, slider):
+        return self.bind(key, slider, _set_slider)
+
+    def bind_checkable(self, key, button):
+        return self.bind(key, button, _set_checked)
+
+    def bind_label(self, key, label, template="{}dB"):
+        return self.bind(key, label, _label_setter(template))
+
+    def bind_tooltip(self, key, widget, template):
+        return self.bind(key, widget, _tooltip_setter(template))
+
+    def keys(self):
+        return list(self._targets)
+
+    def widgets(self, key):
+        """Widgets bound to ``key``, in binding order."""
+        return [widget for widget, _ in self._targets.get(key, ())]
+
+    def apply(self, params):
+        """Push ``{key: value}`` to the bound widgets; unbound keys are skipped."""
+        targets = self._targets
+        for key, value in params.items():
+            for widget, setter in targets.get(key, ()):
+                blocked = widget.blockSignals(True)
+                try:
+                    setter(widget, value)
+                finally:
+                    widget.blockSignals(blocked)
@@ -1,89 +1,150 @@
+import time
 from PyQt5 import QtWidgets, QtCore, QtGui
-from .volume_panel import VolumePanel
-from .routing_panel import RoutingPanel
-from .constants import STRIP_INDICES, VU_UPDATE_INTERVAL_MS, AUTO_HIDE_DELAY_MS
+from .bindings import Bindings
+from .constants import AUTO_HIDE_DELAY_MS, BUS_COLUMN_WIDTH, LEVEL_MIN_DB
+from .debug_overlay import DebugOverlay
+from .instrumentation import INSTRUMENTS
+from .metering import MeterEngine
+from .params import param_key
+from .scheduler import RefreshScheduler
+from .state_store import StateStore
+from .theme import DEFAULT_THEME, apply_theme, meter_colors, set_variant
+from .topology import default_topology
+from .vu_meter import VUMeter
+from .write_coalescer import WriteCoalescer
 
 class CombinedControlPanel(QtWidgets.QWidget):
-    def __init__(self, vm):
+    """Routing and volume controls fed by a ``VMWorker``.
+
+    The panel never calls into Voicemeeter itself: it reads and writes
+    parameters through a ``StateStore`` synced by the worker, and only takes
+    level frames from the worker directly. Store changes reach the widgets
+    through one ``Bindings`` table shared by both sub-panels.
+
+    The strips shown come from a ``Topology``. Large ones are split into
+    pages; a page's widgets are only created the first time it is shown.
+    The topology's buses get faders of their own beside the strips.
+    """
+    visibility_changed = QtCore.pyqtSignal(bool)
+
+    def __init__(self, worker, store=None, theme=DEFAULT_THEME, topology=None):
         super().__init__()
-        self.vm = vm
+        self.worker = worker
+        self.store = store if store is not None else StateStore(worker, worker.param_keys)
+        self.topology = topology if topology is not None else default_topology()
+        self.bindings = Bindings()
+        pages = self.topology.pages()
         self.setWindowFlags(
             QtCore.Qt.Tool |
             QtCore.Qt.FramelessWindowHint |
             QtCore.Qt.WindowStaysOnTopHint
         )
-        self.setFixedSize(520, 650)
+        bus_width = BUS_COLUMN_WIDTH * len(self.topology.buses) + 20 if self.topology.buses else 0
+        self.setFixedSize(520 + bus_width, 650 if len(pages) < 2 else 685)
         self.setAttribute(QtCore.Qt.WA_ShowWithoutActivating)  # Don't steal focus
         
         # Set up auto-hide timer for mouse leave detection
         self.hide_timer = QtCore.QTimer()
         self.hide_timer.setSingleShot(True)
         self.hide_timer.timeout.connect(self.hide)
+        INSTRUMENTS.count_fires(self.hide_timer, "timer.auto_hide")
         
         # Install event filter to track mouse events
         self.installEventFilter(self)
         
-
-        
-        # Apply dark theme
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                font-family: Segoe UI;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QGroupBox {
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #ffffff;
-            }
-            QFrame[frameShape="4"] {
-                color: #555555;
-            }
-        """)
-        
         main_layout = QtWidgets.QVBoxLayout()
         
         # Main title
-        main_title = QtWidgets.QLabel("VMControl - Virtual Inputs")
+        if len(pages) == 1:
+            group = self.topology.page_title(pages[0]).split()[0]
+            main_title = QtWidgets.QLabel(f"VMControl - {group} Inputs")
+        else:
+            main_title = QtWidgets.QLabel("VMControl")
         main_title.setAlignment(QtCore.Qt.AlignCenter)
-        main_title.setStyleSheet("font-weight: bold; font-size: 16px; margin: 10px; color: #ffffff;")
+        set_variant(main_title, "title")
         main_layout.addWidget(main_title)
+        strips_layout = QtWidgets.QVBoxLayout()
+
+        # Page selector, only needed when the strips don't fit on one page
+        self.page_bar = QtWidgets.QTabBar()
+        for page in pages:
+            self.page_bar.addTab(self.topology.page_title(page))
+        self.page_bar.setVisible(len(pages) > 1)
+        strips_layout.addWidget(self.page_bar)
         
         # Create routing panel (above)
-        self.routing_panel = RoutingPanelEmbedded(vm)
-        main_layout.addWidget(self.routing_panel)
+        self.routing_panel = RoutingPanelEmbedded(self.store, self.bindings, self.topology)
+        strips_layout.addWidget(self.routing_panel)
         
         # Add separator
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.HLine)
         separator.setFrameShadow(QtWidgets.QFrame.Sunken)
-        separator.setStyleSheet("color: #555555;")
-        main_layout.addWidget(separator)
+        strips_layout.addWidget(separator)
         
         # Create volume panel (below)
-        self.volume_panel = VolumePanelEmbedded(vm)
-        main_layout.addWidget(self.volume_panel)
+        self.volume_panel = VolumePanelEmbedded(worker, self.store, self.bindings, self.topology)
+        strips_layout.addWidget(self.volume_panel)
+
+        # Output buses on the right, metered from the same level frames
+        body_layout = QtWidgets.QHBoxLayout()
+        body_layout.addLayout(strips_layout)
+        self.bus_panel = None
+        if self.topology.buses:
+            bus_separator = QtWidgets.QFrame()
+            bus_separator.setFrameShape(QtWidgets.QFrame.VLine)
+            bus_separator.setFrameShadow(QtWidgets.QFrame.Sunken)
+            body_layout.addWidget(bus_separator)
+            self.bus_panel = BusPanelEmbedded(self.store, self.bindings, self.topology)
+            self.bus_panel.setFixedWidth(BUS_COLUMN_WIDTH * len(self.topology.buses))
+            self.volume_panel.add_meters("bus", self.bus_panel.vu_meters)
+            body_layout.addWidget(self.bus_panel)
+        main_layout.addLayout(body_layout)
         
         self.setLayout(main_layout)
-        
+
+        # One application stylesheet for the whole panel, applied once
+        self.theme = None
+        self.set_theme(theme)
+
+        # Hidden instrumentation overlay
+        self.debug_overlay = DebugOverlay(self)
+        QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self, self.toggle_debug_overlay)
+
+        # A bound method, so the connection goes away with the panel
+        self.store.changed.connect(self.apply_params)
+        if pages:
+            self.page_bar.setCurrentIndex(self.topology.default_page())
+            self.show_page(self.page_bar.currentIndex())
+        self.page_bar.currentChanged.connect(self.show_page)
+
+    def show_page(self, index):
+        """Show page ``index`` of both sub-panels, building it if needed"""
+        self.routing_panel.show_page(index)
+        self.volume_panel.show_page(index)
+        
+    def toggle_debug_overlay(self):
+        """Show or hide the live instrumentation overlay"""
+        self.debug_overlay.toggle()
+
+    def set_theme(self, name):
+        """Restyle the panel in place; no widget is rebuilt"""
+        if name == self.theme:
+            return
+        apply_theme(self, name)
+        self.theme = name
+        self.volume_panel.set_meter_colors(*meter_colors(name))
+        if self.bus_panel is not None:
+            self.bus_panel.set_meter_colors(*meter_colors(name))
+
+    def apply_params(self, params):
+        """Update the widgets from parameter changes in the store"""
+        self.bindings.apply(params)
+
     def update_controls(self):
-        """Update both routing and volume controls"""
-        self.routing_panel.update_routing_states()
-        self.volume_panel.update_sliders()
-        
+        """Ask the store to re-read routing and volume settings"""
+        self.store.refresh()
+
     def focusOutEvent(self, event):
         """Hide panel when it loses focus"""
         self.hide()
@@ -100,391 +161,345 @@ class CombinedControlPanel(QtWidgets.QWidget):
         return super().eventFilter(obj, event)
         
     def showEvent(self, event):
-        """Reset auto-hide timer when window is shown"""
+        """Reset auto-hide timer and resume metering when window is shown"""
         self.hide_timer.stop()
+        self.volume_panel.scheduler.set_visible(True)
         super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event):
+        """Stop metering while the panel is hidden"""
+        self.volume_panel.scheduler.set_visible(False)
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
+
+class StripPages(QtWidgets.QStackedWidget):
+    """Pages of strip columns, each built the first time it is shown"""
+    def __init__(self, pages, build_column):
+        super().__init__()
+        self.pages = pages
+        self.build_column = build_column
+        self.built = set()
+        for _ in pages:
+            self.addWidget(QtWidgets.QWidget())
+
+    def show_page(self, index):
+        """Switch to page ``index``; return True if it was just built"""
+        built = index not in self.built
+        if built:
+            layout = QtWidgets.QHBoxLayout(self.widget(index))
+            layout.setContentsMargins(0, 0, 0, 0)
+            for strip_idx in self.pages[index]:
+                self.build_column(layout, strip_idx)
+            self.built.add(index)
+        self.setCurrentIndex(index)
+        return built
 
 
 class RoutingPanelEmbedded(QtWidgets.QWidget):
     """Embedded routing panel without window decorations"""
-    def __init__(self, vm):
+    def __init__(self, store, bindings=None, topology=None):
         super().__init__()
-        self.vm = vm
+        self.store = store
+        self.bindings = bindings if bindings is not None else Bindings()
+        self.topology = topology if topology is not None else default_topology()
+        self.buttons = {}
         
         main_layout = QtWidgets.QVBoxLayout()
         
         # Title
         title = QtWidgets.QLabel("Output Routing")
         title.setAlignment(QtCore.Qt.AlignCenter)
-        title.setStyleSheet("font-weight: bold; font-size: 14px; margin: 5px; color: #ffffff;")
+        set_variant(title, "section")
         main_layout.addWidget(title)
         
-        # Create routing matrix with vertical alignment
-        routing_layout = QtWidgets.QHBoxLayout()
-        self.buttons = {}
-        strip_names = ["Voicemeeter Input", "Voicemeeter AUX", "VAIO3"]
-        outputs = ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]
-        
-        # Use the configured strip indices for Voicemeeter Potato
-        strip_indices = STRIP_INDICES
-        
-        for i, (strip_name, strip_idx) in enumerate(zip(strip_names, strip_indices)):
-            # Create group box for each virtual input
-            group_box = QtWidgets.QGroupBox(strip_name)
-            group_box.setFixedWidth(150)
-            group_layout = QtWidgets.QVBoxLayout()
+        # Routing matrix, one column of outputs per strip
+        self.pages = StripPages(self.topology.pages(), self._build_column)
+        main_layout.addWidget(self.pages)
+        self.setLayout(main_layout)
+
+    def show_page(self, index):
+        """Show a page of strips, seeding new buttons from the store"""
+        if self.pages.show_page(index):
+            keys = [param_key("strip", strip_idx, output)
+                    for strip_idx in self.pages.pages[index] for output in self.topology.outputs]
+            self.bindings.apply(self.store.snapshot(keys))
+
+    def _build_column(self, layout, strip_idx):
+        """Add the output buttons of one strip"""
+        group_box = QtWidgets.QGroupBox(self.topology.strip_name(strip_idx))
+        group_box.setFixedWidth(150)
+        group_layout = QtWidgets.QVBoxLayout()
+        
+        # Add buttons for each output in vertical arrangement
+        strip_buttons = {}
+        for output in self.topology.outputs:
+            btn = QtWidgets.QPushButton(output)
+            btn.setCheckable(True)
+            btn.setFixedSize(120, 25)
             
-            # Add buttons for each output in vertical arrangement
-            strip_buttons = {}
-            for output in outputs:
-                btn = QtWidgets.QPushButton(output)
-                btn.setCheckable(True)
-                btn.setFixedSize(120, 25)
-                
-                # Set initial state from Voicemeeter (using correct strip index)
-                try:
-                    current_state = getattr(self.vm.strip[strip_idx], output)
-                    btn.setChecked(current_state)
-                except (IndexError, AttributeError):
-                    btn.setChecked(False)
-                
-                # Style the button for dark mode
-                self._style_button(btn)
-                
-                # Connect signal with correct strip index
-                btn.clicked.connect(lambda checked, strip=strip_idx, out=output: self._toggle_output(strip, out, checked))
-                
-                group_layout.addWidget(btn)
-                strip_buttons[output] = btn
+            set_variant(btn, "route")
+            self.bindings.bind_checkable(param_key("strip", strip_idx, output), btn)
             
-            self.buttons[strip_idx] = strip_buttons
-            group_box.setLayout(group_layout)
-            routing_layout.addWidget(group_box)
+            # Connect signal with correct strip index
+            btn.clicked.connect(lambda checked, strip=strip_idx, out=output: self._toggle_output(strip, out, checked))
+            
+            group_layout.addWidget(btn)
+            strip_buttons[output] = btn
+        group_layout.addStretch()
         
-        main_layout.addLayout(routing_layout)
-        self.setLayout(main_layout)
-
-    def _style_button(self, btn):
-        """Apply dark mode styling to routing buttons"""
-        style = """
-        QPushButton {
-            border: 2px solid #666666;
-            border-radius: 4px;
-            background-color: #404040;
-            color: #ffffff;
-            font-weight: bold;
-            font-size: 11px;
-            padding: 2px;
-        }
-        QPushButton:checked {
-            background-color: #4CAF50;
-            color: #ffffff;
-            border-color: #45a049;
-        }
-        QPushButton:hover {
-            background-color: #505050;
-        }
-        QPushButton:checked:hover {
-            background-color: #45a049;
-        }
-        """
-        btn.setStyleSheet(style)
+        self.buttons[strip_idx] = strip_buttons
+        group_box.setLayout(group_layout)
+        layout.addWidget(group_box)
 
     def _toggle_output(self, strip_idx, output, checked):
-        """Toggle output routing for specified strip and output"""
-        try:
-            if strip_idx < len(self.vm.strip):
-                setattr(self.vm.strip[strip_idx], output, checked)
-                self.buttons[strip_idx][output].setChecked(checked)
-        except (IndexError, AttributeError) as e:
-            print(f"Error toggling {output} for strip {strip_idx}: {e}")
-
-    def update_routing_states(self):
-        """Update all button states from current Voicemeeter settings"""
-        strip_indices = STRIP_INDICES  # Inputs 6, 7, 8
-        for strip_idx in strip_indices:
-            if strip_idx in self.buttons:
-                for output in ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]:
-                    try:
-                        current_state = getattr(self.vm.strip[strip_idx], output)
-                        self.buttons[strip_idx][output].setChecked(current_state)
-                    except (IndexError, AttributeError, KeyError):
-                        pass
-
-
-class VolumePanelEmbedded(QtWidgets.QWidget):
-    """Embedded volume panel without window decorations"""
-    def __init__(self, vm):
+        """Queue an output routing change for specified strip and output"""
+        key = param_key("strip", strip_idx, output)
+        self.store.set(key, checked)
+        self.bindings.apply({key: checked})
+
+    def apply_params(self, params):
+        """Update button states from parameter changes in the store"""
+        self.bindings.apply(params)
+
+
+class FaderPanel(QtWidgets.QWidget):
+    """Columns of meter, gain fader, mute box and dB label bound to the store"""
+    meter_size = (20, 150)
+
+    def __init__(self, store, bindings=None):
         super().__init__()
-        self.vm = vm
-        self.resetting_strips = set()  # Track which strips are being reset
+        self.store = store
+        self.bindings = bindings if bindings is not None else Bindings()
+        # Slider drags write at most once per frame, plus once on release
+        self.writes = WriteCoalescer(store.set, parent=self)
+        self.sliders = {}
+        self.vu_meters = {}
+        self.mute_checkboxes = {}
+        self.colors = meter_colors(DEFAULT_THEME)
+
+    def _add_fader(self, layout, target, idx, name):
+        """Add the fader column of strip or bus ``idx``"""
+        strip_layout = QtWidgets.QVBoxLayout()
+        
+        # Add strip label
+        label = QtWidgets.QLabel(name)
+        label.setAlignment(QtCore.Qt.AlignCenter)
+        label.setWordWrap(True)
+        set_variant(label, "strip")
+        strip_layout.addWidget(label)
+        
+        # Create VU meter
+        vu_meter = VUMeter(*self.colors, channels=2)
+        vu_meter.setFixedSize(*self.meter_size)
+        
+        # Real values come from the store once the column is built
+        current_gain = 0
+        
+        # Create custom slider that handles double-click
+        gain_key = param_key(target, idx, "gain")
+        mute_key = param_key(target, idx, "mute")
+        custom_slider = DoubleClickSlider(QtCore.Qt.Vertical)
+        custom_slider.setMinimum(-60)
+        custom_slider.setMaximum(12)
+        custom_slider.setValue(current_gain)
+        custom_slider.valueChanged.connect(lambda val, key=gain_key: self._update_gain(key, val))
+        custom_slider.sliderReleased.connect(self.writes.flush)
+        custom_slider.doubleClicked.connect(
+            lambda key=gain_key, slider=custom_slider: self._reset_to_zero(key, slider))
+        self.bindings.bind_slider(gain_key, custom_slider)
+        
+        # Horizontal layout for VU meter and slider
+        controls_layout = QtWidgets.QHBoxLayout()
+        controls_layout.addWidget(vu_meter)
+        controls_layout.addWidget(custom_slider)
+        strip_layout.addLayout(controls_layout)
+
+        # Mute checkbox
+        mute_box = QtWidgets.QCheckBox("Mute")
+        mute_box.stateChanged.connect(
+            lambda state, key=mute_key: self._toggle_mute(key, state)
+        )
+        self.bindings.bind_checkable(mute_key, mute_box)
+        strip_layout.addWidget(mute_box)
+        
+        # Add dB value label
+        db_label = QtWidgets.QLabel(f"{current_gain}dB")
+        db_label.setAlignment(QtCore.Qt.AlignCenter)
+        set_variant(db_label, "db")
+        self.bindings.bind_label(gain_key, db_label)
+        strip_layout.addWidget(db_label)
+        
+        layout.addLayout(strip_layout)
+        self.sliders[idx] = custom_slider
+        self.vu_meters[idx] = vu_meter
+        self.mute_checkboxes[idx] = mute_box
+
+    def set_meter_colors(self, background, inactive):
+        """Recolour built meters; columns built later pick the colours up"""
+        self.colors = (background, inactive)
+        for vu_meter in self.vu_meters.values():
+            vu_meter.set_colors(background, inactive)
+
+    def _reset_to_zero(self, key, slider):
+        """Reset slider to 0dB on double-click"""
+        # Write 0dB through the store and hold it there for a while; an
+        # unflushed drag value must not land after it
+        self.writes.discard(key)
+        self.store.apply({key: 0.0})
+
+        # The slider is still held down by the double-click, which the
+        # binding skips, so move it here without queueing another write
+        slider.blockSignals(True)
+        slider.setValue(0)
+        slider.blockSignals(False)
+        self.bindings.apply({key: 0.0})
+
+    def _update_gain(self, key, val):
+        """Queue a coalesced gain change and refresh the dB label"""
+        self.writes.set(key, float(val))
+        self.bindings.apply({key: val})
+
+    def _toggle_mute(self, key, state):
+        """Queue a mute change."""
+        self.store.set(key, bool(state))
+
+    def apply_params(self, params):
+        """Update sliders, labels and mute boxes from parameter changes"""
+        self.bindings.apply(params)
+
+
+class VolumePanelEmbedded(FaderPanel):
+    """Embedded volume panel without window decorations
+
+    It also owns the metering for the whole control panel: every level
+    frame from the worker covers strips and buses, is smoothed once, and
+    drawn into the shown strip page and any meters added with
+    ``add_meters`` (the bus panel's).
+    """
+    def __init__(self, worker, store, bindings=None, topology=None):
+        super().__init__(store, bindings)
+        self.worker = worker
+        self.topology = topology if topology is not None else default_topology()
         
         main_layout = QtWidgets.QVBoxLayout()
         
         # Title
         title = QtWidgets.QLabel("Volume Control")
         title.setAlignment(QtCore.Qt.AlignCenter)
-        title.setStyleSheet("font-weight: bold; font-size: 14px; margin: 5px; color: #ffffff;")
+        set_variant(title, "section")
         main_layout.addWidget(title)
         
-        # Volume controls layout
-        volume_layout = QtWidgets.QHBoxLayout()
-        self.sliders = []
-        self.vu_meters = []
-        self.mute_checkboxes = []
-        self.strip_names = ["Voicemeeter Input", "Voicemeeter AUX", "VAIO3"]
-        
-        # Use inputs 5, 6, 7 (indices for inputs 6, 7, 8 in Voicemeeter Potato)
-        strip_indices = STRIP_INDICES
-        
-        for i, (strip_name, strip_idx) in enumerate(zip(self.strip_names, strip_indices)):
-            # Create vertical layout for each strip
-            strip_layout = QtWidgets.QVBoxLayout()
-            
-            # Add strip label
-            label = QtWidgets.QLabel(strip_name)
-            label.setAlignment(QtCore.Qt.AlignCenter)
-            label.setWordWrap(True)
-            label.setStyleSheet("font-weight: bold; font-size: 10px; color: #ffffff;")
-            strip_layout.addWidget(label)
-            
-            # Create VU meter
-            vu_meter = VUMeter()
-            vu_meter.setFixedSize(20, 150)
-            
-            try:
-                current_gain = int(self.vm.strip[strip_idx].gain)
-            except (IndexError, AttributeError):
-                current_gain = 0
-            
-            # Create custom slider that handles double-click
-            custom_slider = DoubleClickSlider(QtCore.Qt.Vertical)
-            custom_slider.setMinimum(-60)
-            custom_slider.setMaximum(12)
-            custom_slider.setValue(current_gain)
-            custom_slider.valueChanged.connect(lambda val, idx=strip_idx: self._update_gain(idx, val))
-            custom_slider.doubleClicked.connect(lambda idx=strip_idx: self._reset_to_zero(idx))
-            
-            # Apply dark mode styling to slider
-            custom_slider.setStyleSheet("""
-                QSlider::groove:vertical {
-                    background: #404040;
-                    width: 8px;
-                    border-radius: 4px;
-                }
-                QSlider::handle:vertical {
-                    background: #4CAF50;
-                    border: 1px solid #45a049;
-                    height: 18px;
-                    margin: 0 -5px;
-                    border-radius: 9px;
-                }
-                QSlider::handle:vertical:hover {
-                    background: #45a049;
-                }
-            """)
-            
-            # Horizontal layout for VU meter and slider
-            controls_layout = QtWidgets.QHBoxLayout()
-            controls_layout.addWidget(vu_meter)
-            controls_layout.addWidget(custom_slider)
-            strip_layout.addLayout(controls_layout)
-
-            # Mute checkbox
-            mute_box = QtWidgets.QCheckBox("Mute")
-            mute_box.setChecked(getattr(self.vm.strip[strip_idx], "mute", False))
-            mute_box.stateChanged.connect(
-                lambda state, idx=strip_idx: self._toggle_mute(idx, state)
-            )
-            strip_layout.addWidget(mute_box)
-
-            self.mute_checkboxes.append(mute_box)
-            
-            # Add dB value label
-            db_label = QtWidgets.QLabel(f"{current_gain}dB")
-            db_label.setAlignment(QtCore.Qt.AlignCenter)
-            db_label.setObjectName(f"db_label_{strip_idx}")
-            db_label.setStyleSheet("color: #ffffff; font-weight: bold;")
-            strip_layout.addWidget(db_label)
-            
-            volume_layout.addLayout(strip_layout)
-            self.sliders.append(custom_slider)
-            self.vu_meters.append(vu_meter)
-        
-        main_layout.addLayout(volume_layout)
+        # Volume controls, keyed by strip index as pages get built
+        self.pages = StripPages(self.topology.pages(), self._build_column)
+        main_layout.addWidget(self.pages)
         self.setLayout(main_layout)
-        
-        # Set up timer for VU meter updates
-        self.vu_timer = QtCore.QTimer()
-        self.vu_timer.timeout.connect(self._update_vu_meters)
-        self.vu_timer.start(VU_UPDATE_INTERVAL_MS)  # Update for smooth animation
 
-    def _reset_to_zero(self, strip_idx):
-        """Reset slider to 0dB on double-click"""
-        # Find which slider corresponds to this strip index
-        strip_indices = STRIP_INDICES
-        if strip_idx in strip_indices:
-            slider_index = strip_indices.index(strip_idx)
-            
-            # Mark this strip as being reset to prevent interference for longer
-            self.resetting_strips.add(strip_idx)
-            
-            # Disconnect the slider signal to prevent any interference
-            slider = self.sliders[slider_index]
-            try:
-                slider.valueChanged.disconnect()
-            except TypeError:
-                pass  # Signal wasn't connected
-            
-            # Force set Voicemeeter to 0dB multiple times with more persistence
-            for attempt in range(5):
-                try:
-                    setattr(self.vm.strip[strip_idx], "gain", 0.0)
-                    QtCore.QCoreApplication.processEvents()
-                    # Verify it was set
-                    actual = getattr(self.vm.strip[strip_idx], "gain")
-                    if abs(actual) < 0.1:  # Close enough to 0
-                        break
-                except Exception as e:
-                    pass
-            
-            # Update slider to 0
-            slider.setValue(0)
-            
-            # Reconnect the signal
-            slider.valueChanged.connect(lambda val, idx=strip_idx: self._update_gain(idx, val))
-            
-            # Update the dB label
-            db_label = self.findChild(QtWidgets.QLabel, f"db_label_{strip_idx}")
-            if db_label:
-                db_label.setText("0dB")
-            
-            # Monitor and enforce the reset over a longer time period
-            self._enforce_reset_value(strip_idx, 0, 0)
-    
-    def _enforce_reset_value(self, strip_idx, target_value, attempts=0):
-        """Enforce the reset value by checking and correcting it multiple times"""
-        max_attempts = 20  # Increased from 10 to 20 for more persistence
-        if attempts >= max_attempts:
-            self.resetting_strips.discard(strip_idx)
-            return
-        
-        try:
-            current_gain = getattr(self.vm.strip[strip_idx], "gain")
-            if abs(current_gain - target_value) > 0.1:  # If not close to target
-                # Force it back to target value
-                setattr(self.vm.strip[strip_idx], "gain", float(target_value))
-                
-                # Also update the slider and label to match
-                strip_indices = STRIP_INDICES
-                if strip_idx in strip_indices:
-                    slider_index = strip_indices.index(strip_idx)
-                    slider = self.sliders[slider_index]
-                    
-                    # Temporarily disconnect, update, and reconnect
-                    try:
-                        slider.valueChanged.disconnect()
-                    except TypeError:
-                        pass
-                    
-                    slider.setValue(target_value)
-                    slider.valueChanged.connect(lambda val, idx=strip_idx: self._update_gain(idx, val))
-                    
-                    # Update label
-                    db_label = self.findChild(QtWidgets.QLabel, f"db_label_{strip_idx}")
-                    if db_label:
-                        db_label.setText(f"{target_value}dB")
-                
-                # Schedule another check sooner for more aggressive correction
-                QtCore.QTimer.singleShot(50, lambda: self._enforce_reset_value(strip_idx, target_value, attempts + 1))
-            else:
-                # Value is correct, but keep monitoring for a bit longer
-                if attempts < 15:  # Continue monitoring for 15 more cycles
-                    QtCore.QTimer.singleShot(100, lambda: self._enforce_reset_value(strip_idx, target_value, attempts + 1))
-                else:
-                    self.resetting_strips.discard(strip_idx)
-        except Exception as e:
-            self.resetting_strips.discard(strip_idx)
-    
+        # The worker reads one batched level frame per tick; the meter engine
+        # smooths every channel at once and only shown meters are drawn
+        self.levels = worker.levels
+        self.meter_engine = MeterEngine(self.levels.levels.shape)
+        self._page_meters = []
+        self._shared_meters = []
+        worker.levels_ready.connect(self._update_vu_meters)
+        
+        # The scheduler sets the worker's polling rate: full rate when the
+        # panel is shown, slower during silence and paused when hidden
+        self.scheduler = RefreshScheduler(self._set_vu_interval)
 
+    def show_page(self, index):
+        """Show a page of strips, seeding new controls from the store"""
+        strips = self.pages.pages[index]
+        if self.pages.show_page(index):
+            keys = [param_key("strip", strip_idx, name) for strip_idx in strips for name in ("gain", "mute")]
+            self.bindings.apply(self.store.snapshot(keys))
+        self._page_meters = [(self._level_row("strip", strip_idx), self.vu_meters[strip_idx])
+                             for strip_idx in strips]
 
-    def _update_gain(self, strip_idx, val):
-        """Update gain and refresh the dB label"""
-        try:
-            if strip_idx < len(self.vm.strip):
-                setattr(self.vm.strip[strip_idx], "gain", float(val))
-        except (IndexError, AttributeError) as e:
-            pass
-            
-        db_label = self.findChild(QtWidgets.QLabel, f"db_label_{strip_idx}")
-        if db_label:
-            db_label.setText(f"{val}dB")
+    def add_meters(self, target, meters):
+        """Draw ``{idx: VUMeter}`` of strips or buses from the same frames"""
+        for idx, vu_meter in meters.items():
+            row = self._level_row(target, idx)
+            if row is not None:
+                vu_meter.clicked.connect(lambda row=row: self.meter_engine.reset_clip(row))
+            self._shared_meters.append((row, vu_meter))
 
-    def _toggle_mute(self, strip_idx, state):
-        """Toggle mute state for a strip."""
+    def _level_row(self, target, idx):
+        """Row of the worker's level frame, or None if it isn't metered"""
         try:
-            if strip_idx < len(self.vm.strip):
-                setattr(self.vm.strip[strip_idx], "mute", bool(state))
-        except (IndexError, AttributeError):
-            pass
-
-    def update_sliders(self):
-        strip_indices = STRIP_INDICES  # Inputs 6, 7, 8
-        for i, strip_idx in enumerate(strip_indices):
-            # Skip strips that are currently being reset
-            if strip_idx in self.resetting_strips:
-                continue
-                
-            try:
-                if strip_idx < len(self.vm.strip):
-                    current_gain = int(self.vm.strip[strip_idx].gain)
-                    
-                    # Only update the slider if there's a significant difference
-                    # Block signals to prevent triggering value changes in Voicemeeter
-                    current_slider_value = self.sliders[i].value()
-                    if abs(current_slider_value - current_gain) > 1:  # More than 1dB difference
-                        self.sliders[i].blockSignals(True)
-                        self.sliders[i].setValue(current_gain)
-                        self.sliders[i].blockSignals(False)
-                        
-                    # Always update the label to show current Voicemeeter value
-                    db_label = self.findChild(QtWidgets.QLabel, f"db_label_{strip_idx}")
-                    if db_label:
-                        db_label.setText(f"{current_gain}dB")
-
-                    # Update mute checkbox state
-                    if i < len(self.mute_checkboxes):
-                        self.mute_checkboxes[i].setChecked(
-                            getattr(self.vm.strip[strip_idx], "mute", False)
-                        )
-            except (IndexError, AttributeError):
-                pass
+            if target == "bus":
+                return self.levels.bus_row(idx)
+            return self.levels.strip_row(idx)
+        except KeyError:
+            return None
+
+    def _build_column(self, layout, strip_idx):
+        """Add the fader column of one strip"""
+        self._add_fader(layout, "strip", strip_idx, self.topology.strip_name(strip_idx))
+        row = self._level_row("strip", strip_idx)
+        if row is not None:
+            self.vu_meters[strip_idx].clicked.connect(lambda row=row: self.meter_engine.reset_clip(row))
+
+    def _set_vu_interval(self, interval_ms):
+        """Apply the scheduler's refresh interval (0 pauses polling)"""
+        self.worker.set_interval(interval_ms)
+        if interval_ms <= 0:
+            self.meter_engine.reset()
+            for vu_meter in self.vu_meters.values():
+                vu_meter.update_level(LEVEL_MIN_DB)
+            for _, vu_meter in self._shared_meters:
+                vu_meter.update_level(LEVEL_MIN_DB)
 
     def _update_vu_meters(self):
-        """Update VU meters with real audio levels from Voicemeeter"""
-        strip_indices = STRIP_INDICES  # Inputs 6, 7, 8
-        for i, strip_idx in enumerate(strip_indices):
-            try:
-                if strip_idx < len(self.vm.strip):
-                    # Get audio levels using the correct voicemeeterlib API
-                    # Get postmute levels (after mute/gain but before fader)
-                    levels = self.vm.strip[strip_idx].levels.postmute
-                    
-                    # levels is a tuple, get the left channel (index 0)
-                    if levels and len(levels) > 0:
-                        level_db = levels[0]  # Already in dB
-                        # Clamp to our expected range
-                        level_db = max(-60, min(12, level_db))
-                    else:
-                        level_db = -60  # No signal
-                    
-                    # Update the corresponding VU meter
-                    if i < len(self.vu_meters):
-                        self.vu_meters[i].update_level(level_db)
-            except (IndexError, AttributeError, TypeError, ValueError):
-                # If we can't get the level, set to minimum
-                if i < len(self.vu_meters):
-                    self.vu_meters[i].update_level(-60)
+        """Update VU meters from the worker's latest level frame"""
+        # Postmute levels (after mute/gain), already converted to dB and clamped
+        levels = self.worker.take_levels()
+        if levels is None:
+            return
+        start = time.perf_counter()
+        engine = self.meter_engine
+        display = engine.process(levels)
+        for meters in (self._page_meters, self._shared_meters):
+            for row, vu_meter in meters:
+                # Left and right channel of the strip or bus
+                if row is not None:
+                    vu_meter.update_levels(display[row], engine.peak[row], engine.clip[row])
+        peak = float(levels.max()) if levels.size else LEVEL_MIN_DB
+        duration = time.perf_counter() - start
+        self.scheduler.record_tick(peak, duration)
+        INSTRUMENTS.record("vu.tick", duration)
+
+
+class BusPanelEmbedded(FaderPanel):
+    """Output bus faders (A1-A5 and so on) with per-channel meters
+
+    The bus panel has no timer and makes no Voicemeeter calls of its own:
+    its gains and mutes are part of the worker's parameter sync and its
+    meters are drawn by the volume panel from the same level frames.
+    """
+    meter_size = (20, 300)
+
+    def __init__(self, store, bindings=None, topology=None):
+        super().__init__(store, bindings)
+        self.topology = topology if topology is not None else default_topology()
+
+        main_layout = QtWidgets.QVBoxLayout()
+        title = QtWidgets.QLabel("Outputs")
+        title.setAlignment(QtCore.Qt.AlignCenter)
+        set_variant(title, "section")
+        main_layout.addWidget(title)
+
+        faders = QtWidgets.QHBoxLayout()
+        for bus_idx in self.topology.buses:
+            self._add_fader(faders, "bus", bus_idx, self.topology.bus_name(bus_idx))
+        main_layout.addLayout(faders)
+        main_layout.addStretch()
+        self.setLayout(main_layout)
+
+        keys = [param_key("bus", bus_idx, name) for bus_idx in self.topology.buses for name in ("gain", "mute")]
+        self.bindings.apply(self.store.snapshot(keys))
+
 
 class DoubleClickSlider(QtWidgets.QSlider):
     """Custom slider that emits doubleClicked signal"""
@@ -493,53 +508,3 @@ class DoubleClickSlider(QtWidgets.QSlider):
     def mouseDoubleClickEvent(self, event):
         self.doubleClicked.emit()
         super().mouseDoubleClickEvent(event)
-
-
-class VUMeter(QtWidgets.QWidget):
-    def __init__(self):
-        super().__init__()
-        self.level = -60  # dB level
-        self.setMinimumSize(20, 150)
-        
-    def update_level(self, db_level):
-        """Update the VU meter level"""
-        self.level = max(-60, min(12, db_level))
-        self.update()
-        
-    def paintEvent(self, event):
-        """Draw the VU meter with dark theme"""
-        painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing)
-        
-        # Dark background
-        painter.fillRect(self.rect(), QtGui.QColor(20, 20, 20))
-        
-        # Calculate meter height
-        meter_height = self.height() - 10
-        meter_width = self.width() - 4
-        
-        # Convert dB to pixel position (0dB at top, -60dB at bottom)
-        level_ratio = (self.level + 60) / 72  # Range: -60dB to +12dB
-        level_height = int(level_ratio * meter_height)
-        
-        # Draw segments
-        segment_height = 3
-        segment_gap = 1
-        segments_per_meter = meter_height // (segment_height + segment_gap)
-        
-        for i in range(segments_per_meter):
-            y_pos = self.height() - 5 - (i * (segment_height + segment_gap))
-            
-            if i * (segment_height + segment_gap) < level_height:
-                # Determine color based on dB level
-                segment_db = -60 + (i / segments_per_meter) * 72
-                if segment_db > 0:
-                    color = QtGui.QColor(255, 0, 0)  # Red for > 0dB
-                elif segment_db > -12:
-                    color = QtGui.QColor(255, 255, 0)  # Yellow for -12dB to 0dB
-                else:
-                    color = QtGui.QColor(0, 255, 0)  # Green for < -12dB
-            else:
-                color = QtGui.QColor(40, 40, 40)  # Dark gray for inactive
-                
-            painter.fillRect(2, y_pos, meter_width, segment_height, color)
@@ -0,0 +1,85 @@
+"""Background (re)connection to the Voicemeeter engine."""
+from .constants import CONNECT_RETRY_MIN_MS, CONNECT_RETRY_MAX_MS
+
+
+class Connector:
+    """Log in to Voicemeeter, retrying with exponential backoff.
+
+    ``factory`` returns a logged-in Remote object or raises. The worker
+    calls ``connect`` from its loop while disconnected and ``lost`` when the
+    engine stops answering, so startup never blocks on Voicemeeter and a
+    restarted engine is picked up on the next attempt.
+    """
+
+    def __init__(self, factory, retry_min_ms=CONNECT_RETRY_MIN_MS, retry_max_ms=CONNECT_RETRY_MAX_MS):
+        self.factory = factory
+        self.retry_min = retry_min_ms / 1000.0
+        self.retry_max = retry_max_ms / 1000.0
+        self.vm = None
+        self.next_attempt = 0.0
+        self._delay = self.retry_min
+        self._failures = 0
+
+        # Measurement counters
+        self.attempts = 0
+        self.connects = 0
+
+    def connected(self):
+        return self.vm is not None
+
+    def connect(self, now):
+        """Try to connect if an attempt is due; return the vm or ``None``."""
+        if self.vm is not None:
+            return self.vm
+        if now < self.next_attempt:
+            return None
+        self.attempts += 1
+        vm = None
+        try:
+            vm = self.factory()
+            self._probe(vm)
+        except Exception as e:
+            self._failed(vm, now, f"Voicemeeter not available, retrying in the background: {e}")
+            return None
+        self.vm = vm
+        self._delay = self.retry_min
+        self._failures = 0
+        self.connects += 1
+        return vm
+
+    def reject(self, now, reason):
+        """Log out of an engine the caller can't use and retry with backoff."""
+        vm, self.vm = self.vm, None
+        self._failed(vm, now, f"{reason}, retrying in the background")
+
+    def lost(self, now):
+        """Drop the current connection and retry right away."""
+        vm, self.vm = self.vm, None
+        self.close(vm)
+        self.next_attempt = now
+
+    def close(self, vm=None):
+        """Log out of ``vm`` (default: the current connection)."""
+        vm = self.vm if vm is None else vm
+        if vm is None:
+            return
+        try:
+            vm.logout()
+        except Exception:
+            pass
+
+    def _failed(self, vm, now, message):
+        self.close(vm)
+        self._failures += 1
+        if self._failures == 1:
+            print(message)
+        self.next_attempt = now + self._delay
+        self._delay = min(self._delay * 2, self.retry_max)
+
+    @staticmethod
+    def _probe(vm):
+        """Make one cheap call to check the engine is actually running."""
+        try:
+            vm.pdirty
+        except AttributeError:
+            pass
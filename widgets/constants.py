@@ -1,5 +1,86 @@
 """Common constants used across the VMControl widgets."""
 
 STRIP_INDICES = [5, 6, 7]
+STRIP_NAMES = ["Voicemeeter Input", "Voicemeeter AUX", "VAIO3"]
+ROUTING_OUTPUTS = ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]
 VU_UPDATE_INTERVAL_MS = 50
 AUTO_HIDE_DELAY_MS = 500
+# Strip columns per page of the control panel; larger topologies get a page
+# selector and each page is built the first time it is shown
+STRIPS_PER_PAGE = 3
+# Width of one output bus fader column beside the strips (pixels)
+BUS_COLUMN_WIDTH = 76
+
+# Meter range shared by every VU meter (dB)
+LEVEL_MIN_DB = -60
+LEVEL_MAX_DB = 12
+
+# (physical inputs, virtual inputs, physical outputs, virtual outputs) per kind
+KIND_LAYOUTS = {
+    "basic": (2, 1, 1, 1),
+    "banana": (3, 2, 3, 2),
+    "potato": (5, 3, 5, 3),
+}
+DEFAULT_KIND = "potato"
+
+# Adaptive meter refresh: full rate while visible, slower after sustained
+# silence, and 0 (stopped) while the panel is hidden.
+VU_IDLE_INTERVAL_MS = 250
+VU_HIDDEN_INTERVAL_MS = 0
+SILENCE_BACKOFF_MS = 2000
+SILENCE_THRESHOLD_DB = LEVEL_MIN_DB + 1
+
+# Meter ballistics (see widgets/metering.py)
+METER_ATTACK_MS = 10
+METER_RELEASE_DB_PER_S = 24
+PEAK_HOLD_MS = 1500
+PEAK_FALL_DB_PER_S = 20
+CLIP_THRESHOLD_DB = 0.0
+
+# Background Voicemeeter worker: how often the parameter-dirty flag is
+# checked while the panel is open (parameters are only re-read when set)
+DIRTY_CHECK_INTERVAL_MS = 100
+# ...and while it is hidden, so the state store stays current for tray actions
+# and an engine restart is noticed quickly (0 stops syncing while hidden)
+STORE_SYNC_HIDDEN_MS = 250
+WORKER_STOP_TIMEOUT_S = 2.0
+
+# Bulk writes are sent as Voicemeeter scripts; longer ones are split
+SCRIPT_MAX_LENGTH = 48000
+
+# Slider writes are coalesced and flushed at most once per frame (~60 fps)
+WRITE_COALESCE_MS = 16
+
+# Target-state reconciler: how long applied values are held and how often
+# they are verified
+RECONCILE_INTERVAL_MS = 50
+RECONCILE_HOLD_MS = 2000
+
+# Preset morphs: tick rate of the fade, default fade time for preset
+# switches, and where in a fade (0..1) toggles flip
+MORPH_INTERVAL_MS = 20
+PRESET_MORPH_MS = 1000
+MORPH_CURVE = "smooth"
+MORPH_ROUTING_AT = 0.5
+MORPH_MUTE_ON_AT = 1.0
+MORPH_MUTE_OFF_AT = 0.0
+
+# The control panel is built lazily: on the first click, or in an idle slot
+# this long after startup
+PANEL_PREBUILD_DELAY_MS = 1000
+
+# Background connection to Voicemeeter: first retry delay, doubling up to
+# the maximum while the engine stays unavailable
+CONNECT_RETRY_MIN_MS = 100
+CONNECT_RETRY_MAX_MS = 5000
+
+# Debug overlay on the control panel (Ctrl+Shift+D): refresh interval
+DEBUG_OVERLAY_INTERVAL_MS = 500
+
+# GUI stall watchdog: heartbeat period of the Qt event loop, how late a
+# heartbeat may be before the main thread's stack is captured, and the
+# size and count of the rotating stall logs
+STALL_HEARTBEAT_MS = 100
+STALL_THRESHOLD_MS = 500
+STALL_LOG_MAX_BYTES = 1_000_000
+STALL_LOG_BACKUPS = 3
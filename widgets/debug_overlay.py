@@ -0,0 +1,79 @@
+"""Hidden debug overlay showing live instrumentation figures."""
+from PyQt5 import QtWidgets, QtCore
+from .constants import DEBUG_OVERLAY_INTERVAL_MS
+from .instrumentation import INSTRUMENTS
+from .theme import set_variant
+
+# Counters that are calls into Voicemeeter
+API_COUNTERS = ("vm.read", "vm.write", "vm.script", "vm.get_level", "vm.pdirty")
+
+
+class DebugOverlay(QtWidgets.QLabel):
+    """Text box over a panel with API calls/s, VU tick times and dropped frames.
+
+    Rates are worked out between refreshes. Instrumentation is switched on
+    while the overlay is shown, and back off when it is hidden if it was
+    off before.
+    """
+
+    def __init__(self, parent, instruments=INSTRUMENTS, interval_ms=DEBUG_OVERLAY_INTERVAL_MS):
+        super().__init__(parent)
+        self.instruments = instruments
+        self._was_enabled = instruments.enabled
+        self._last = None
+        set_variant(self, "overlay")
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents)
+        self.move(8, 8)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def toggle(self):
+        self.setHidden(not self.isHidden())
+
+    def showEvent(self, event):
+        self._was_enabled = self.instruments.enabled
+        self.instruments.enable()
+        self._last = None
+        self.refresh()
+        self.timer.start()
+        self.raise_()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        self.instruments.enable(self._was_enabled)
+        super().hideEvent(event)
+
+    def refresh(self):
+        """Redraw from a fresh snapshot"""
+        snapshot = self.instruments.snapshot()
+        counters = snapshot["counters"]
+        totals = {
+            "api": sum(counters.get(name, 0) for name in API_COUNTERS),
+            "paint": counters.get("vu.paint", 0),
+            "dropped": counters.get("vu.dropped_frames", 0),
+        }
+        now = snapshot["elapsed_s"]
+        if self._last is None or now <= self._last[0]:
+            rates = dict.fromkeys(totals, 0.0)
+        else:
+            elapsed = now - self._last[0]
+            rates = {name: (value - self._last[1][name]) / elapsed for name, value in totals.items()}
+        self._last = (now, totals)
+
+        timings = snapshot["timings"]
+        empty = {"p50_ms": 0.0, "p99_ms": 0.0}
+        tick = timings.get("vu.tick", empty)
+        worker = timings.get("worker.tick", empty)
+        lag = timings.get("timer.worker", empty)
+        self.setText("\n".join([
+            f"API calls/s   {rates['api']:8.0f}",
+            f"VU tick       p50 {tick['p50_ms']:6.2f}  p99 {tick['p99_ms']:6.2f} ms",
+            f"worker tick   p50 {worker['p50_ms']:6.2f}  p99 {worker['p99_ms']:6.2f} ms",
+            f"timer lag     p99 {lag['p99_ms']:6.2f} ms",
+            f"paints/s      {rates['paint']:8.0f}",
+            f"dropped       {totals['dropped']:8d}  ({rates['dropped']:.1f}/s)",
+        ]))
+        self.adjustSize()
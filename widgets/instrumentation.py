@@ -0,0 +1,170 @@
+"""Hot-path counters and timing histograms.
+
+``INSTRUMENTS`` is shared by the whole app. Call sites count events and time
+sections by name (``vm.read``, ``vu.tick``, ``vu.paint``...); while it is
+disabled, which is the default, every call returns straight away. Set
+``VMCONTROL_INSTRUMENT=1`` to record from startup.
+"""
+import bisect
+import json
+import os
+import threading
+import time
+
+from PyQt5 import QtCore
+
+# Histogram bucket upper bounds in seconds: 1 us to about 16 s, four buckets
+# per doubling, so percentiles are accurate to about 19%
+BUCKET_BOUNDS = [1e-6 * 2 ** (i / 4) for i in range(97)]
+
+
+class Histogram:
+    """Fixed log-spaced buckets; recording is one bisect and an increment."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Upper bound, in seconds, of the bucket holding the ``p``-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return min(BUCKET_BOUNDS[i], self.max) if i < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class _Timer:
+    __slots__ = ("instruments", "name", "start")
+
+    def __init__(self, instruments, name):
+        self.instruments = instruments
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instruments.record(self.name, time.perf_counter() - self.start)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _FireCounter(QtCore.QObject):
+    """Child of a timer, so its connection goes away with the timer."""
+
+    def __init__(self, instruments, name, timer):
+        super().__init__(timer)
+        self.instruments = instruments
+        self.name = name
+
+    def fired(self):
+        self.instruments.count(self.name)
+
+
+class Instrumentation:
+    """Named counters and histograms, safe to update from any thread.
+
+    ``count(name)`` adds to a counter, ``record(name, seconds)`` adds a
+    sample to a histogram (and counts it), and ``timed(name)`` is a context
+    manager that records how long its block took.
+    """
+
+    def __init__(self, enabled=False, clock=time.monotonic):
+        self.enabled = enabled
+        self.clock = clock
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+        self._started = clock()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(seconds)
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def timed(self, name):
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def count_fires(self, timer, name):
+        """Count every ``timeout`` of a ``QTimer`` as ``name``."""
+        timer.timeout.connect(_FireCounter(self, name, timer).fired)
+
+    def total(self, prefix):
+        """Sum of every counter whose name starts with ``prefix``."""
+        with self._lock:
+            return sum(n for name, n in self.counters.items() if name.startswith(prefix))
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self._started = self.clock()
+
+    def snapshot(self):
+        """Counters and histogram summaries since the last reset."""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "elapsed_s": self.clock() - self._started,
+                "counters": dict(sorted(self.counters.items())),
+                "timings": {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+            }
+
+    def dump(self, path):
+        """Write ``snapshot()`` to ``path`` as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+INSTRUMENTS = Instrumentation(enabled=bool(os.environ.get("VMCONTROL_INSTRUMENT")))
@@ -0,0 +1,118 @@
+"""Batched level reads shared by all VU meters."""
+import numpy as np
+from .constants import KIND_LAYOUTS, DEFAULT_KIND, LEVEL_MIN_DB
+from .instrumentation import INSTRUMENTS
+
+# Level types understood by the Voicemeeter Remote API (VBVMR_GetLevel)
+STRIP_PREFADER = 0
+STRIP_POSTFADER = 1
+STRIP_POSTMUTE = 2
+BUS_OUTPUT = 3
+
+
+def kind_name(vm):
+    """Return the Voicemeeter kind of ``vm`` ('basic', 'banana' or 'potato')."""
+    try:
+        name = str(vm.kind.name).lower()
+    except AttributeError:
+        return DEFAULT_KIND
+    return name if name in KIND_LAYOUTS else DEFAULT_KIND
+
+
+def kind_layout(vm):
+    """Return the (phys_in, virt_in, phys_out, virt_out) layout of ``vm``."""
+    return KIND_LAYOUTS[kind_name(vm)]
+
+
+def strip_channel_offset(layout, strip_idx):
+    """First level channel of a strip: 2 per physical strip, 8 per virtual."""
+    phys_in = layout[0]
+    if strip_idx < phys_in:
+        return strip_idx * 2
+    return phys_in * 2 + (strip_idx - phys_in) * 8
+
+
+def bus_channel_offset(layout, bus_idx):
+    """First level channel of a bus: every bus has 8."""
+    return bus_idx * 8
+
+
+class LevelSnapshot:
+    """One consistent frame of strip and bus levels.
+
+    Every tick reads all watched channels in a single pass over the raw
+    ``vm.get_level`` call, converts them to dB in one vectorised step and
+    stores them in a preallocated ``(meters, channels)`` array. Meters read
+    rows out of ``levels`` instead of walking ``vm.strip[i].levels``.
+    """
+
+    def __init__(self, vm, strips=(), buses=(), channels=2, strip_mode=STRIP_POSTMUTE):
+        self.channels = channels
+        self.strip_mode = strip_mode
+        self._rows = {}
+        for strip_idx in strips:
+            self._rows[("strip", strip_idx)] = len(self._rows)
+        for bus_idx in buses:
+            self._rows[("bus", bus_idx)] = len(self._rows)
+        self.attach(vm)
+
+        self._raw = np.zeros(len(self._plan), dtype=np.float32)
+        self.levels = np.full((len(self._rows), channels), LEVEL_MIN_DB, dtype=np.float32)
+        self.reads = 0  # Number of get_level calls issued, for measurement
+
+    def attach(self, vm):
+        """Read from ``vm``, working out channel offsets from its kind.
+
+        Rows stay where they are, so meters holding row numbers keep
+        working across reconnects.
+        """
+        self.vm = vm
+        layout = kind_layout(vm)
+        plan = []
+        for (target, idx) in self._rows:
+            if target == "strip":
+                start = strip_channel_offset(layout, idx)
+                plan.extend((self.strip_mode, start + ch) for ch in range(self.channels))
+            else:
+                start = bus_channel_offset(layout, idx)
+                plan.extend((BUS_OUTPUT, start + ch) for ch in range(self.channels))
+        self._plan = tuple(plan)
+
+    def refresh(self):
+        """Read every watched channel once and update ``levels`` in place."""
+        raw = self._raw
+        try:
+            get_level = self.vm.get_level
+            with INSTRUMENTS.timed("vm.levels"):
+                for n, (mode, channel) in enumerate(self._plan):
+                    raw[n] = get_level(mode, channel)
+            self.reads += len(self._plan)
+            INSTRUMENTS.count("vm.get_level", len(self._plan))
+        except Exception:
+            # Engine unavailable: show silence rather than stale levels
+            self.levels.fill(LEVEL_MIN_DB)
+            return self.levels
+
+        # Linear amplitude -> dB, clamped to the meter floor
+        np.maximum(raw, 1e-9, out=raw)
+        np.log10(raw, out=raw)
+        raw *= 20.0
+        np.maximum(raw, LEVEL_MIN_DB, out=raw)
+        self.levels.reshape(-1)[:] = raw
+        return self.levels
+
+    def strip_row(self, strip_idx):
+        """Row of ``levels`` holding ``strip_idx``."""
+        return self._rows[("strip", strip_idx)]
+
+    def bus_row(self, bus_idx):
+        """Row of ``levels`` holding ``bus_idx``."""
+        return self._rows[("bus", bus_idx)]
+
+    def strip(self, strip_idx):
+        """Levels row (one value per channel) for ``strip_idx``."""
+        return self.levels[self.strip_row(strip_idx)]
+
+    def bus(self, bus_idx):
+        """Levels row (one value per channel) for ``bus_idx``."""
+        return self.levels[self.bus_row(bus_idx)]
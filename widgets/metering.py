@@ -0,0 +1,83 @@
+"""Meter ballistics, peak hold and clip latching for every channel at once."""
+import time
+import numpy as np
+from .constants import (
+    LEVEL_MIN_DB,
+    METER_ATTACK_MS,
+    METER_RELEASE_DB_PER_S,
+    PEAK_HOLD_MS,
+    PEAK_FALL_DB_PER_S,
+    CLIP_THRESHOLD_DB,
+)
+
+
+class MeterEngine:
+    """Turn raw level frames into what the meters display.
+
+    Works on the whole ``(meters, channels)`` array of a ``LevelSnapshot``
+    with NumPy operations, so the per-tick cost does not depend on how many
+    strips and buses are metered:
+
+    - ``display``: exponential attack towards louder input, linear release
+      (dB per second) towards quieter input
+    - ``peak``: highest recent level, held for ``hold_ms`` then falling
+    - ``clip``: latched once a channel reaches ``clip_db`` until ``reset_clip``
+    """
+
+    def __init__(self, shape, attack_ms=METER_ATTACK_MS, release_db_per_s=METER_RELEASE_DB_PER_S,
+                 hold_ms=PEAK_HOLD_MS, peak_fall_db_per_s=PEAK_FALL_DB_PER_S,
+                 clip_db=CLIP_THRESHOLD_DB, clock=time.monotonic):
+        self.attack_s = attack_ms / 1000.0
+        self.release_db_per_s = release_db_per_s
+        self.hold_s = hold_ms / 1000.0
+        self.peak_fall_db_per_s = peak_fall_db_per_s
+        self.clip_db = clip_db
+        self.clock = clock
+
+        self.display = np.full(shape, LEVEL_MIN_DB, dtype=np.float32)
+        self.peak = np.full(shape, LEVEL_MIN_DB, dtype=np.float32)
+        self.clip = np.zeros(shape, dtype=bool)
+        self._hold_until = np.zeros(shape, dtype=np.float64)
+        self._last = None
+
+    def reset(self):
+        """Drop all meter state, e.g. after metering was paused."""
+        self.display.fill(LEVEL_MIN_DB)
+        self.peak.fill(LEVEL_MIN_DB)
+        self.clip.fill(False)
+        self._hold_until.fill(0.0)
+        self._last = None
+
+    def reset_clip(self, row=None):
+        """Clear latched clip indicators for one meter row or all of them."""
+        if row is None:
+            self.clip.fill(False)
+        else:
+            self.clip[row] = False
+
+    def process(self, levels, now=None):
+        """Advance every channel by one frame of ``levels`` (dB)."""
+        now = self.clock() if now is None else now
+        dt = 0.0 if self._last is None else max(0.0, now - self._last)
+        self._last = now
+
+        # Ballistics: fast exponential attack, constant-rate release
+        rising = levels > self.display
+        if self.attack_s > 0:
+            attack = 1.0 - np.exp(-dt / self.attack_s) if dt else 1.0
+        else:
+            attack = 1.0
+        attacked = self.display + (levels - self.display) * attack
+        released = np.maximum(levels, self.display - self.release_db_per_s * dt)
+        np.copyto(self.display, np.where(rising, attacked, released))
+
+        # Peak hold with timed fall-off
+        new_peak = levels >= self.peak
+        self._hold_until[new_peak] = now + self.hold_s
+        falling = ~new_peak & (now >= self._hold_until)
+        fallen = np.maximum(self.peak - self.peak_fall_db_per_s * dt, self.display)
+        np.copyto(self.peak, np.where(new_peak, levels, np.where(falling, fallen, self.peak)))
+
+        # Clip latching
+        self.clip |= levels >= self.clip_db
+        return self.display
@@ -0,0 +1,135 @@
+"""Timed crossfades between the current state and a target preset."""
+from .constants import MORPH_INTERVAL_MS, MORPH_ROUTING_AT, MORPH_MUTE_ON_AT, MORPH_MUTE_OFF_AT
+from .params import parse_key
+
+CURVES = {
+    "linear": lambda t: t,
+    "smooth": lambda t: t * t * (3 - 2 * t),
+    "ease_in": lambda t: t * t,
+    "ease_out": lambda t: 1 - (1 - t) * (1 - t),
+}
+
+# Gain steps smaller than this are not worth a write
+GAIN_EPSILON = 0.01
+
+
+def switch_point(name, value):
+    """Fraction of the fade at which toggle ``name`` flips to ``value``.
+
+    Mutes engage at the end of a fade and release at its start, so audio
+    never cuts in or out mid-fade; routing flips at ``MORPH_ROUTING_AT``.
+    """
+    if name == "mute":
+        return MORPH_MUTE_ON_AT if value else MORPH_MUTE_OFF_AT
+    return MORPH_ROUTING_AT
+
+
+class Morph:
+    """One fade from ``start`` to ``target`` values over ``duration`` seconds.
+
+    Gains are interpolated along ``curve``; toggles jump at their switch
+    point. Keys missing from ``start`` are set when the fade ends.
+    """
+
+    def __init__(self, start, target, duration, now, curve="smooth"):
+        if curve not in CURVES:
+            raise ValueError(f"Unknown morph curve: {curve!r}")
+        self.curve = CURVES[curve]
+        self.target = dict(target)
+        self.start_time = now
+        self.duration = max(0.0, duration)
+        self._start = {key: start[key] for key in target if key in start}
+        self._written = dict(self._start)
+
+    def release(self, key):
+        """Stop driving ``key``, e.g. because the user changed it."""
+        self.target.pop(key, None)
+        self._start.pop(key, None)
+        self._written.pop(key, None)
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, max(0.0, (now - self.start_time) / self.duration))
+
+    def done(self, now):
+        return self.progress(now) >= 1.0
+
+    def step(self, now):
+        """Values to write at ``now``: only those that moved since last step."""
+        t = self.progress(now)
+        shaped = self.curve(t)
+        values = {}
+        for key, value in self.target.items():
+            current = self._value_at(key, value, t, shaped)
+            if current is None:
+                continue
+            last = self._written.get(key)
+            if isinstance(current, bool):
+                moved = current != last
+            else:
+                moved = last is None or abs(current - last) >= GAIN_EPSILON
+            if moved:
+                values[key] = current
+                self._written[key] = current
+        return values
+
+    def _value_at(self, key, value, t, shaped):
+        if t >= 1.0:
+            return value
+        if key not in self._start:
+            return None
+        begin = self._start[key]
+        name = parse_key(key)[2]
+        if name == "gain":
+            return begin + (value - begin) * shaped
+        return value if t >= switch_point(name, value) else begin
+
+
+class Morpher:
+    """Drive at most one ``Morph`` at a fixed tick rate.
+
+    ``tick`` is called from the worker loop. Lateness of a whole interval or
+    more counts as missed ticks; the fade itself is time-based so it never
+    slows down, it only gets coarser.
+    """
+
+    def __init__(self, interval_ms=MORPH_INTERVAL_MS):
+        self.interval = interval_ms / 1000.0
+        self.morph = None
+        self.next_tick = 0.0
+
+        # Measurement counters
+        self.ticks = 0
+        self.missed = 0
+
+    def start(self, morph):
+        self.morph = morph
+        self.next_tick = morph.start_time
+
+    def release(self, key):
+        if self.morph is not None:
+            self.morph.release(key)
+
+    def active(self):
+        return self.morph is not None
+
+    def tick(self, now):
+        """Step the morph if a tick is due.
+
+        Returns ``(values, finished)``: the batch to write and, once the fade
+        is complete, the morph's final targets (otherwise ``None``).
+        """
+        if self.morph is None or now < self.next_tick:
+            return {}, None
+        late = now - self.next_tick
+        if late >= self.interval:
+            self.missed += int(late // self.interval)
+        self.ticks += 1
+        self.next_tick += self.interval * (1 + int(late // self.interval))
+
+        values = self.morph.step(now)
+        if not self.morph.done(now):
+            return values, None
+        finished, self.morph = self.morph.target, None
+        return values, finished
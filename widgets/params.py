@@ -0,0 +1,115 @@
+"""Parameter keys and the raw Voicemeeter reads/writes behind them.
+
+A parameter is addressed by a key of the form ``strip[5].gain`` or
+``bus[0].mute``; the attribute name is the one voicemeeterlib exposes on
+its strip and bus objects.
+"""
+import re
+from .constants import ROUTING_OUTPUTS, SCRIPT_MAX_LENGTH
+from .instrumentation import INSTRUMENTS
+
+_KEY_RE = re.compile(r"^(strip|bus)\[(\d+)\]\.(\w+)$")
+
+
+def param_key(kind, index, name):
+    """Build the key for parameter ``name`` of ``kind`` ('strip' or 'bus')."""
+    return f"{kind}[{index}].{name}"
+
+
+def parse_key(key):
+    """Split a key into ``(kind, index, name)``."""
+    match = _KEY_RE.match(key)
+    if not match:
+        raise ValueError(f"Invalid parameter key: {key!r}")
+    kind, index, name = match.groups()
+    return kind, int(index), name
+
+
+def strip_keys(strip_idx):
+    """Keys for the gain, mute and routing of one strip."""
+    names = ["gain", "mute"] + ROUTING_OUTPUTS
+    return [param_key("strip", strip_idx, name) for name in names]
+
+
+def bus_keys(bus_idx):
+    """Keys for the gain and mute of one bus."""
+    return [param_key("bus", bus_idx, name) for name in ["gain", "mute"]]
+
+
+def normalize(name, value):
+    """Coerce a raw value: gains are floats, every toggle is a bool."""
+    if name == "gain":
+        return float(value)
+    return bool(value)
+
+
+def _target(vm, kind, index):
+    return getattr(vm, kind)[index]
+
+
+def read_param(vm, key):
+    """Read one parameter from Voicemeeter."""
+    kind, index, name = parse_key(key)
+    with INSTRUMENTS.timed("vm.read"):
+        return normalize(name, getattr(_target(vm, kind, index), name))
+
+
+def write_param(vm, key, value):
+    """Write one parameter to Voicemeeter."""
+    kind, index, name = parse_key(key)
+    with INSTRUMENTS.timed("vm.write"):
+        setattr(_target(vm, kind, index), name, value)
+
+
+def read_params(vm, keys):
+    """Read several parameters, skipping any the engine does not expose."""
+    values = {}
+    for key in keys:
+        try:
+            values[key] = read_param(vm, key)
+        except (IndexError, AttributeError, TypeError, ValueError):
+            pass
+    return values
+
+
+def script_value(value):
+    """Format a value the way Voicemeeter scripts expect it."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return f"{float(value):g}"
+
+
+def compile_script(params):
+    """Compile ``{key: value}`` into Voicemeeter script statements.
+
+    Returns a list of scripts, each shorter than ``SCRIPT_MAX_LENGTH``, in
+    the form ``Strip[5].Gain=-6;Strip[5].A1=1;``.
+    """
+    scripts, current = [], ""
+    for key, value in params.items():
+        kind, index, name = parse_key(key)
+        statement = f"{kind.capitalize()}[{index}].{name[0].upper()}{name[1:]}={script_value(value)};"
+        if current and len(current) + len(statement) > SCRIPT_MAX_LENGTH:
+            scripts.append(current)
+            current = ""
+        current += statement
+    if current:
+        scripts.append(current)
+    return scripts
+
+
+def write_params(vm, params):
+    """Write several parameters in one script call.
+
+    Falls back to one write per key if the engine has no ``sendtext``.
+    """
+    if not params:
+        return
+    sendtext = getattr(vm, "sendtext", None)
+    if sendtext is None:
+        for key, value in params.items():
+            write_param(vm, key, value)
+        return
+    for script in compile_script(params):
+        with INSTRUMENTS.timed("vm.script"):
+            sendtext(script)
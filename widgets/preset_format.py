@@ -0,0 +1,308 @@
+"""Versioned preset schema covering every strip and bus of a Voicemeeter kind.
+
+Version 3 documents look like::
+
+    {"version": 3, "kind": "potato",
+     "strips": {"gain_mask": 224, "gain": [0.0, ...], "mute_mask": 224, "mute": 0,
+                "routing_mask": [0, ...], "routing": [0, ...]},
+     "buses": {"gain_mask": 0, "gain": [0.0, ...], "mute_mask": 0, "mute": 0}}
+
+``gain`` holds one value per strip or bus of the kind. ``mute`` packs one
+bit per strip or bus, and each ``routing`` entry packs one bit per
+``ROUTING_OUTPUTS`` entry (A1 = bit 0). Every field has a mask with the
+same layout that marks the values the preset actually sets, so a preset
+that only saves ``strip[5].A1`` leaves the gain, mute and other outputs of
+strip 5 alone, as well as every other strip.
+
+The same document can be stored as JSON or in a compact little-endian
+binary form (``.vmp``) that starts with ``BINARY_MAGIC``. Older files are
+migrated on load: version 1 used stringified strip indices, and version 2
+had a single mask per strip or bus covering all of its fields.
+"""
+import functools
+import json
+import struct
+from .constants import KIND_LAYOUTS, DEFAULT_KIND, ROUTING_OUTPUTS
+from .params import param_key, parse_key
+
+PRESET_VERSION = 3
+BINARY_MAGIC = b"VMP\x03"
+BINARY_MAGIC_V2 = b"VMP\x02"
+BINARY_SUFFIX = ".vmp"
+# Kind order is part of the binary format: never reorder, only append
+KINDS = ["basic", "banana", "potato"]
+
+_HEADER = struct.Struct("<4sBBB")
+
+
+class PresetFormatError(ValueError):
+    """A preset file or document that does not match the schema."""
+
+
+def kind_size(kind):
+    """Number of ``(strips, buses)`` of ``kind``."""
+    phys_in, virt_in, phys_out, virt_out = KIND_LAYOUTS[kind]
+    return phys_in + virt_in, phys_out + virt_out
+
+
+def kind_outputs(kind):
+    """Routing outputs that exist on ``kind`` (e.g. A1, A2, B1 on banana)."""
+    _, _, phys_out, virt_out = KIND_LAYOUTS[kind]
+    return [f"A{i + 1}" for i in range(phys_out)] + [f"B{i + 1}" for i in range(virt_out)]
+
+
+def preset_keys(kind):
+    """Every parameter key a full preset for ``kind`` covers."""
+    n_strips, n_buses = kind_size(kind)
+    names = ["gain", "mute"] + kind_outputs(kind)
+    return ([param_key("strip", idx, name) for idx in range(n_strips) for name in names]
+            + [param_key("bus", idx, name) for idx in range(n_buses) for name in ["gain", "mute"]])
+
+
+def encode(params, kind=DEFAULT_KIND):
+    """Pack ``{key: value}`` into a version 3 document for ``kind``.
+
+    Keys outside the kind's topology are dropped.
+    """
+    if kind not in KIND_LAYOUTS:
+        raise PresetFormatError(f"Unknown Voicemeeter kind: {kind!r}")
+    n_strips, n_buses = kind_size(kind)
+    strips = {"gain_mask": 0, "gain": [0.0] * n_strips, "mute_mask": 0, "mute": 0,
+              "routing_mask": [0] * n_strips, "routing": [0] * n_strips}
+    buses = {"gain_mask": 0, "gain": [0.0] * n_buses, "mute_mask": 0, "mute": 0}
+    for key, value in params.items():
+        target, idx, name = parse_key(key)
+        section, size = (strips, n_strips) if target == "strip" else (buses, n_buses)
+        if idx >= size:
+            continue
+        if name == "gain":
+            section["gain_mask"] |= 1 << idx
+            section["gain"][idx] = float(value)
+        elif name == "mute":
+            section["mute_mask"] |= 1 << idx
+            if value:
+                section["mute"] |= 1 << idx
+        elif target == "strip" and name in ROUTING_OUTPUTS:
+            out_bit = 1 << ROUTING_OUTPUTS.index(name)
+            strips["routing_mask"][idx] |= out_bit
+            if value:
+                strips["routing"][idx] |= out_bit
+    return {"version": PRESET_VERSION, "kind": kind, "strips": strips, "buses": buses}
+
+
+def decode(doc):
+    """Validate a document of any version; return ``{key: value}``."""
+    doc = migrate(doc)
+    kind = doc.get("kind")
+    if kind not in KIND_LAYOUTS:
+        raise PresetFormatError(f"Unknown Voicemeeter kind: {kind!r}")
+    n_strips, n_buses = kind_size(kind)
+    strips = _section(doc, "strips", n_strips, _STRIP_FIELDS)
+    buses = _section(doc, "buses", n_buses, _BUS_FIELDS)
+    strip_keys, bus_keys = _key_layout(kind)
+
+    params = {}
+    _decode_faders(params, strips, [keys[:2] for keys in strip_keys])
+    routing_mask, routing = strips["routing_mask"], strips["routing"]
+    for idx, (_, _, outputs) in enumerate(strip_keys):
+        present = routing_mask[idx]
+        if not present:
+            continue
+        for key, out_bit in outputs:
+            if present & out_bit:
+                params[key] = bool(routing[idx] & out_bit)
+    _decode_faders(params, buses, bus_keys)
+    return params
+
+
+def _decode_faders(params, section, keys):
+    """Add the gains and mutes a section's masks mark as set."""
+    gain_mask, mute_mask, mute = section["gain_mask"], section["mute_mask"], section["mute"]
+    for idx, (gain_key, mute_key) in enumerate(keys):
+        bit = 1 << idx
+        if gain_mask & bit:
+            params[gain_key] = round(float(section["gain"][idx]), 2)
+        if mute_mask & bit:
+            params[mute_key] = bool(mute & bit)
+
+
+@functools.lru_cache(maxsize=None)
+def _key_layout(kind):
+    """Parameter keys of ``kind`` in document order, built once per kind."""
+    n_strips, n_buses = kind_size(kind)
+    outputs = [(name, 1 << ROUTING_OUTPUTS.index(name)) for name in kind_outputs(kind)]
+    strips = [(param_key("strip", idx, "gain"), param_key("strip", idx, "mute"),
+               [(param_key("strip", idx, name), bit) for name, bit in outputs])
+              for idx in range(n_strips)]
+    buses = [(param_key("bus", idx, "gain"), param_key("bus", idx, "mute"))
+             for idx in range(n_buses)]
+    return strips, buses
+
+
+# (bitfields with one bit per strip or bus, per-entry arrays) of each section
+_STRIP_FIELDS = (["gain_mask", "mute_mask", "mute"],
+                 [("gain", (int, float)), ("routing_mask", int), ("routing", int)])
+_BUS_FIELDS = (["gain_mask", "mute_mask", "mute"], [("gain", (int, float))])
+_STRIP_FIELDS_V2 = (["mask", "mute"], [("gain", (int, float)), ("routing", int)])
+_BUS_FIELDS_V2 = (["mask", "mute"], [("gain", (int, float))])
+
+
+def _section(doc, name, size, fields):
+    section = doc.get(name)
+    if not isinstance(section, dict):
+        raise PresetFormatError(f"Missing {name!r} section")
+    bitfields, arrays = fields
+    for field in bitfields:
+        if not isinstance(section.get(field), int) or isinstance(section[field], bool) \
+                or section[field] < 0 or section[field] >> size:
+            raise PresetFormatError(f"Invalid {name}.{field}")
+    for field, types in arrays:
+        values = section.get(field)
+        if not isinstance(values, list) or len(values) != size:
+            raise PresetFormatError(f"{name}.{field} must have {size} entries")
+        if not all(isinstance(v, types) and not isinstance(v, bool) for v in values):
+            raise PresetFormatError(f"Invalid value in {name}.{field}")
+    return section
+
+
+def migrate(data):
+    """Bring a parsed document of any known version up to version 3."""
+    if not isinstance(data, dict):
+        raise PresetFormatError("Preset must be an object")
+    version = data.get("version", 1)
+    if version == PRESET_VERSION:
+        return data
+    if version == 2:
+        return migrate_v2(data)
+    if version == 1:
+        return encode(decode_v1(data), DEFAULT_KIND)
+    raise PresetFormatError(f"Unsupported preset version: {version!r}")
+
+
+def migrate_v2(doc):
+    """Split the single per-strip/bus mask of a version 2 document into
+    per-field masks; a masked strip set every output of its kind."""
+    kind = doc.get("kind")
+    if kind not in KIND_LAYOUTS:
+        raise PresetFormatError(f"Unknown Voicemeeter kind: {kind!r}")
+    n_strips, n_buses = kind_size(kind)
+    strips = _section(doc, "strips", n_strips, _STRIP_FIELDS_V2)
+    buses = _section(doc, "buses", n_buses, _BUS_FIELDS_V2)
+    all_outputs = sum(1 << ROUTING_OUTPUTS.index(name) for name in kind_outputs(kind))
+    strip_mask, bus_mask = strips["mask"], buses["mask"]
+    return {
+        "version": PRESET_VERSION,
+        "kind": kind,
+        "strips": {"gain_mask": strip_mask, "gain": strips["gain"], "mute_mask": strip_mask,
+                   "mute": strips["mute"],
+                   "routing_mask": [all_outputs if strip_mask >> idx & 1 else 0 for idx in range(n_strips)],
+                   "routing": strips["routing"]},
+        "buses": {"gain_mask": bus_mask, "gain": buses["gain"], "mute_mask": bus_mask,
+                  "mute": buses["mute"]},
+    }
+
+
+def decode_v1(data):
+    """Read a version 1 document (``{"5": {"gain", "mute", "routing"}}``)."""
+    params = {}
+    try:
+        for idx_str, strip_data in data.items():
+            idx = int(idx_str)
+            params[param_key("strip", idx, "gain")] = float(strip_data.get("gain", 0))
+            params[param_key("strip", idx, "mute")] = bool(strip_data.get("mute", False))
+            for out, state in strip_data.get("routing", {}).items():
+                if out in ROUTING_OUTPUTS:
+                    params[param_key("strip", idx, out)] = bool(state)
+    except (AttributeError, TypeError, ValueError) as e:
+        raise PresetFormatError(f"Invalid version 1 preset: {e}") from e
+    return params
+
+
+@functools.lru_cache(maxsize=None)
+def _body(n_strips, n_buses):
+    return struct.Struct(f"<IIIIII{n_strips}f{n_strips}B{n_strips}B{n_buses}f")
+
+
+@functools.lru_cache(maxsize=None)
+def _body_v2(n_strips, n_buses):
+    return struct.Struct(f"<II{n_strips}fI{n_strips}B{n_buses}fI")
+
+
+def to_bytes(doc):
+    """Binary form of a version 3 document."""
+    kind = doc["kind"]
+    n_strips, n_buses = kind_size(kind)
+    strips, buses = doc["strips"], doc["buses"]
+    header = _HEADER.pack(BINARY_MAGIC, KINDS.index(kind), n_strips, n_buses)
+    body = _body(n_strips, n_buses).pack(
+        strips["gain_mask"], strips["mute_mask"], strips["mute"],
+        buses["gain_mask"], buses["mute_mask"], buses["mute"],
+        *strips["gain"], *strips["routing_mask"], *strips["routing"], *buses["gain"],
+    )
+    return header + body
+
+
+def from_bytes(data):
+    """Parse the binary form (version 3, or version 2) into a version 3 document."""
+    try:
+        magic, kind_idx, n_strips, n_buses = _HEADER.unpack_from(data)
+    except struct.error as e:
+        raise PresetFormatError(f"Truncated preset: {e}") from e
+    if magic not in (BINARY_MAGIC, BINARY_MAGIC_V2):
+        raise PresetFormatError("Not a binary preset")
+    if kind_idx >= len(KINDS) or kind_size(KINDS[kind_idx]) != (n_strips, n_buses):
+        raise PresetFormatError("Binary preset does not match its Voicemeeter kind")
+    body = (_body if magic == BINARY_MAGIC else _body_v2)(n_strips, n_buses)
+    if len(data) != _HEADER.size + body.size:
+        raise PresetFormatError("Binary preset has the wrong size")
+    values = body.unpack_from(data, _HEADER.size)
+    kind = KINDS[kind_idx]
+    if magic == BINARY_MAGIC_V2:
+        return migrate_v2(_unpack_v2(values, kind, n_strips, n_buses))
+    arrays, pos = [], 6
+    for size in (n_strips, n_strips, n_strips, n_buses):
+        arrays.append(list(values[pos:pos + size]))
+        pos += size
+    strip_gain, routing_mask, routing, bus_gain = arrays
+    return {
+        "version": PRESET_VERSION,
+        "kind": kind,
+        "strips": {"gain_mask": values[0], "gain": strip_gain, "mute_mask": values[1],
+                   "mute": values[2], "routing_mask": routing_mask, "routing": routing},
+        "buses": {"gain_mask": values[3], "gain": bus_gain, "mute_mask": values[4],
+                  "mute": values[5]},
+    }
+
+
+def _unpack_v2(values, kind, n_strips, n_buses):
+    strip_mask, bus_mask = values[0], values[1]
+    pos = 2
+    strip_gain = list(values[pos:pos + n_strips])
+    pos += n_strips
+    strip_mute = values[pos]
+    pos += 1
+    routing = list(values[pos:pos + n_strips])
+    pos += n_strips
+    bus_gain = list(values[pos:pos + n_buses])
+    bus_mute = values[pos + n_buses]
+    return {
+        "version": 2,
+        "kind": kind,
+        "strips": {"mask": strip_mask, "gain": strip_gain, "mute": strip_mute, "routing": routing},
+        "buses": {"mask": bus_mask, "gain": bus_gain, "mute": bus_mute},
+    }
+
+
+def loads(data):
+    """Parse preset file contents (JSON of any version, or binary)."""
+    if data.startswith((BINARY_MAGIC, BINARY_MAGIC_V2)):
+        return decode(from_bytes(data))
+    return decode(json.loads(data))
+
+
+def dumps(params, kind=DEFAULT_KIND, binary=False):
+    """Serialise ``{key: value}`` as a version 3 preset."""
+    doc = encode(params, kind)
+    if binary:
+        return to_bytes(doc)
+    return json.dumps(doc).encode()
@@ -0,0 +1,113 @@
+"""Preset directory indexed once and held parsed in memory."""
+from pathlib import Path
+from PyQt5 import QtCore
+from .preset_format import BINARY_SUFFIX
+from .preset_manager import PresetManager
+
+PRESET_SUFFIXES = (".json", BINARY_SUFFIX)
+
+
+class PresetLibrary(QtCore.QObject):
+    """Every preset (JSON or binary) in ``directory``, parsed into
+    ``{key: value}``.
+
+    The directory is indexed on construction and watched afterwards. On a
+    change only files that are new, modified or removed are re-read, so
+    switching presets never touches the disk. A missing directory gives an
+    empty library; call ``rescan`` once it exists to start watching it.
+
+    Presets are named after their file stem. When two files share a stem
+    (``Live.json`` and ``Live.vmp``) both are named by their full file
+    name. Files that are empty or invalid are left out.
+    """
+
+    changed = QtCore.pyqtSignal()
+
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.directory = Path(directory)
+        self._presets = {}  # path -> params
+        self._names = {}    # display name -> path
+        self._mtimes = {}   # path -> mtime_ns of the parsed version
+
+        # Measurement counters
+        self.parses = 0
+
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.rescan)
+        self.watcher.fileChanged.connect(self.rescan)
+        self.rescan()
+
+    def names(self):
+        return sorted(self._names, key=str.lower)
+
+    def get(self, name):
+        """Parsed preset ``name``, or ``None`` if it is not in the library."""
+        path = self._names.get(name)
+        return self._presets.get(path) if path is not None else None
+
+    def __len__(self):
+        return len(self._presets)
+
+    def rescan(self, *_):
+        """Re-read new or modified presets and drop deleted ones.
+
+        Returns the number of presets added, updated or removed.
+        """
+        if not self.directory.is_dir():
+            dropped = self._drop(set(self._mtimes))
+            if dropped:
+                self._index_names()
+                self.changed.emit()
+            return dropped
+        directory = str(self.directory)
+        if directory not in self.watcher.directories():
+            self.watcher.addPath(directory)
+
+        watched = set(self.watcher.files())
+        seen = set()
+        updated = 0
+        for path in self.directory.iterdir():
+            if path.suffix.lower() not in PRESET_SUFFIXES:
+                continue
+            try:
+                mtime = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            seen.add(path)
+            if self._mtimes.get(path) == mtime:
+                continue
+            self.parses += 1
+            params = PresetManager.read_preset(path)
+            if params:
+                self._presets[path] = params
+            else:
+                self._presets.pop(path, None)
+            self._mtimes[path] = mtime
+            if str(path) not in watched:
+                self.watcher.addPath(str(path))
+            updated += 1
+
+        updated += self._drop(set(self._mtimes) - seen)
+        if updated:
+            self._index_names()
+            self.changed.emit()
+        return updated
+
+    def _drop(self, paths):
+        watched = set(self.watcher.files())
+        for path in paths:
+            self._mtimes.pop(path, None)
+            self._presets.pop(path, None)
+            if str(path) in watched:
+                self.watcher.removePath(str(path))
+        return len(paths)
+
+    def _index_names(self):
+        stems = {}
+        for path in self._presets:
+            stems.setdefault(path.stem, []).append(path)
+        self._names = {}
+        for stem, paths in stems.items():
+            for path in paths:
+                self._names[stem if len(paths) == 1 else path.name] = path
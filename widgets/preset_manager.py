@@ -1,6 +1,9 @@
-import json
 from pathlib import Path
-from .constants import STRIP_INDICES
+from . import preset_format
+from .constants import DEFAULT_KIND
+from .levels import kind_name
+from .params import read_params, write_params
+from .reconciler import diff, verify
 
 
 class PresetManager:
@@ -8,41 +11,51 @@ class PresetManager:
 
     @staticmethod
     def save_preset(vm, file_path):
-        """Save current strip settings to ``file_path``."""
-        data = {}
-        for idx in STRIP_INDICES:
-            if idx >= len(vm.strip):
-                continue
-            strip = vm.strip[idx]
-            routing = {out: bool(getattr(strip, out, False))
-                       for out in ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]}
-            data[idx] = {
-                "gain": getattr(strip, "gain", 0),
-                "mute": getattr(strip, "mute", False),
-                "routing": routing,
-            }
+        """Save every strip and bus of the connected kind to ``file_path``."""
+        kind = kind_name(vm)
+        params = read_params(vm, preset_format.preset_keys(kind))
+        PresetManager.write_preset(params, file_path, kind)
+
+    @staticmethod
+    def write_preset(params, file_path, kind=DEFAULT_KIND):
+        """Save a ``{param key: value}`` dict (e.g. a ``StateStore``
+        snapshot) to ``file_path``.
+
+        Files ending in ``.vmp`` use the binary encoding, anything else JSON.
+        """
         path = Path(file_path)
-        with path.open("w") as fh:
-            json.dump(data, fh)
+        binary = path.suffix.lower() == preset_format.BINARY_SUFFIX
+        path.write_bytes(preset_format.dumps(params, kind, binary=binary))
 
     @staticmethod
-    def load_preset(vm, file_path):
-        """Load strip settings from ``file_path``."""
+    def read_preset(file_path):
+        """Read ``file_path`` into a ``{param key: value}`` dict.
+
+        Older versions are migrated. Returns an empty dict if the file is
+        missing or invalid.
+        """
         path = Path(file_path)
         try:
-            with path.open() as fh:
-                data = json.load(fh)
-        except (OSError, json.JSONDecodeError):
-            return
-
-        for idx_str, strip_data in data.items():
-            idx = int(idx_str)
-            if idx >= len(vm.strip):
-                continue
-            strip = vm.strip[idx]
-            setattr(strip, "gain", float(strip_data.get("gain", 0)))
-            setattr(strip, "mute", bool(strip_data.get("mute", False)))
-            routing = strip_data.get("routing", {})
-            for out, state in routing.items():
-                setattr(strip, out, bool(state))
+            return preset_format.loads(path.read_bytes())
+        except OSError:
+            return {}
+        except ValueError as e:
+            print(f"Invalid preset {path}: {e}")
+            return {}
+
+    @staticmethod
+    def load_preset(vm, file_path, dry_run=False):
+        """Load strip settings from ``file_path``, writing only what changed.
 
+        Current state comes from one batched read; the settings that differ
+        are written in one script call. With ``dry_run`` nothing is written
+        and the ``{key: value}`` diff is returned. Otherwise returns any
+        setting that did not take, checked with one batched read afterwards.
+        """
+        params = PresetManager.read_preset(file_path)
+        current = read_params(vm, params)
+        changes = diff({key: value for key, value in params.items() if key in current}, current)
+        if dry_run:
+            return changes
+        write_params(vm, changes)
+        return verify(vm, changes)
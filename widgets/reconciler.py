@@ -0,0 +1,74 @@
+"""Hold parameters at target values and correct any drift in one pass."""
+from .params import read_params, write_params
+
+TOLERANCE = 0.1
+
+
+def matches(target, actual):
+    """True if ``actual`` is close enough to ``target``."""
+    if isinstance(target, bool):
+        return bool(actual) == target
+    return abs(float(actual) - float(target)) <= TOLERANCE
+
+
+def diff(target, current):
+    """Entries of ``target`` that ``current`` does not already hold.
+
+    Keys missing from ``current`` count as changed.
+    """
+    return {key: value for key, value in target.items()
+            if key not in current or not matches(value, current[key])}
+
+
+def verify(vm, params):
+    """Re-read ``params`` in one batch; return ``{key: target}`` for every
+    value Voicemeeter does not hold (missing parameters are skipped)."""
+    actual = read_params(vm, params)
+    return diff({key: value for key, value in params.items() if key in actual}, actual)
+
+
+class Reconciler:
+    """Desired values with deadlines, verified together.
+
+    Voicemeeter occasionally overrides a value right after it was written
+    (e.g. a gain reset bouncing back). Instead of a timer chain per control,
+    every held parameter is re-read in one batch per ``reconcile`` call and
+    only the drifted ones are written again. Targets are dropped once their
+    deadline passes.
+    """
+
+    def __init__(self):
+        self._targets = {}  # key -> (value, deadline)
+
+        # Measurement counters
+        self.passes = 0
+        self.corrections = 0
+
+    def hold(self, key, value, deadline):
+        """Keep ``key`` at ``value`` until ``deadline`` (monotonic seconds)."""
+        self._targets[key] = (value, deadline)
+
+    def release(self, key):
+        """Stop holding ``key``, e.g. because the user changed it."""
+        self._targets.pop(key, None)
+
+    def pending(self):
+        return bool(self._targets)
+
+    def targets(self):
+        return {key: value for key, (value, _) in self._targets.items()}
+
+    def reconcile(self, vm, now):
+        """Verify all live targets with one batched read; fix any drift.
+
+        Returns ``{key: target}`` for every target still held.
+        """
+        self._targets = {key: target for key, target in self._targets.items()
+                         if target[1] > now}
+        if not self._targets:
+            return {}
+        self.passes += 1
+        drifted = verify(vm, self.targets())
+        write_params(vm, drifted)
+        self.corrections += len(drifted)
+        return self.targets()
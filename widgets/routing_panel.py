@@ -1,9 +1,22 @@
 from PyQt5 import QtWidgets, QtCore
+from .bindings import Bindings
+from .params import param_key
+from .state_store import StateStore, DirectBackend
+from .theme import LIGHT, apply_theme, set_variant
+from .topology import default_topology
 
 class RoutingPanel(QtWidgets.QWidget):
-    def __init__(self, vm):
+    def __init__(self, vm, store=None, topology=None):
         super().__init__()
         self.vm = vm
+        self.topology = topology if topology is not None else default_topology()
+        # Routing is read from and written through the state store
+        if store is None:
+            keys = self.topology.param_keys()
+            store = StateStore(DirectBackend(vm, keys), keys)
+            store.refresh()
+        self.store = store
+        self.bindings = Bindings()
         self.setWindowFlags(
             QtCore.Qt.Tool |
             QtCore.Qt.FramelessWindowHint |
@@ -16,16 +29,16 @@ class RoutingPanel(QtWidgets.QWidget):
         # Title
         title = QtWidgets.QLabel("Output Routing - Virtual Inputs")
         title.setAlignment(QtCore.Qt.AlignCenter)
-        title.setStyleSheet("font-weight: bold; font-size: 14px; margin: 5px;")
+        set_variant(title, "section")
         main_layout.addWidget(title)
         
         # Create routing matrix with vertical alignment
         routing_layout = QtWidgets.QHBoxLayout()
         self.buttons = {}
-        strip_names = ["Voicemeeter Input", "Voicemeeter AUX", "VAIO3"]
-        outputs = ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]
+        outputs = self.topology.outputs
         
-        for i, strip_name in enumerate(strip_names):
+        for i in self.topology.strips:
+            strip_name = self.topology.strip_name(i)
             # Create group box for each virtual input
             group_box = QtWidgets.QGroupBox(strip_name)
             group_box.setFixedWidth(150)
@@ -38,15 +51,11 @@ class RoutingPanel(QtWidgets.QWidget):
                 btn.setCheckable(True)
                 btn.setFixedSize(120, 25)  # Fixed size for better visibility
                 
-                # Set initial state from Voicemeeter
-                try:
-                    current_state = getattr(self.vm.strip[i], output)
-                    btn.setChecked(current_state)
-                except (IndexError, AttributeError):
-                    btn.setChecked(False)
+                # Set initial state from the store
+                btn.setChecked(bool(self.store.get(param_key("strip", i, output), False)))
                 
-                # Style the button
-                self._style_button(btn)
+                set_variant(btn, "route")
+                self.bindings.bind_checkable(param_key("strip", i, output), btn)
                 
                 # Connect signal
                 btn.clicked.connect(lambda checked, strip=i, out=output: self._toggle_output(strip, out, checked))
@@ -60,49 +69,21 @@ class RoutingPanel(QtWidgets.QWidget):
         
         main_layout.addLayout(routing_layout)
         self.setLayout(main_layout)
+        apply_theme(self, LIGHT)
+        self.store.changed.connect(self.apply_params)
 
-    def _style_button(self, btn):
-        """Apply custom styling to routing buttons"""
-        style = """
-        QPushButton {
-            border: 2px solid #555;
-            border-radius: 4px;
-            background-color: #f0f0f0;
-            color: black;
-            font-weight: bold;
-            font-size: 11px;
-            padding: 2px;
-        }
-        QPushButton:checked {
-            background-color: #4CAF50;
-            color: white;
-            border-color: #45a049;
-        }
-        QPushButton:hover {
-            background-color: #e0e0e0;
-        }
-        QPushButton:checked:hover {
-            background-color: #45a049;
-        }
-        """
-        btn.setStyleSheet(style)
+    def apply_params(self, params):
+        """Update the widgets from parameter changes in the store"""
+        self.bindings.apply(params)
 
     def _toggle_output(self, strip_idx, output, checked):
         """Toggle output routing for specified strip and output"""
-        try:
-            if strip_idx < len(self.vm.strip):
-                setattr(self.vm.strip[strip_idx], output, checked)
-                # Update button visual state
-                self.buttons[strip_idx][output].setChecked(checked)
-        except (IndexError, AttributeError) as e:
-            print(f"Error toggling {output} for strip {strip_idx}: {e}")
+        key = param_key("strip", strip_idx, output)
+        self.store.set(key, checked)
+        # Update button visual state
+        self.bindings.apply({key: checked})
 
     def update_routing_states(self):
         """Update all button states from current Voicemeeter settings"""
-        for strip_idx in range(min(3, len(self.vm.strip))):
-            for output in ["A1", "A2", "A3", "A4", "A5", "B1", "B2", "B3"]:
-                try:
-                    current_state = getattr(self.vm.strip[strip_idx], output)
-                    self.buttons[strip_idx][output].setChecked(current_state)
-                except (IndexError, AttributeError, KeyError):
-                    pass
+        self.store.refresh()
+        self.bindings.apply(self.store.snapshot(self.bindings.keys()))
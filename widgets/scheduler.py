@@ -0,0 +1,90 @@
+"""Adaptive refresh scheduling for the VU meters."""
+import time
+from PyQt5 import QtCore
+from .constants import (
+    VU_UPDATE_INTERVAL_MS,
+    VU_IDLE_INTERVAL_MS,
+    VU_HIDDEN_INTERVAL_MS,
+    SILENCE_BACKOFF_MS,
+    SILENCE_THRESHOLD_DB,
+)
+
+
+class RefreshScheduler(QtCore.QObject):
+    """Pick the meter refresh interval from visibility and signal activity.
+
+    ``apply_interval`` is called with the new interval in milliseconds
+    whenever it changes; ``0`` means stop refreshing entirely. The owner
+    reports each tick through ``record_tick`` so wakeups and time spent
+    ticking can be compared between modes.
+    """
+
+    interval_changed = QtCore.pyqtSignal(int)
+
+    def __init__(self, apply_interval, active_ms=VU_UPDATE_INTERVAL_MS,
+                 idle_ms=VU_IDLE_INTERVAL_MS, hidden_ms=VU_HIDDEN_INTERVAL_MS,
+                 silence_ms=SILENCE_BACKOFF_MS, clock=time.monotonic):
+        super().__init__()
+        self.apply_interval = apply_interval
+        self.active_ms = active_ms
+        self.idle_ms = idle_ms
+        self.hidden_ms = hidden_ms
+        self.silence_ms = silence_ms
+        self.clock = clock
+
+        self.visible = False
+        self.interval = None
+        self._silent_since = None
+
+        # Measurement counters
+        self.wakeups = 0
+        self.busy_time = 0.0
+        self._started = clock()
+
+    def set_visible(self, visible):
+        """Switch between the visible and hidden rates."""
+        self.visible = visible
+        self._silent_since = None
+        self._apply()
+
+    def record_tick(self, peak_db, duration=0.0):
+        """Account for one refresh and back off when levels stay silent."""
+        self.wakeups += 1
+        self.busy_time += duration
+        if peak_db <= SILENCE_THRESHOLD_DB:
+            if self._silent_since is None:
+                self._silent_since = self.clock()
+        else:
+            self._silent_since = None
+        self._apply()
+
+    def _target_interval(self):
+        if not self.visible:
+            return self.hidden_ms
+        if (self._silent_since is not None
+                and (self.clock() - self._silent_since) * 1000 >= self.silence_ms):
+            return self.idle_ms
+        return self.active_ms
+
+    def _apply(self):
+        interval = self._target_interval()
+        if interval != self.interval:
+            self.interval = interval
+            self.apply_interval(interval)
+            self.interval_changed.emit(interval)
+
+    def stats(self):
+        """Wakeups and CPU time spent ticking since creation or last reset."""
+        elapsed = max(self.clock() - self._started, 1e-9)
+        return {
+            "interval_ms": self.interval,
+            "wakeups": self.wakeups,
+            "wakeups_per_s": self.wakeups / elapsed,
+            "busy_ms": self.busy_time * 1000,
+            "busy_pct": 100.0 * self.busy_time / elapsed,
+        }
+
+    def reset_stats(self):
+        self.wakeups = 0
+        self.busy_time = 0.0
+        self._started = self.clock()
@@ -0,0 +1,304 @@
+"""In-process stand-in for a voicemeeterlib ``Remote``.
+
+``SimulatedVM`` implements the part of the voicemeeterlib surface VMControl
+uses: strip and bus parameters, ``get_level`` and the ``levels`` views,
+the ``pdirty``/``ldirty`` flags, ``sendtext`` scripts and login/logout.
+Every call is counted in ``calls`` and can be slowed down by a per-call
+latency, and input levels come from generator functions. This lets the
+hot paths be exercised and measured headlessly, e.g.::
+
+    vm = SimulatedVM("potato", latency={"sendtext": 0.002})
+    vm.set_generator(sine(period_s=2.0))
+"""
+import collections
+import math
+import random
+import re
+import time
+from .constants import KIND_LAYOUTS, DEFAULT_KIND, ROUTING_OUTPUTS
+from .levels import (STRIP_PREFADER, STRIP_POSTFADER, STRIP_POSTMUTE, BUS_OUTPUT,
+                     strip_channel_offset, bus_channel_offset)
+from .params import normalize, param_key, parse_key
+
+_STATEMENT_RE = re.compile(r"^\s*(strip|bus)\[(\d+)\]\.(\w+)\s*=\s*(\S+)\s*$", re.IGNORECASE)
+# Channels per bus, and per virtual strip (physical strips have 2)
+BUS_CHANNELS = 8
+VIRTUAL_CHANNELS = 8
+
+
+class EngineStopped(RuntimeError):
+    """Raised by every call while the simulated engine is not running."""
+
+
+# -- Level generators --------------------------------------------------------
+# A generator maps (strip index, channel, time in seconds) to an input level
+# in dB; ``None`` means no signal.
+
+def silence():
+    return lambda strip_idx, channel, t: None
+
+
+def constant(db=-12.0):
+    return lambda strip_idx, channel, t: db
+
+
+def sine(period_s=2.0, low_db=-48.0, high_db=-3.0):
+    """Levels sweeping between ``low_db`` and ``high_db``; strips are phase shifted."""
+    def level(strip_idx, channel, t):
+        phase = 2 * math.pi * (t / period_s + strip_idx / 8.0)
+        return low_db + (high_db - low_db) * (0.5 + 0.5 * math.sin(phase))
+    return level
+
+
+def noise(low_db=-60.0, high_db=0.0, seed=0):
+    """Random levels, reproducible for a given ``seed``."""
+    rng = random.Random(seed)
+    return lambda strip_idx, channel, t: rng.uniform(low_db, high_db)
+
+
+def _amplitude(db):
+    return 0.0 if db is None else 10.0 ** (db / 20.0)
+
+
+def _db(amplitude):
+    return round(20 * math.log10(amplitude), 1) if amplitude > 0 else -200.0
+
+
+class SimKind:
+    def __init__(self, name):
+        self.name = name
+
+
+class SimLevels:
+    """``strip[i].levels`` / ``bus[i].levels`` views, in dB like voicemeeterlib."""
+
+    def __init__(self, vm, target, idx):
+        self._vm = vm
+        self._target = target
+        self._idx = idx
+
+    def _read(self, mode):
+        first, count = self._vm.channels(self._target, self._idx)
+        return tuple(_db(self._vm.get_level(mode, first + ch)) for ch in range(count))
+
+    @property
+    def prefader(self):
+        return self._read(STRIP_PREFADER)
+
+    @property
+    def postfader(self):
+        return self._read(STRIP_POSTFADER)
+
+    @property
+    def postmute(self):
+        return self._read(STRIP_POSTMUTE)
+
+    @property
+    def all(self):
+        return self._read(BUS_OUTPUT)
+
+
+class SimChannel:
+    """One strip or bus; attribute access goes through the engine."""
+
+    def __init__(self, vm, target, idx, names):
+        object.__setattr__(self, "_vm", vm)
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_idx", idx)
+        object.__setattr__(self, "_names", frozenset(names))
+        object.__setattr__(self, "levels", SimLevels(vm, target, idx))
+
+    def __getattr__(self, name):
+        if name not in self._names:
+            raise AttributeError(f"{self._target}[{self._idx}] has no parameter {name!r}")
+        return self._vm.get(param_key(self._target, self._idx, name))
+
+    def __setattr__(self, name, value):
+        if name not in self._names:
+            raise AttributeError(f"{self._target}[{self._idx}] has no parameter {name!r}")
+        self._vm.set(param_key(self._target, self._idx, name), value)
+
+
+class SimulatedVM:
+    """A Voicemeeter engine of ``kind`` living entirely in memory.
+
+    ``latency`` is a number of seconds added to every API call, or a dict
+    of per-call latencies (keys as in ``calls``: ``get``, ``set``,
+    ``get_level``, ``sendtext``, ``pdirty``, ``ldirty``, ``login``,
+    ``logout``). ``clock`` supplies the time levels are generated for.
+    ``set_external`` changes a parameter as Voicemeeter's own UI would.
+    """
+
+    def __init__(self, kind=DEFAULT_KIND, latency=0.0, generator=None, clock=time.monotonic):
+        if kind not in KIND_LAYOUTS:
+            raise ValueError(f"Unknown Voicemeeter kind: {kind!r}")
+        self.kind = SimKind(kind)
+        self.layout = KIND_LAYOUTS[kind]
+        phys_in, virt_in, phys_out, virt_out = self.layout
+        outputs = [f"A{i + 1}" for i in range(phys_out)] + [f"B{i + 1}" for i in range(virt_out)]
+        self.outputs = outputs
+        self.latency = latency
+        self.generator = generator if generator is not None else silence()
+        self.clock = clock
+        self.running = True
+        self.logged_in = False
+
+        self.params = {}
+        self.strip = [SimChannel(self, "strip", idx, ["gain", "mute"] + outputs)
+                      for idx in range(phys_in + virt_in)]
+        self.bus = [SimChannel(self, "bus", idx, ["gain", "mute"]) for idx in range(phys_out + virt_out)]
+        for channel in self.strip + self.bus:
+            for name in channel._names:
+                self.params[param_key(channel._target, channel._idx, name)] = normalize(name, 0)
+
+        # Measurement counters: API calls by name, writes by parameter key
+        self.calls = collections.Counter()
+        self.param_writes = collections.Counter()
+        self._pdirty = False
+
+    # -- Simulation controls (not part of the voicemeeterlib surface) -------
+
+    def set_generator(self, generator):
+        self.generator = generator
+
+    def set_external(self, key, value):
+        """Change a parameter from outside the API; sets the dirty flag."""
+        self._store(key, value)
+
+    def stop(self):
+        """Stop the engine: every call raises ``EngineStopped`` until ``start``."""
+        self.running = False
+
+    def start(self):
+        self.running = True
+
+    def reset_counters(self):
+        self.calls.clear()
+        self.param_writes.clear()
+
+    def channels(self, target, idx):
+        """``(first channel, count)`` of a strip or bus in the level arrays."""
+        if target == "bus":
+            return bus_channel_offset(self.layout, idx), BUS_CHANNELS
+        count = 2 if idx < self.layout[0] else VIRTUAL_CHANNELS
+        return strip_channel_offset(self.layout, idx), count
+
+    # -- voicemeeterlib surface ---------------------------------------------
+
+    def login(self):
+        self._call("login")
+        self.logged_in = True
+
+    def logout(self):
+        self._call("logout")
+        self.logged_in = False
+
+    def __enter__(self):
+        self.login()
+        return self
+
+    def __exit__(self, *exc):
+        self.logout()
+
+    @property
+    def pdirty(self):
+        """True once after any parameter changed, like ``VBVMR_IsParametersDirty``."""
+        self._call("pdirty")
+        dirty, self._pdirty = self._pdirty, False
+        return dirty
+
+    @property
+    def ldirty(self):
+        self._call("ldirty")
+        return True
+
+    def get(self, key):
+        """Read parameter ``key`` (``strip[5].gain``)."""
+        self._call("get")
+        return self.params[key]
+
+    def set(self, key, value):
+        """Write parameter ``key``."""
+        self._call("set")
+        self._store(key, value)
+
+    def sendtext(self, script):
+        """Apply a script of ``Strip[5].Gain=-6;Bus[0].Mute=1`` statements."""
+        self._call("sendtext")
+        for statement in re.split(r"[;\n]", script):
+            if not statement.strip():
+                continue
+            match = _STATEMENT_RE.match(statement)
+            if not match:
+                raise ValueError(f"Invalid script statement: {statement!r}")
+            target, idx, name, value = match.groups()
+            name = name.upper() if name.upper() in ROUTING_OUTPUTS else name.lower()
+            key = param_key(target.lower(), int(idx), name)
+            if key not in self.params:
+                raise ValueError(f"Unknown parameter in script: {statement!r}")
+            self._store(key, float(value) if name == "gain" else bool(int(float(value))))
+
+    def get_level(self, type_, index):
+        """Linear amplitude of level channel ``index`` in mode ``type_``."""
+        self._call("get_level")
+        t = self.clock()
+        if type_ == BUS_OUTPUT:
+            return _amplitude(self._bus_db(index // BUS_CHANNELS, index % BUS_CHANNELS, t))
+        strip_idx, channel = self._strip_channel(index)
+        if strip_idx is None:
+            return 0.0
+        return _amplitude(self._strip_db(type_, strip_idx, channel, t))
+
+    # -- Internals ------------------------------------------------------------
+
+    def _call(self, name):
+        if not self.running:
+            raise EngineStopped(f"Voicemeeter is not running ({name})")
+        self.calls[name] += 1
+        latency = self.latency.get(name, 0.0) if isinstance(self.latency, dict) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+
+    def _store(self, key, value):
+        if key not in self.params:
+            raise AttributeError(f"No parameter {key!r}")
+        _, _, name = parse_key(key)
+        self.params[key] = normalize(name, value)
+        self.param_writes[key] += 1
+        self._pdirty = True
+
+    def _strip_channel(self, index):
+        phys_in, virt_in = self.layout[0], self.layout[1]
+        if index < phys_in * 2:
+            return index // 2, index % 2
+        virtual = index - phys_in * 2
+        strip_idx = phys_in + virtual // VIRTUAL_CHANNELS
+        if strip_idx >= phys_in + virt_in:
+            return None, None
+        return strip_idx, virtual % VIRTUAL_CHANNELS
+
+    def _strip_db(self, mode, strip_idx, channel, t):
+        db = self.generator(strip_idx, channel, t)
+        if db is None or mode == STRIP_PREFADER:
+            return db
+        db += self.params[param_key("strip", strip_idx, "gain")]
+        if mode == STRIP_POSTMUTE and self.params[param_key("strip", strip_idx, "mute")]:
+            return None
+        return db
+
+    def _bus_db(self, bus_idx, channel, t):
+        """Loudest strip routed to the bus, plus the bus gain."""
+        if bus_idx >= len(self.bus) or self.params[param_key("bus", bus_idx, "mute")]:
+            return None
+        output = self.outputs[bus_idx]
+        loudest = None
+        for strip_idx in range(len(self.strip)):
+            if not self.params[param_key("strip", strip_idx, output)]:
+                continue
+            _, count = self.channels("strip", strip_idx)
+            db = self._strip_db(STRIP_POSTMUTE, strip_idx, channel % count, t)
+            if db is not None and (loudest is None or db > loudest):
+                loudest = db
+        if loudest is None:
+            return None
+        return loudest + self.params[param_key("bus", bus_idx, "gain")]
@@ -0,0 +1,70 @@
+"""Startup milestones: process start to tray visible, first click to paint."""
+import json
+import os
+import time
+from PyQt5 import QtCore
+
+
+def process_start_time(fallback=None):
+    """Wall-clock time the process started (needs psutil), or ``fallback``,
+    or now if neither is available."""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).create_time()
+    except Exception:
+        return time.time() if fallback is None else fallback
+
+
+class StartupTimer(QtCore.QObject):
+    """Record named milestones and report the two startup phases.
+
+    ``tray_visible`` is measured from process start. ``panel_painted`` is
+    measured from ``first_click``. Each finished phase is printed and, if
+    ``log_path`` is set, appended to it as one JSON line, so regressions
+    can be tracked across deployments.
+    """
+
+    def __init__(self, log_path=None, origin=None, parent=None):
+        super().__init__(parent)
+        self.origin = process_start_time() if origin is None else origin
+        self.log_path = log_path
+        self.marks = {}
+
+    def mark(self, name):
+        """Record milestone ``name`` once; later calls are ignored."""
+        if name in self.marks:
+            return
+        self.marks[name] = time.time()
+        if name == "tray_visible":
+            self._report("tray", tray_visible_ms=self.elapsed_ms("tray_visible"))
+        elif name == "panel_painted" and "first_click" in self.marks:
+            self._report("first_click",
+                         click_to_paint_ms=self.elapsed_ms("panel_painted", "first_click"),
+                         panel_prebuilt="panel_built" in self.marks
+                         and self.marks["panel_built"] <= self.marks["first_click"])
+
+    def elapsed_ms(self, name, since=None):
+        start = self.origin if since is None else self.marks[since]
+        return (self.marks[name] - start) * 1000.0
+
+    def watch_paint(self, widget):
+        """Mark ``panel_painted`` on the next paint of ``widget``."""
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint and "first_click" in self.marks:
+            obj.removeEventFilter(self)
+            self.mark("panel_painted")
+        return False
+
+    def _report(self, phase, **values):
+        print("Startup " + ", ".join(f"{k}={v:.0f}" if isinstance(v, float) else f"{k}={v}"
+                                     for k, v in values.items()))
+        if not self.log_path:
+            return
+        record = {"phase": phase, "time": self.marks[next(reversed(self.marks))], **values}
+        try:
+            with open(self.log_path, "a") as fh:
+                fh.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"Error writing startup timing: {e}")
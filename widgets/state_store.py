@@ -0,0 +1,141 @@
+"""Cached mirror of every Voicemeeter parameter the app works with."""
+from PyQt5 import QtCore
+from .constants import PRESET_MORPH_MS, MORPH_CURVE
+from .levels import LevelSnapshot
+from .params import read_params, write_param, write_params
+from .reconciler import diff
+
+
+class StateStore(QtCore.QObject):
+    """Versioned in-memory copy of strip and bus parameters.
+
+    Readers (panels, Mute All, preset saves) read the mirror instead of
+    calling into Voicemeeter. Writers go through ``set`` and ``apply``, which
+    update the mirror right away and forward the change to the backend.
+
+    The backend is a ``VMWorker`` or a ``DirectBackend``. Fresh values come
+    back in batches through its ``params_ready`` signal. ``refresh`` asks the
+    backend for a full re-read, so sync frequency is tuned in one place.
+    ``changed`` carries only the keys whose value actually changed.
+    """
+
+    changed = QtCore.pyqtSignal(dict)
+
+    def __init__(self, backend, keys, parent=None):
+        super().__init__(parent)
+        self.backend = backend
+        self.keys = list(keys)
+        self.version = 0
+        self._values = {}
+        self._versions = {}
+
+        # Measurement counters
+        self.refreshes = 0
+        self.writes = 0
+
+        backend.params_ready.connect(self._take_backend_params)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def snapshot(self, keys=None):
+        """Copy of the mirrored values, optionally limited to ``keys``."""
+        if keys is None:
+            return dict(self._values)
+        return {key: self._values[key] for key in keys if key in self._values}
+
+    def changed_since(self, version):
+        """Values of every key updated after ``version``."""
+        return {key: self._values[key] for key, v in self._versions.items() if v > version}
+
+    def diff(self, params):
+        """Entries of ``params`` the mirror does not already hold."""
+        return diff(params, self._values)
+
+    def update(self, values):
+        """Merge values read from Voicemeeter; emit the ones that changed."""
+        changed = {key: value for key, value in values.items()
+                   if key not in self._values or self._values[key] != value}
+        if not changed:
+            return changed
+        self.version += 1
+        self._values.update(changed)
+        for key in changed:
+            self._versions[key] = self.version
+        self.changed.emit(changed)
+        return changed
+
+    def set(self, key, value):
+        """Write one parameter through the store."""
+        self.writes += 1
+        self.update({key: value})
+        self.backend.submit(key, value)
+
+    def apply(self, params):
+        """Write several parameters and have the backend hold them."""
+        self.writes += len(params)
+        self.update(params)
+        self.backend.apply(params)
+
+    def morph(self, params, duration_ms=PRESET_MORPH_MS, curve=MORPH_CURVE):
+        """Fade to ``params`` over ``duration_ms``; the mirror follows the
+        backend's reports. Backends without morphing apply instantly."""
+        if duration_ms <= 0 or not hasattr(self.backend, "morph"):
+            self.apply(params)
+            return
+        self.writes += len(params)
+        self.backend.morph(params, duration_ms, curve)
+
+    def refresh(self):
+        """Ask the backend to re-read every parameter in one batch."""
+        self.refreshes += 1
+        self.backend.request_refresh()
+
+    def _take_backend_params(self):
+        self.update(self.backend.take_params())
+
+
+class DirectBackend(QtCore.QObject):
+    """Synchronous stand-in for ``VMWorker``.
+
+    It reads and writes ``vm`` on the calling thread. The standalone panels
+    use it, since they have no worker thread. ``take_levels`` reads one
+    batched frame of the ``strips`` and ``buses`` levels right away.
+    """
+
+    params_ready = QtCore.pyqtSignal()
+
+    def __init__(self, vm, keys, strips=(), buses=(), parent=None):
+        super().__init__(parent)
+        self.vm = vm
+        self.keys = list(keys)
+        self.levels = LevelSnapshot(vm, strips=strips, buses=buses)
+        self._pending = {}
+
+    def submit(self, key, value):
+        try:
+            write_param(self.vm, key, value)
+        except (IndexError, AttributeError) as e:
+            print(f"Error writing {key}: {e}")
+
+    def apply(self, params, *args, hold_ms=None):
+        if callable(params):
+            params = params(self.vm, *args)
+        try:
+            write_params(self.vm, params)
+        except (IndexError, AttributeError) as e:
+            print(f"Error writing parameters: {e}")
+
+    def request_refresh(self):
+        self._pending = read_params(self.vm, self.keys)
+        self.params_ready.emit()
+
+    def take_params(self):
+        params, self._pending = self._pending, {}
+        return params
+
+    def take_levels(self):
+        return self.levels.refresh()
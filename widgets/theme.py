@@ -0,0 +1,153 @@
+"""Application themes compiled into one stylesheet each.
+
+Widgets never set their own stylesheet. Each top-level panel applies the
+compiled theme once, and widgets pick their look through the ``variant``
+dynamic property (e.g. ``title``, ``route``). Switching theme re-applies a
+single stylesheet; no widget is rebuilt.
+"""
+import functools
+from string import Template
+from PyQt5 import QtGui
+
+DARK = "dark"
+LIGHT = "light"
+DEFAULT_THEME = DARK
+
+THEMES = {
+    DARK: {
+        "window": "#2b2b2b",
+        "text": "#ffffff",
+        "border": "#555555",
+        "button": "#404040",
+        "button_border": "#666666",
+        "button_hover": "#505050",
+        "accent": "#4CAF50",
+        "accent_hover": "#45a049",
+        "accent_text": "#ffffff",
+        "groove": "#404040",
+        "meter_background": "#141414",
+        "meter_inactive": "#282828",
+    },
+    # Matches the original light routing panel
+    LIGHT: {
+        "window": "#f7f7f7",
+        "text": "#000000",
+        "border": "#555555",
+        "button": "#f0f0f0",
+        "button_border": "#555555",
+        "button_hover": "#e0e0e0",
+        "accent": "#4CAF50",
+        "accent_hover": "#45a049",
+        "accent_text": "#ffffff",
+        "groove": "#c8c8c8",
+        "meter_background": "#1e1e1e",
+        "meter_inactive": "#3c3c3c",
+    },
+}
+
+_STYLESHEET = Template("""
+QWidget {
+    background-color: $window;
+    color: $text;
+    font-family: Segoe UI;
+}
+QGroupBox {
+    border: 2px solid $border;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QFrame[frameShape="4"] {
+    color: $border;
+}
+QLabel[variant="title"] {
+    font-weight: bold;
+    font-size: 16px;
+    margin: 10px;
+}
+QLabel[variant="section"] {
+    font-weight: bold;
+    font-size: 14px;
+    margin: 5px;
+}
+QLabel[variant="strip"] {
+    font-weight: bold;
+    font-size: 10px;
+}
+QLabel[variant="db"] {
+    font-weight: bold;
+}
+QLabel[variant="overlay"] {
+    background-color: rgba(0, 0, 0, 190);
+    color: #00ff00;
+    font-family: monospace;
+    font-size: 11px;
+    padding: 6px;
+    border-radius: 4px;
+}
+QPushButton[variant="route"] {
+    border: 2px solid $button_border;
+    border-radius: 4px;
+    background-color: $button;
+    font-weight: bold;
+    font-size: 11px;
+    padding: 2px;
+}
+QPushButton[variant="route"]:checked {
+    background-color: $accent;
+    color: $accent_text;
+    border-color: $accent_hover;
+}
+QPushButton[variant="route"]:hover {
+    background-color: $button_hover;
+}
+QPushButton[variant="route"]:checked:hover {
+    background-color: $accent_hover;
+}
+QSlider::groove:vertical {
+    background: $groove;
+    width: 8px;
+    border-radius: 4px;
+}
+QSlider::handle:vertical {
+    background: $accent;
+    border: 1px solid $accent_hover;
+    height: 18px;
+    margin: 0 -5px;
+    border-radius: 9px;
+}
+QSlider::handle:vertical:hover {
+    background: $accent_hover;
+}
+""")
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet(name):
+    """The compiled stylesheet of theme ``name``."""
+    return _STYLESHEET.substitute(THEMES[name])
+
+
+def meter_colors(name):
+    """``(background, inactive)`` colours for VU meters in theme ``name``."""
+    colors = THEMES[name]
+    return QtGui.QColor(colors["meter_background"]), QtGui.QColor(colors["meter_inactive"])
+
+
+def apply_theme(widget, name):
+    """Style ``widget`` and all its children with theme ``name``."""
+    if name not in THEMES:
+        raise ValueError(f"Unknown theme: {name!r}")
+    widget.setStyleSheet(stylesheet(name))
+
+
+def set_variant(widget, variant):
+    """Give ``widget`` a theme variant; call before the theme is applied."""
+    widget.setProperty("variant", variant)
+    return widget
@@ -0,0 +1,119 @@
+"""Which strips, routing outputs and buses the panels control.
+
+By default the topology is every strip and output of the Voicemeeter kind,
+with faders for its hardware output buses (A1-A5 on Potato). A JSON config
+file can narrow it down and rename strips::
+
+    {"kind": "banana", "strips": [3, 4], "names": {"3": "Music"},
+     "outputs": ["A1", "A2", "B1"], "buses": [0, 1]}
+"""
+import json
+from .constants import DEFAULT_KIND, KIND_LAYOUTS, STRIP_INDICES, STRIP_NAMES, STRIPS_PER_PAGE
+from .params import bus_keys, param_key
+from .preset_format import kind_outputs, kind_size
+
+
+def default_strip_name(kind, strip_idx):
+    """Voicemeeter's own name for a strip of ``kind``."""
+    phys_in = KIND_LAYOUTS[kind][0]
+    if strip_idx < phys_in:
+        return f"Hardware Input {strip_idx + 1}"
+    virtual = strip_idx - phys_in
+    return STRIP_NAMES[virtual] if virtual < len(STRIP_NAMES) else f"Virtual Input {strip_idx + 1}"
+
+
+class Topology:
+    """Strips (with names), routing outputs and buses of one Voicemeeter kind.
+
+    Strips are shown in pages of at most ``STRIPS_PER_PAGE``; hardware and
+    virtual inputs never share a page.
+    """
+
+    def __init__(self, kind=DEFAULT_KIND, strips=None, names=None, outputs=None, buses=None):
+        if kind not in KIND_LAYOUTS:
+            raise ValueError(f"Unknown Voicemeeter kind: {kind!r}")
+        n_strips, n_buses = kind_size(kind)
+        available = kind_outputs(kind)
+        self.kind = kind
+        self.strips = list(range(n_strips)) if strips is None else [int(idx) for idx in strips]
+        self.outputs = available if outputs is None else list(outputs)
+        phys_out = KIND_LAYOUTS[kind][2]
+        self.buses = list(range(phys_out)) if buses is None else [int(idx) for idx in buses]
+
+        for idx in self.strips:
+            if not 0 <= idx < n_strips:
+                raise ValueError(f"{kind} has no strip {idx}")
+        for idx in self.buses:
+            if not 0 <= idx < n_buses:
+                raise ValueError(f"{kind} has no bus {idx}")
+        for output in self.outputs:
+            if output not in available:
+                raise ValueError(f"{kind} has no output {output!r}")
+
+        self.names = {idx: default_strip_name(kind, idx) for idx in self.strips}
+        for idx, name in (names or {}).items():
+            if int(idx) in self.names:
+                self.names[int(idx)] = str(name)
+
+    @classmethod
+    def from_config(cls, config, kind=DEFAULT_KIND):
+        """Build a topology from a parsed config file."""
+        if not isinstance(config, dict):
+            raise ValueError("Topology config must be an object")
+        return cls(config.get("kind", kind), config.get("strips"), config.get("names"),
+                   config.get("outputs"), config.get("buses"))
+
+    def strip_name(self, strip_idx):
+        return self.names[strip_idx]
+
+    def bus_name(self, bus_idx):
+        return kind_outputs(self.kind)[bus_idx]
+
+    def param_keys(self):
+        """Every parameter key the panels read or write."""
+        names = ["gain", "mute"] + self.outputs
+        return ([param_key("strip", idx, name) for idx in self.strips for name in names]
+                + [key for idx in self.buses for key in bus_keys(idx)])
+
+    def pages(self, size=STRIPS_PER_PAGE):
+        """Strips split into pages; hardware and virtual inputs kept apart."""
+        phys_in = KIND_LAYOUTS[self.kind][0]
+        pages = []
+        for group in ([idx for idx in self.strips if idx < phys_in],
+                      [idx for idx in self.strips if idx >= phys_in]):
+            pages.extend(group[i:i + size] for i in range(0, len(group), size))
+        return pages
+
+    def page_title(self, page):
+        first, last = page[0] + 1, page[-1] + 1
+        prefix = "Hardware" if page[0] < KIND_LAYOUTS[self.kind][0] else "Virtual"
+        return f"{prefix} {first}" if first == last else f"{prefix} {first}-{last}"
+
+    def default_page(self):
+        """Index of the first page of virtual inputs, which VMControl is for."""
+        phys_in = KIND_LAYOUTS[self.kind][0]
+        for n, page in enumerate(self.pages()):
+            if page[0] >= phys_in:
+                return n
+        return 0
+
+
+def default_topology():
+    """The three virtual inputs of Voicemeeter Potato VMControl started with."""
+    return Topology(DEFAULT_KIND, STRIP_INDICES, buses=[])
+
+
+def load_topology(path, kind=DEFAULT_KIND):
+    """Topology from the config file at ``path``, or all of ``kind``.
+
+    A missing file is not an error. An invalid one is reported and ignored.
+    """
+    try:
+        with open(path) as fh:
+            config = json.load(fh)
+        return Topology.from_config(config, kind)
+    except FileNotFoundError:
+        return Topology(kind)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Invalid topology config {path}: {e}")
+        return Topology(kind)
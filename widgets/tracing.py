@@ -0,0 +1,364 @@
+"""Record every Voicemeeter API access to a compact trace, and replay it.
+
+``TracingVM`` wraps a voicemeeterlib ``Remote`` (or a ``SimulatedVM``) and
+passes everything through. It also logs each attribute read and write, and
+each method call, with its timing and values, to a ``TraceWriter``.
+``read_trace`` loads a trace back. ``replay`` runs it against another
+engine at real or accelerated speed, and ``summarize`` counts calls and
+finds reads that returned what the previous read already had.
+
+Trace file layout (all integers are unsigned LEB128 varints)::
+
+    b"VMTR" version:u8
+    record*   where record = op:u8 ...
+      DEFINE  id len utf-8      names and strings, defined before first use
+      GET     dt_us dur_us name value
+      SET     dt_us dur_us name value
+      CALL    dt_us dur_us name args:value result:value
+
+``dt_us`` is the time since the previous event's start. Values are a tag
+byte followed by the payload: none, false, true, int (zigzag varint),
+float (little-endian f64), str (string id), tuple (count, values), or
+error (string id of the exception text).
+"""
+import collections
+import re
+import struct
+import threading
+import time
+
+MAGIC = b"VMTR"
+VERSION = 1
+TRACE_SUFFIX = ".vmt"
+
+OP_DEFINE, OP_GET, OP_SET, OP_CALL = range(4)
+OP_NAMES = {OP_GET: "get", OP_SET: "set", OP_CALL: "call"}
+(TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_TUPLE, TAG_ERROR) = range(8)
+
+_FLOAT = struct.Struct("<d")
+_PATH_RE = re.compile(r"(\w+)|\[(\d+)\]")
+
+TraceEvent = collections.namedtuple("TraceEvent", "t duration op name value args")
+TraceEvent.__doc__ = """One traced access. ``t`` and ``duration`` are in seconds; ``value`` is
+the value read or written, or a call's result; ``args`` is set for calls."""
+
+
+class TracedError:
+    """A recorded exception; replay compares it by message only."""
+
+    def __init__(self, message):
+        self.message = message
+
+    def __eq__(self, other):
+        return isinstance(other, TracedError) and other.message == self.message
+
+    def __repr__(self):
+        return f"TracedError({self.message!r})"
+
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+class TraceWriter:
+    """Append events to a trace file; safe to use from several threads."""
+
+    def __init__(self, path, clock=time.perf_counter):
+        self.path = path
+        self.clock = clock
+        self._file = open(path, "wb")
+        self._file.write(MAGIC + bytes([VERSION]))
+        self._ids = {}
+        self._last_us = 0
+        self._start = clock()
+        self._lock = threading.Lock()
+        self.events = 0
+
+    def record(self, op, name, start, duration, value, args=None):
+        """Log one event; ``start`` is a ``clock()`` reading."""
+        with self._lock:
+            if self._file is None:
+                return
+            body = bytearray()
+            t_us = max(self._last_us, int((start - self._start) * 1e6))
+            body += _varint(t_us - self._last_us)
+            body += _varint(max(0, int(duration * 1e6)))
+            body += _varint(self._string_id(name))
+            if op == OP_CALL:
+                self._encode(body, args)
+            self._encode(body, value)
+            self._file.write(bytes([op]) + body)
+            self._last_us = t_us
+            self.events += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _string_id(self, text):
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._ids)
+            data = text.encode("utf-8")
+            self._file.write(bytes([OP_DEFINE]) + _varint(string_id) + _varint(len(data)) + data)
+        return string_id
+
+    def _encode(self, out, value):
+        if value is None:
+            out.append(TAG_NONE)
+        elif value is True or value is False:
+            out.append(TAG_TRUE if value else TAG_FALSE)
+        elif isinstance(value, int):
+            out.append(TAG_INT)
+            out += _varint(value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            out.append(TAG_FLOAT)
+            out += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            out.append(TAG_STR)
+            out += _varint(self._string_id(value))
+        elif isinstance(value, (tuple, list)):
+            out.append(TAG_TUPLE)
+            out += _varint(len(value))
+            for item in value:
+                self._encode(out, item)
+        elif isinstance(value, TracedError):
+            out.append(TAG_ERROR)
+            out += _varint(self._string_id(value.message))
+        else:
+            out.append(TAG_STR)
+            out += _varint(self._string_id(repr(value)))
+
+
+class _Reader:
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+        self.strings = {}
+
+    def varint(self):
+        n = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            n |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return n
+            shift += 7
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == TAG_NONE:
+            return None
+        if tag in (TAG_FALSE, TAG_TRUE):
+            return tag == TAG_TRUE
+        if tag == TAG_INT:
+            n = self.varint()
+            return n >> 1 if not n & 1 else -((n + 1) >> 1)
+        if tag == TAG_FLOAT:
+            value, = _FLOAT.unpack_from(self.data, self.pos)
+            self.pos += _FLOAT.size
+            return value
+        if tag == TAG_STR:
+            return self.strings[self.varint()]
+        if tag == TAG_TUPLE:
+            return tuple(self.value() for _ in range(self.varint()))
+        if tag == TAG_ERROR:
+            return TracedError(self.strings[self.varint()])
+        raise ValueError(f"Unknown value tag {tag} at byte {self.pos - 1}")
+
+
+def read_trace(path):
+    """Load a trace file into a list of ``TraceEvent``; raises ``ValueError``
+    if it is not a valid trace."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) <= len(MAGIC) or data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a VMControl trace")
+    if data[len(MAGIC)] != VERSION:
+        raise ValueError(f"Unsupported trace version {data[len(MAGIC)]}")
+    reader = _Reader(data)
+    reader.pos = len(MAGIC) + 1
+    events, t_us = [], 0
+    try:
+        while reader.pos < len(data):
+            op = data[reader.pos]
+            reader.pos += 1
+            if op == OP_DEFINE:
+                string_id, length = reader.varint(), reader.varint()
+                reader.strings[string_id] = data[reader.pos:reader.pos + length].decode("utf-8")
+                reader.pos += length
+                continue
+            if op not in OP_NAMES:
+                raise ValueError(f"Unknown record type {op} at byte {reader.pos - 1}")
+            t_us += reader.varint()
+            duration = reader.varint() / 1e6
+            name = reader.strings[reader.varint()]
+            args = reader.value() if op == OP_CALL else None
+            events.append(TraceEvent(t_us / 1e6, duration, OP_NAMES[op], name, reader.value(), args))
+    except (IndexError, KeyError, struct.error) as e:
+        # A trace cut short by a crash is still useful up to that point
+        print(f"Trace {path} is truncated after {len(events)} events: {e!r}")
+    return events
+
+
+_PRIMITIVES = (type(None), bool, int, float, str, tuple)
+
+
+class _TracedCall:
+    def __init__(self, writer, fn, path):
+        self._writer = writer
+        self._fn = fn
+        self._path = path
+
+    def __call__(self, *args):
+        start = self._writer.clock()
+        try:
+            result = self._fn(*args)
+        except Exception as e:
+            self._writer.record(OP_CALL, self._path, start, self._writer.clock() - start,
+                                TracedError(str(e)), args)
+            raise
+        self._writer.record(OP_CALL, self._path, start, self._writer.clock() - start,
+                            result if isinstance(result, _PRIMITIVES) else None, args)
+        return result
+
+
+class TracingVM:
+    """Pass-through proxy around ``vm`` that logs every access to ``writer``.
+
+    Reads of plain values (``strip[5].gain``, ``pdirty``, ``kind.name``),
+    writes and method calls (``get_level``, ``sendtext``...) are logged by
+    their path from the root. Sub-objects such as ``strip`` or ``kind`` are
+    wrapped in turn; reaching them is not logged.
+    """
+
+    def __init__(self, vm, writer, path=""):
+        object.__setattr__(self, "_vm", vm)
+        object.__setattr__(self, "_writer", writer)
+        object.__setattr__(self, "_path", path)
+
+    def _child(self, name):
+        return f"{self._path}.{name}" if self._path else name
+
+    def __getattr__(self, name):
+        writer = self._writer
+        path = self._child(name)
+        start = writer.clock()
+        try:
+            value = getattr(self._vm, name)
+        except AttributeError:
+            raise  # Probes like getattr(vm, "sendtext", None) are not traced
+        except Exception as e:
+            writer.record(OP_GET, path, start, writer.clock() - start, TracedError(str(e)))
+            raise
+        if isinstance(value, _PRIMITIVES):
+            writer.record(OP_GET, path, start, writer.clock() - start, value)
+            return value
+        if callable(value):
+            return _TracedCall(writer, value, path)
+        return TracingVM(value, writer, path)
+
+    def __setattr__(self, name, value):
+        writer = self._writer
+        start = writer.clock()
+        try:
+            setattr(self._vm, name, value)
+        finally:
+            writer.record(OP_SET, self._child(name), start, writer.clock() - start, value)
+
+    def __getitem__(self, index):
+        return TracingVM(self._vm[index], self._writer, f"{self._path}[{index}]")
+
+    def __len__(self):
+        return len(self._vm)
+
+
+def _resolve(vm, path):
+    """Walk ``strip[5].gain`` from ``vm``; return (parent object, last name)."""
+    parts = _PATH_RE.findall(path)
+    target = vm
+    for name, index in parts[:-1]:
+        target = getattr(target, name) if name else target[int(index)]
+    return target, parts[-1][0]
+
+
+def _same(recorded, actual):
+    if isinstance(recorded, float) and isinstance(actual, (int, float)):
+        return abs(recorded - actual) < 1e-6
+    return recorded == actual
+
+
+def replay(events, vm, speed=1.0, sleep=time.sleep, clock=time.perf_counter):
+    """Run ``events`` against ``vm``, keeping their timing scaled by ``speed``
+    (2.0 runs twice as fast; 0 runs as fast as possible).
+
+    Returns a dict with how many events ran, how many parameter reads
+    returned something other than the recording, how many raised, and the
+    wall time taken.
+    """
+    stats = {"events": 0, "mismatches": 0, "errors": 0, "wall_s": 0.0}
+    start = clock()
+    for event in events:
+        if speed > 0:
+            delay = event.t / speed - (clock() - start)
+            if delay > 0:
+                sleep(delay)
+        try:
+            target, name = _resolve(vm, event.name)
+            if event.op == "set":
+                setattr(target, name, event.value)
+                actual = event.value
+            elif event.op == "get":
+                actual = getattr(target, name)
+            else:
+                actual = getattr(target, name)(*event.args)
+        except Exception as e:
+            stats["errors"] += 1
+            actual = TracedError(str(e))
+        if event.op == "get" and not isinstance(event.value, TracedError) \
+                and not _same(event.value, actual):
+            stats["mismatches"] += 1
+        stats["events"] += 1
+    stats["wall_s"] = clock() - start
+    return stats
+
+
+def summarize(events):
+    """Call counts and time per operation, and redundant reads.
+
+    A read is redundant when it returns the same value as the previous read
+    of the same parameter with no write to it in between.
+    """
+    calls = collections.Counter()
+    time_s = collections.Counter()
+    redundant = collections.Counter()
+    last_read = {}
+    for event in events:
+        key = f"{event.op} {event.name}"
+        calls[key] += 1
+        time_s[key] += event.duration
+        if event.op == "set":
+            last_read.pop(event.name, None)
+        elif event.op == "get":
+            if event.name in last_read and _same(last_read[event.name], event.value):
+                redundant[event.name] += 1
+            last_read[event.name] = event.value
+    return {
+        "events": len(events),
+        "duration_s": events[-1].t - events[0].t if events else 0.0,
+        "calls": dict(calls.most_common()),
+        "time_ms": {key: seconds * 1000 for key, seconds in time_s.most_common()},
+        "redundant_reads": dict(redundant.most_common()),
+    }
@@ -0,0 +1,391 @@
+"""Background thread that owns every call into Voicemeeter."""
+import threading
+import time
+from collections import deque
+from PyQt5 import QtCore
+from .constants import (
+    STRIP_INDICES,
+    DIRTY_CHECK_INTERVAL_MS,
+    STORE_SYNC_HIDDEN_MS,
+    WORKER_STOP_TIMEOUT_S,
+    RECONCILE_INTERVAL_MS,
+    RECONCILE_HOLD_MS,
+    PRESET_MORPH_MS,
+    MORPH_CURVE,
+)
+from .instrumentation import INSTRUMENTS
+from .levels import LevelSnapshot, kind_name
+from .morph import Morph, Morpher
+from .params import strip_keys, bus_keys, read_params, write_param, write_params
+from .reconciler import Reconciler
+
+
+class VMWorker(QtCore.QObject):
+    """Run all Voicemeeter reads and writes on a dedicated thread.
+
+    Widgets never touch ``vm`` directly. They queue writes with ``submit``
+    or arbitrary jobs with ``call`` and receive results through queued
+    signals. Both signals are coalesced: while the GUI has not picked up the
+    previous level frame or parameter changes, newer data replaces or merges
+    into the pending slot instead of queueing another signal, so a busy GUI
+    never falls behind a backlog of stale updates.
+
+    While polling, parameters are kept in sync incrementally: the engine's
+    parameter-dirty flag is checked once per ``DIRTY_CHECK_INTERVAL_MS`` and
+    the parameters are only re-read when it is set, with just the values
+    that differ from the last known state posted to the GUI. While level
+    polling is paused the flag is still checked every ``STORE_SYNC_HIDDEN_MS``
+    so the GUI's ``StateStore`` never goes stale.
+
+    With a ``Connector`` the worker can start without ``vm``: it logs in
+    from its own loop with backoff, keeps queued commands until the engine
+    is there, treats a failing dirty check as a lost engine and, after
+    reconnecting, replays the last known state in one batch. Given a
+    ``kind``, an engine of any other kind is refused rather than driven
+    with the wrong strip and channel layout.
+
+    ``tick`` performs one iteration and can be called directly (e.g. in
+    tests) without starting the thread.
+    """
+
+    levels_ready = QtCore.pyqtSignal()
+    params_ready = QtCore.pyqtSignal()
+    job_failed = QtCore.pyqtSignal(str)
+    connection_changed = QtCore.pyqtSignal(bool)
+
+    def __init__(self, vm=None, strips=STRIP_INDICES, buses=(), dirty_interval_ms=DIRTY_CHECK_INTERVAL_MS,
+                 reconcile_interval_ms=RECONCILE_INTERVAL_MS, idle_dirty_interval_ms=STORE_SYNC_HIDDEN_MS,
+                 connector=None, kind=None):
+        super().__init__()
+        self.vm = vm
+        self.kind = kind
+        self.connector = connector
+        self.levels = LevelSnapshot(vm, strips=strips, buses=buses)
+        self.param_keys = ([key for idx in strips for key in strip_keys(idx)]
+                           + [key for idx in buses for key in bus_keys(idx)])
+        self.dirty_interval = dirty_interval_ms / 1000.0
+        self.idle_dirty_interval = idle_dirty_interval_ms / 1000.0
+        self.reconcile_interval = reconcile_interval_ms / 1000.0
+        self.reconciler = Reconciler()
+        self.morpher = Morpher()
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._commands = deque()
+        self._interval = 0.0  # Level poll interval in seconds, 0 = paused
+        self._refresh_requested = False
+        self._next_levels = 0.0
+        self._next_params = 0.0
+        self._next_reconcile = 0.0
+        self._missed_at_start = 0
+
+        # Measurement counters
+        self.dirty_checks = 0
+        self.param_reads = 0
+
+        # Last values read from or written to Voicemeeter
+        self._known = {}
+        # Coalesced hand-off slots for the GUI thread
+        self._frame = None
+        self._frame_signalled = False
+        self._pending_params = {}
+        self._params_signalled = False
+
+        self._thread = None
+        self._stopping = False
+
+    # -- GUI thread API -------------------------------------------------
+
+    def start(self):
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="VMWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread after its current iteration."""
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        self._thread.join(WORKER_STOP_TIMEOUT_S)
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_interval(self, interval_ms):
+        """Set the polling interval; 0 pauses polling until commands arrive."""
+        with self._lock:
+            self._interval = interval_ms / 1000.0
+            self._next_levels = 0.0
+            self._next_params = 0.0
+        self._wake.set()
+
+    def submit(self, key, value):
+        """Queue a parameter write; it also ends any hold on ``key``."""
+        with self._lock:
+            self._commands.append((self._write, (key, value)))
+        self._wake.set()
+
+    def apply(self, params, *args, hold_ms=RECONCILE_HOLD_MS):
+        """Write ``params`` and hold them there for ``hold_ms``.
+
+        ``params`` is a ``{key: value}`` dict, or a function called as
+        ``params(vm, *args)`` on the worker that returns one (for changes
+        that depend on the current state, like Mute All). Held values are
+        verified and corrected by the reconciler in one batched pass per
+        ``RECONCILE_INTERVAL_MS``.
+        """
+        with self._lock:
+            self._commands.append((self._apply, (params, args, hold_ms / 1000.0)))
+        self._wake.set()
+
+    def morph(self, params, duration_ms=PRESET_MORPH_MS, curve=MORPH_CURVE):
+        """Fade from the current state to ``params`` over ``duration_ms``.
+
+        Gains follow ``curve``, toggles flip at their switch points (see
+        ``widgets.morph``). Every strip is stepped in one batched write per
+        ``MORPH_INTERVAL_MS``; the final values are then held like ``apply``.
+        """
+        with self._lock:
+            self._commands.append((self._start_morph, (params, duration_ms / 1000.0, curve)))
+        self._wake.set()
+
+    def call(self, fn, *args):
+        """Queue ``fn(vm, *args)`` to run on the worker thread."""
+        with self._lock:
+            self._commands.append((fn, args))
+        self._wake.set()
+
+    def request_refresh(self):
+        """Re-read every parameter on the next iteration."""
+        with self._lock:
+            self._refresh_requested = True
+        self._wake.set()
+
+    def take_levels(self):
+        """Latest level frame (a ``(meters, channels)`` array) or ``None``."""
+        with self._lock:
+            frame, self._frame = self._frame, None
+            self._frame_signalled = False
+        return frame
+
+    def take_params(self):
+        """Parameter changes since the last call, as ``{key: value}``."""
+        with self._lock:
+            params, self._pending_params = self._pending_params, {}
+            self._params_signalled = False
+        return params
+
+    # -- Worker thread --------------------------------------------------
+
+    def _run(self):
+        while not self._stopping:
+            with INSTRUMENTS.timed("worker.tick"):
+                timeout = self.tick()
+            due = time.monotonic() + timeout if timeout is not None else None
+            if not self._wake.wait(timeout) and due is not None:
+                # Woken by the timeout: how late the next iteration starts
+                INSTRUMENTS.record("timer.worker", max(0.0, time.monotonic() - due))
+            self._wake.clear()
+
+    def tick(self, now=None):
+        """Run one iteration; return seconds until the next one is due."""
+        now = time.monotonic() if now is None else now
+        if self.vm is None and not self._connect(now):
+            return self._retry_timeout(now)
+        with self._lock:
+            commands, self._commands = self._commands, deque()
+            interval = self._interval
+            refresh = self._refresh_requested
+            self._refresh_requested = False
+
+        self._run_commands(commands)
+
+        deadlines = []
+        if self.morpher.active():
+            self._step_morph(now)
+            if self.morpher.active():
+                deadlines.append(self.morpher.next_tick)
+
+        if self.reconciler.pending():
+            if now >= self._next_reconcile:
+                self._reconcile(now)
+                self._next_reconcile = now + self.reconcile_interval
+            if self.reconciler.pending():
+                deadlines.append(self._next_reconcile)
+
+        sync = self.dirty_interval if interval > 0 else self.idle_dirty_interval
+        if interval > 0 or sync > 0:
+            if now >= self._next_params:
+                refresh = refresh or self._params_dirty(now)
+                self._next_params = now + sync
+            deadlines.append(self._next_params)
+        if self.vm is None:
+            return self._retry_timeout(now)
+        if refresh:
+            self._poll_params()
+
+        if interval > 0:
+            if now >= self._next_levels:
+                self._poll_levels()
+                self._next_levels = now + interval
+            deadlines.append(self._next_levels)
+
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _connect(self, now):
+        vm = self.connector.connect(now) if self.connector else None
+        if vm is None:
+            return False
+        engine = kind_name(vm)
+        if self.kind is not None and engine != self.kind:
+            self.connector.reject(now, f"Voicemeeter {engine.title()} is running but VMControl "
+                                       f"is set up for {self.kind.title()}")
+            return False
+        self.vm = vm
+        self.levels.attach(vm)
+        if self._known:
+            # The engine may have restarted: put back the last known state
+            try:
+                write_params(vm, self._known)
+            except Exception as e:
+                print(f"Error restoring Voicemeeter state: {e}")
+        with self._lock:
+            self._refresh_requested = True
+        self._next_params = 0.0
+        self.connection_changed.emit(True)
+        return True
+
+    def _disconnect(self, now):
+        if self.connector is None:
+            return
+        self.connector.lost(now)
+        self.vm = None
+        self.levels.vm = None
+        self.connection_changed.emit(False)
+
+    def _retry_timeout(self, now):
+        if self.connector is None:
+            return None
+        return max(0.0, self.connector.next_attempt - now)
+
+    def _run_commands(self, commands):
+        for fn, args in commands:
+            try:
+                if getattr(fn, "__self__", None) is self:
+                    fn(*args)
+                else:
+                    fn(self.vm, *args)
+            except Exception as e:
+                print(f"Voicemeeter command failed: {e}")
+                self.job_failed.emit(str(e))
+
+    def _write(self, key, value):
+        self.reconciler.release(key)
+        self.morpher.release(key)
+        write_param(self.vm, key, value)
+        self._known[key] = value
+
+    def _apply(self, params, args, hold_s):
+        if callable(params):
+            params = params(self.vm, *args)
+        # One script call for the whole batch; the reconciler verifies it
+        for key in params:
+            self.morpher.release(key)
+        write_params(self.vm, params)
+        deadline = time.monotonic() + hold_s
+        for key, value in params.items():
+            self.reconciler.hold(key, value, deadline)
+        self._next_reconcile = time.monotonic() + self.reconcile_interval
+        self._report(params)
+
+    def _start_morph(self, params, duration, curve):
+        start = read_params(self.vm, params)
+        for key in params:
+            self.reconciler.release(key)
+        self._missed_at_start = self.morpher.missed
+        self.morpher.start(Morph(start, params, duration, time.monotonic(), curve))
+
+    def _step_morph(self, now):
+        values, finished = self.morpher.tick(now)
+        try:
+            write_params(self.vm, values)
+        except Exception as e:
+            print(f"Error writing morph step: {e}")
+        self._report(values)
+        if finished is None:
+            return
+        deadline = now + RECONCILE_HOLD_MS / 1000.0
+        for key, value in finished.items():
+            self.reconciler.hold(key, value, deadline)
+        missed = self.morpher.missed - self._missed_at_start
+        if missed:
+            print(f"Preset morph missed {missed} ticks")
+
+    def _reconcile(self, now):
+        try:
+            held = self.reconciler.reconcile(self.vm, now)
+        except Exception as e:
+            print(f"Error reconciling Voicemeeter parameters: {e}")
+            return
+        self._report(held)
+
+    def _report(self, values):
+        """Tell the GUI about values that differ from what it last saw."""
+        changed = {key: value for key, value in values.items()
+                   if self._known.get(key) != value}
+        self._known.update(changed)
+        self.post_params(changed)
+
+    def _params_dirty(self, now):
+        """Check the engine's parameter-dirty flag (one API call)."""
+        self.dirty_checks += 1
+        try:
+            with INSTRUMENTS.timed("vm.pdirty"):
+                return bool(self.vm.pdirty)
+        except AttributeError:
+            return True  # No dirty flag available: fall back to polling
+        except Exception as e:
+            print(f"Error checking Voicemeeter dirty flag: {e}")
+            self._disconnect(now)
+            return False
+
+    def _poll_params(self):
+        self.param_reads += 1
+        try:
+            values = read_params(self.vm, self.param_keys)
+        except Exception as e:
+            print(f"Error reading Voicemeeter parameters: {e}")
+            return
+        # Held values win over whatever Voicemeeter reported mid-correction
+        values.update(self.reconciler.targets())
+        self._report(values)
+
+    def post_params(self, changed):
+        """Merge ``changed`` into the pending GUI update and signal once."""
+        if not changed:
+            return
+        with self._lock:
+            self._pending_params.update(changed)
+            signal = not self._params_signalled
+            self._params_signalled = True
+        if signal:
+            self.params_ready.emit()
+
+    def _poll_levels(self):
+        frame = self.levels.refresh().copy()
+        with self._lock:
+            if self._frame is not None:
+                # The GUI never drew the previous frame
+                INSTRUMENTS.count("vu.dropped_frames")
+            self._frame = frame
+            signal = not self._frame_signalled
+            self._frame_signalled = True
+        if signal:
+            self.levels_ready.emit()
@@ -0,0 +1,176 @@
+"""Segmented VU meter drawn from cached pixmaps."""
+from PyQt5 import QtWidgets, QtCore, QtGui
+from .constants import LEVEL_MIN_DB, LEVEL_MAX_DB
+from .instrumentation import INSTRUMENTS
+
+SEGMENT_HEIGHT = 3
+SEGMENT_GAP = 1
+SEGMENT_PITCH = SEGMENT_HEIGHT + SEGMENT_GAP
+BAR_GAP = 1
+CLIP_RECT_Y = 1
+CLIP_RECT_HEIGHT = 4
+
+RED = QtGui.QColor(255, 0, 0)        # > 0dB
+YELLOW = QtGui.QColor(255, 255, 0)   # -12dB to 0dB
+GREEN = QtGui.QColor(0, 255, 0)      # < -12dB
+
+# (width, height, channels, background rgb, inactive rgb) -> (unlit, lit) pixmaps
+_PIXMAP_CACHE = {}
+
+
+def _segment_color(i, segments):
+    segment_db = LEVEL_MIN_DB + (i / segments) * (LEVEL_MAX_DB - LEVEL_MIN_DB)
+    if segment_db > 0:
+        return RED
+    if segment_db > -12:
+        return YELLOW
+    return GREEN
+
+
+def bar_geometry(width, channels):
+    """(x, width) of each channel bar inside a meter ``width`` pixels wide."""
+    bar_width = max(1, (width - 4 - (channels - 1) * BAR_GAP) // channels)
+    return [(2 + c * (bar_width + BAR_GAP), bar_width) for c in range(channels)]
+
+
+def _render_bars(width, height, channels, background, segment_color, clip_color):
+    """Render a full meter with every segment drawn by ``segment_color(i)``."""
+    pixmap = QtGui.QPixmap(width, height)
+    pixmap.fill(background)
+    painter = QtGui.QPainter(pixmap)
+    segments = (height - 10) // SEGMENT_PITCH
+    for x, bar_width in bar_geometry(width, channels):
+        painter.fillRect(x, CLIP_RECT_Y, bar_width, CLIP_RECT_HEIGHT, clip_color)
+        for i in range(segments):
+            y_pos = height - 5 - i * SEGMENT_PITCH
+            painter.fillRect(x, y_pos, bar_width, SEGMENT_HEIGHT, segment_color(i, segments))
+    painter.end()
+    return pixmap
+
+
+def meter_pixmaps(width, height, background, inactive, channels=1):
+    """Unlit and lit bars for a meter size and colour scheme, rendered once."""
+    key = (width, height, channels, background.rgb(), inactive.rgb())
+    pixmaps = _PIXMAP_CACHE.get(key)
+    if pixmaps is None:
+        unlit = _render_bars(width, height, channels, background,
+                             lambda i, n: inactive, background)
+        lit = _render_bars(width, height, channels, background, _segment_color, RED)
+        pixmaps = _PIXMAP_CACHE[key] = (unlit, lit)
+    return pixmaps
+
+
+class VUMeter(QtWidgets.QWidget):
+    """Vertical segmented level meter with one bar per channel.
+
+    The lit and unlit bars are pre-rendered per size and colour scheme;
+    painting only blits rectangles out of them, and level changes only
+    invalidate the segments that actually changed. Each bar can also show a
+    held peak segment and a latched clip indicator above the bar.
+    """
+
+    clicked = QtCore.pyqtSignal()
+
+    def __init__(self, background=QtGui.QColor(20, 20, 20), inactive=QtGui.QColor(40, 40, 40), channels=1):
+        super().__init__()
+        self.channels = channels
+        self.level = LEVEL_MIN_DB  # dB level of the loudest channel
+        self._levels = [LEVEL_MIN_DB] * channels
+        self._peaks = [LEVEL_MIN_DB] * channels
+        self.lit_segments = [0] * channels
+        self.peak_segments = [0] * channels
+        self.clipped = [False] * channels
+        self.background = QtGui.QColor(background)
+        self.inactive = QtGui.QColor(inactive)
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent)
+        self.setMinimumSize(20, 150)
+
+    def set_colors(self, background, inactive):
+        """Switch colour scheme; the matching pixmaps are cached separately."""
+        self.background = QtGui.QColor(background)
+        self.inactive = QtGui.QColor(inactive)
+        self.update()
+
+    def segment_count(self):
+        return max(0, (self.height() - 10) // SEGMENT_PITCH)
+
+    def _lit_for(self, db_level):
+        """Number of lit segments for a level, matching the segment layout."""
+        meter_height = self.height() - 10
+        db_level = max(LEVEL_MIN_DB, min(LEVEL_MAX_DB, db_level))
+        level_ratio = (db_level - LEVEL_MIN_DB) / (LEVEL_MAX_DB - LEVEL_MIN_DB)
+        level_height = int(level_ratio * meter_height)
+        # Segment i is lit while i * pitch < level_height
+        lit = -(-level_height // SEGMENT_PITCH) if level_height > 0 else 0
+        return min(lit, self.segment_count())
+
+    def _split_y(self, lit):
+        """Y coordinate separating unlit (above) from lit (below) rows."""
+        return self.height() - 1 - lit * SEGMENT_PITCH
+
+    def _segment_rect(self, x, bar_width, segment):
+        """Rect of 1-based ``segment`` (0 means none) within a bar."""
+        return QtCore.QRect(x, self._split_y(segment), bar_width, SEGMENT_PITCH)
+
+    def update_level(self, db_level):
+        """Show the same level on every channel"""
+        self.update_levels([db_level] * self.channels)
+
+    def update_levels(self, levels, peaks=None, clipped=None):
+        """Update per-channel levels, repainting only changed segments"""
+        self.level = max(LEVEL_MIN_DB, min(LEVEL_MAX_DB, max(levels)))
+        self._levels = [float(level) for level in levels]
+        self._peaks = [float(peak) for peak in peaks] if peaks is not None else [LEVEL_MIN_DB] * self.channels
+        for c, (x, bar_width) in enumerate(bar_geometry(self.width(), self.channels)):
+            lit = self._lit_for(levels[c])
+            if lit != self.lit_segments[c]:
+                top = self._split_y(max(lit, self.lit_segments[c]))
+                bottom = self._split_y(min(lit, self.lit_segments[c]))
+                self.lit_segments[c] = lit
+                self.update(x, top, bar_width, bottom - top)
+
+            peak = self._lit_for(self._peaks[c])
+            if peak != self.peak_segments[c]:
+                self.update(self._segment_rect(x, bar_width, self.peak_segments[c]))
+                self.update(self._segment_rect(x, bar_width, peak))
+                self.peak_segments[c] = peak
+
+            clip = bool(clipped[c]) if clipped is not None else False
+            if clip != self.clipped[c]:
+                self.clipped[c] = clip
+                self.update(x, CLIP_RECT_Y, bar_width, CLIP_RECT_HEIGHT)
+
+    def resizeEvent(self, event):
+        self.lit_segments = [self._lit_for(level) for level in self._levels]
+        self.peak_segments = [self._lit_for(peak) for peak in self._peaks]
+        super().resizeEvent(event)
+
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event):
+        with INSTRUMENTS.timed("vu.paint"):
+            self._paint(event)
+
+    def _paint(self, event):
+        """Blit the cached bars, restricted to the invalidated region"""
+        unlit, lit = meter_pixmaps(self.width(), self.height(), self.background,
+                                   self.inactive, self.channels)
+        painter = QtGui.QPainter(self)
+        dirty = event.rect()
+        painter.drawPixmap(dirty, unlit, dirty)
+
+        for c, (x, bar_width) in enumerate(bar_geometry(self.width(), self.channels)):
+            split = self._split_y(self.lit_segments[c])
+            lit_rect = dirty.intersected(QtCore.QRect(x, split, bar_width, self.height() - split))
+            if not lit_rect.isEmpty():
+                painter.drawPixmap(lit_rect, lit, lit_rect)
+            if self.peak_segments[c] > self.lit_segments[c]:
+                peak_rect = dirty.intersected(self._segment_rect(x, bar_width, self.peak_segments[c]))
+                if not peak_rect.isEmpty():
+                    painter.drawPixmap(peak_rect, lit, peak_rect)
+            if self.clipped[c]:
+                clip_rect = dirty.intersected(QtCore.QRect(x, CLIP_RECT_Y, bar_width, CLIP_RECT_HEIGHT))
+                if not clip_rect.isEmpty():
+                    painter.drawPixmap(clip_rect, lit, clip_rect)
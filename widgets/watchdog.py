@@ -0,0 +1,122 @@
+"""Watchdog for stalls of the Qt event loop."""
+import logging
+import logging.handlers
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from PyQt5 import QtCore
+from .constants import STALL_HEARTBEAT_MS, STALL_THRESHOLD_MS, STALL_LOG_MAX_BYTES, STALL_LOG_BACKUPS
+from .instrumentation import INSTRUMENTS
+
+
+class StallWatchdog(QtCore.QObject):
+    """Detect and log freezes of the GUI thread.
+
+    A ``QTimer`` on the GUI thread beats every ``heartbeat_ms``. A daemon
+    thread checks the beats; once one is ``threshold_ms`` late it captures
+    the GUI thread's Python stack and the operations in flight (see
+    ``operation``), and when the beats resume it logs the stall with its
+    full duration. Stalls go to ``stalls`` and, if ``log_path`` is set, to
+    a rotating log file. Construct it on the GUI thread.
+    """
+
+    def __init__(self, log_path=None, threshold_ms=STALL_THRESHOLD_MS, heartbeat_ms=STALL_HEARTBEAT_MS,
+                 clock=time.monotonic, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.check_interval = heartbeat_ms / 1000.0
+        self.clock = clock
+        self.stalls = []
+        self.logger = logging.Logger("vmcontrol.watchdog")
+        if log_path:
+            handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=STALL_LOG_MAX_BYTES, backupCount=STALL_LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self.logger.addHandler(handler)
+
+        self._gui_thread = threading.get_ident()
+        self._operations = []
+        self._lock = threading.Lock()
+        self._last_beat = clock()
+        self._stall = None
+        self._thread = None
+        self._stop = threading.Event()
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(heartbeat_ms)
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._last_beat = self.clock()
+        self.timer.start()
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.timer.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for handler in self.logger.handlers[:]:
+            handler.close()
+            self.logger.removeHandler(handler)
+
+    @contextmanager
+    def operation(self, name):
+        """Name what the GUI thread is doing, for any stall inside the block."""
+        self._operations.append(name)
+        try:
+            yield
+        finally:
+            self._operations.pop()
+
+    def beat(self):
+        """Heartbeat from the GUI thread; ends a stall in progress."""
+        now = self.clock()
+        with self._lock:
+            self._last_beat = now
+            stall, self._stall = self._stall, None
+        if stall is not None:
+            stall["duration_ms"] = (now - stall["started"]) * 1000
+            self._report(stall)
+
+    def check(self):
+        """Capture the GUI thread if its heartbeat is overdue; return True if
+        a new stall was found. Runs on the watchdog thread."""
+        now = self.clock()
+        with self._lock:
+            if self._stall is not None or now - self._last_beat <= self.threshold:
+                return False
+            self._stall = stall = {
+                "started": self._last_beat,
+                "operation": " > ".join(self._operations) or "unknown",
+                "stack": self._gui_stack(),
+            }
+        self.logger.warning(f"GUI stalled for {(now - stall['started']) * 1000:.0f} ms so far "
+                            f"in {stall['operation']}\n{stall['stack']}")
+        return True
+
+    def _gui_stack(self):
+        frame = sys._current_frames().get(self._gui_thread)
+        return "".join(traceback.format_stack(frame)) if frame is not None else ""
+
+    def _report(self, stall):
+        self.stalls.append(stall)
+        INSTRUMENTS.record("gui.stall", stall["duration_ms"] / 1000)
+        self.logger.warning(f"GUI stall of {stall['duration_ms']:.0f} ms in {stall['operation']}")
+
+    def _watch(self):
+        last_check = self.clock()
+        while not self._stop.wait(self.check_interval):
+            now = self.clock()
+            if now - last_check > self.threshold:
+                # The watchdog itself did not run (e.g. system sleep): not a stall
+                with self._lock:
+                    self._last_beat = now
+            last_check = now
+            self.check()
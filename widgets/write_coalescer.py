@@ -0,0 +1,51 @@
+"""Coalesce rapid parameter writes into at most one flush per frame."""
+from PyQt5 import QtCore
+from .constants import WRITE_COALESCE_MS
+from .instrumentation import INSTRUMENTS
+
+
+class WriteCoalescer(QtCore.QObject):
+    """Keep only the latest pending value per parameter key.
+
+    ``set`` records a value and arms a single-shot frame timer; when it
+    fires every pending key is handed to ``write(key, value)`` once. A slider
+    drag that emits dozens of ``valueChanged`` signals therefore costs one
+    write per frame, and ``flush`` (connected to ``sliderReleased``) makes
+    sure the final value is always written immediately.
+    """
+
+    def __init__(self, write, interval_ms=WRITE_COALESCE_MS, parent=None):
+        super().__init__(parent)
+        self.write = write
+        self._pending = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        INSTRUMENTS.count_fires(self._timer, "timer.write_flush")
+
+        # Measurement counters
+        self.requested = 0
+        self.written = 0
+
+    def set(self, key, value):
+        """Record ``value`` for ``key``, replacing any unflushed value."""
+        self.requested += 1
+        self._pending[key] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self, key):
+        """Drop an unflushed value, e.g. when another action overrides it."""
+        self._pending.pop(key, None)
+
+    def pending(self):
+        return dict(self._pending)
+
+    def flush(self):
+        """Write every pending value now."""
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self.write(key, value)
+        self.written += len(pending)